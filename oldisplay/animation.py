@@ -0,0 +1,293 @@
+"""Tools to animate components
+
+About:
+    An animator is a component of the window advancing all its tweens at once
+    before components are displayed: start values, deltas, times and easings
+    of tweens are stored in arrays so that each frame costs one vectorized
+    step whatever the number of tweens. Only components whose (rounded) value
+    changed since last frame are then modified.
+
+    Channels of components that can be animated:
+        ref_pos : reference position of located components
+        size    : size of located components
+        color   : color of shapes, in each state (normal, hovered, clicked)
+            with a look of its own (copy of look parameters is made so that
+            components sharing a look are not animated together)
+        alpha   : opacity of groups and images
+
+    Rows of numpy arrays (positions of a batch component, ...) can be animated
+    the same way (@see Animator.animate_rows).
+
+Examples:
+    >>> animator = Animator()
+    >>> window.components.insert(0, animator)
+    >>> animator.animate(button, 500, ref_pos=(300, 200), easing="out_cubic")
+    >>> animator.animate(legend, 200, alpha=0)
+"""
+import numpy as np
+import pygame as pg
+
+from oldisplay.collections import Color
+from oldisplay.components.component import Component
+
+
+def _in_out(func):
+    """Return symmetric easing from an ease-in function"""
+    def easing(t):
+        return np.where(t < 0.5, func(2 * t) / 2, 1 - func(2 - 2 * t) / 2)
+    return easing
+
+
+EASINGS = {
+    'linear': lambda t: t,
+    'in_quad': lambda t: t * t,
+    'out_quad': lambda t: t * (2 - t),
+    'in_out_quad': _in_out(lambda t: t * t),
+    'in_cubic': lambda t: t ** 3,
+    'out_cubic': lambda t: 1 - (1 - t) ** 3,
+    'in_out_cubic': _in_out(lambda t: t ** 3),
+    'in_out_sine': lambda t: (1 - np.cos(np.pi * t)) / 2,
+}
+EASING_NAMES = list(EASINGS)
+
+ROWS = "rows"
+CHANNELS = {
+    # name: (number of values, values are rounded to int)
+    'ref_pos': (2, True),
+    'size': (2, True),
+    'color': (3, True),
+    'alpha': (1, True),
+    ROWS: (None, False),
+}
+CHANNEL_NAMES = list(CHANNELS)
+CHANNELS_ROUNDED = np.array([CHANNELS[name][1] for name in CHANNEL_NAMES])
+STATES = ['_params', '_params_h', '_params_c']  # look of each state of shapes
+
+
+class Animator(Component):
+    """Component advancing tweens of components before their display"""
+
+    clock = staticmethod(pg.time.get_ticks)  # current time in ms
+
+    def __init__(self, capacity=64, width=4, **kwargs):
+        """Initialize an animator
+
+        Args:
+            capacity (int)  : initial number of tweens stored, grows as needed
+            width (int)     : maximum number of values of a tween (4 handles
+                any channel, rows are then limited to 4 columns)
+        """
+        super().__init__(**kwargs)
+        self.width = width
+        self._start = np.zeros((capacity, width))
+        self._delta = np.zeros((capacity, width))
+        self._last = np.zeros((capacity, width))  # last applied values
+        self._t0 = np.zeros(capacity)
+        self._duration = np.ones(capacity)
+        self._easing = np.zeros(capacity, dtype=int)
+        self._channel = np.zeros(capacity, dtype=int)
+        self._dims = np.zeros(capacity, dtype=int)
+        self._alive = np.zeros(capacity, dtype=bool)
+
+        self._targets = [None] * capacity  # component or array of tweens
+        self._slots = {}  # (id(target), channel, row): slot of tween
+
+    # ----------------------------------------------------------------------- #
+    # Tweens
+
+    @property
+    def active(self):
+        """Whether any tween is running (render loop can idle otherwise)"""
+        return bool(self._alive.any())
+
+    def __len__(self):
+        return int(self._alive.sum())
+
+    def _grow(self):
+        """Double capacity of tween arrays"""
+        capacity = len(self._alive)
+        for name in ("_start", "_delta", "_last", "_t0", "_duration",
+                     "_easing", "_channel", "_dims", "_alive"):
+            array = getattr(self, name)
+            grown = np.zeros((2 * capacity, *array.shape[1:]), array.dtype)
+            grown[:capacity] = array
+            setattr(self, name, grown)
+        self._targets.extend([None] * capacity)
+
+    def _slot(self, key):
+        """Return slot of tween identified by key, replacing running one"""
+        slot = self._slots.get(key)
+        if slot is not None and self._alive[slot]:
+            return slot  # running tween of same target and channel
+        free = np.flatnonzero(~self._alive)
+        if not len(free):
+            self._grow()
+            free = np.flatnonzero(~self._alive)
+        slot = int(free[0])
+        self._slots[key] = slot
+        return slot
+
+    def _add(self, target, channel, row, start, end, duration, easing, delay):
+        """Store a tween"""
+        if easing not in EASINGS:
+            raise ValueError(
+                f"Unknown easing '{easing}', must be within {EASING_NAMES}"
+            )
+        start = np.asarray(start, dtype=float).ravel()
+        end = np.asarray(end, dtype=float).ravel()
+        dims = len(start)
+        if dims > self.width or end.shape != start.shape:
+            raise ValueError(
+                f"Can't animate {dims} values from {start} to {end}"
+            )
+        slot = self._slot((id(target), channel, row))
+        self._start[slot] = self._delta[slot] = self._last[slot] = 0
+        self._start[slot, :dims] = start
+        self._delta[slot, :dims] = end - start
+        self._last[slot, :dims] = start
+        self._t0[slot] = self.clock() + delay
+        self._duration[slot] = max(duration, 1)
+        self._easing[slot] = EASING_NAMES.index(easing)
+        self._channel[slot] = CHANNEL_NAMES.index(channel)
+        self._dims[slot] = dims
+        self._alive[slot] = True
+        self._targets[slot] = (target, row)
+
+    def animate(self, component, duration, easing="linear", delay=0,
+                **channels):
+        """Animate channels of component from their current values
+
+        Args:
+            component (Component)   : component to animate
+            duration (int)          : duration of animation in ms
+            easing (str)            : easing function (@see EASINGS)
+            delay (int)             : delay before animation starts in ms
+            **channels              : end value of each animated channel
+                'ref_pos', 'size', 'color' or 'alpha'
+                a running animation of a channel is replaced
+        """
+        for channel, end in channels.items():
+            if channel == "ref_pos":
+                start = component.ref_pos
+            elif channel == "size":
+                start = component.size
+            elif channel == "color":
+                end = Color.get(end)
+                for state in STATES:
+                    params = getattr(component, state, None)
+                    if params is None or params.get('color') is None:
+                        continue
+                    setattr(component, state, dict(params))
+                    self._add(
+                        component, channel, state, params['color'], end,
+                        duration, easing, delay,
+                    )
+                continue
+            elif channel == "alpha":
+                start = component.alpha
+            else:
+                raise ValueError(
+                    f"Unknown channel '{channel}', must be within"
+                    f" {CHANNEL_NAMES[:-1]}"
+                )
+            self._add(
+                component, channel, None, start, end, duration, easing, delay
+            )
+
+    def animate_rows(self, array, rows, end, duration, easing="linear",
+                     delay=0):
+        """Animate rows of a 2d array from their current values
+
+        Args:
+            array (numpy.ndarray)   : array to write values in
+            rows (list[int])        : rows of array to animate
+            end (array-like)        : (len(rows), array.shape[1]) end values
+            duration (int)          : duration of animation in ms
+            easing (str)            : easing function (@see EASINGS)
+            delay (int)             : delay before animation starts in ms
+        """
+        end = np.broadcast_to(end, (len(rows), array.shape[1]))
+        for row, values in zip(rows, end):
+            self._add(
+                array, ROWS, int(row), array[row], values, duration, easing,
+                delay,
+            )
+
+    def cancel(self, target):
+        """Stop animations of component or array, leaving current values"""
+        self._free([
+            slot for slot in np.flatnonzero(self._alive)
+            if self._targets[slot][0] is target
+        ])
+
+    def _free(self, slots):
+        """Remove tweens of slots"""
+        for slot in slots:
+            target, row = self._targets[slot]
+            channel = CHANNEL_NAMES[self._channel[slot]]
+            del self._slots[(id(target), channel, row)]
+            self._alive[slot] = False
+            self._targets[slot] = None
+
+    # ----------------------------------------------------------------------- #
+    # Step
+
+    def step(self, now=None):
+        """Advance all tweens to time now and apply their values
+
+        Return:
+            (int): number of tweens still running
+        """
+        now = self.clock() if now is None else now
+        slots = np.flatnonzero(self._alive & (self._t0 <= now))
+        if not len(slots):
+            return len(self)
+
+        t = np.minimum((now - self._t0[slots]) / self._duration[slots], 1)
+        eased = np.empty_like(t)
+        easings = self._easing[slots]
+        for index in np.unique(easings):
+            mask = easings == index
+            eased[mask] = EASINGS[EASING_NAMES[index]](t[mask])
+        values = self._start[slots] + self._delta[slots] * eased[:, None]
+
+        rounded = CHANNELS_ROUNDED[self._channel[slots]]
+        values[rounded] = np.rint(values[rounded])
+        changed = (values != self._last[slots]).any(axis=1)
+        self._last[slots] = values
+        self.apply(slots[changed], values[changed])
+
+        self._free(slots[t >= 1])
+        return len(self)
+
+    def apply(self, slots, values):
+        """Write values of tweens in their target"""
+        arrays = {}
+        for slot, value, channel, dims in zip(
+                slots.tolist(), values, self._channel[slots].tolist(),
+                self._dims[slots].tolist()):
+            target, row = self._targets[slot]
+            channel = CHANNEL_NAMES[channel]
+            if channel == ROWS:
+                arrays.setdefault(id(target), (target, [], []))
+                arrays[id(target)][1].append(row)
+                arrays[id(target)][2].append(value[:dims])
+                continue
+            value = value[:dims].astype(int).tolist()
+            if channel == "ref_pos":
+                target.ref_pos = tuple(value)
+            elif channel == "size":
+                target.size = tuple(value)
+            elif channel == "color":
+                getattr(target, row)['color'] = Color(*value)
+                target.invalidate()
+            elif channel == "alpha":
+                target.alpha = value[0]
+
+        # Rows of the same array are written at once
+        for target, rows, row_values in arrays.values():
+            target[rows] = row_values
+
+    def update(self, surface, events=None):
+        """Advance animations"""
+        self.step()
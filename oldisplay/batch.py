@@ -0,0 +1,130 @@
+"""Tools to render many scenes offscreen in parallel
+
+About:
+    Scenes (@see oldisplay.scene for their description) are compiled once in
+    the calling process, font sizing included, then rendered by a pool of
+    worker processes running pygame without display. Each worker keeps its
+    caches (fonts, glyphs, images, ...) warm from one scene to the other.
+
+Examples:
+    >>> scenes = [
+    ...     {"components": [{"type": "Text", "string": f"#{i}", ...}]}
+    ...     for i in range(1000)
+    ... ]
+    >>> paths = render_batch(scenes, (128, 128), output="thumbnails")
+"""
+import json
+import multiprocessing
+import os
+
+import numpy as np
+import pygame as pg
+
+from oldisplay import draw
+from oldisplay.collections import Color, FontManager
+from oldisplay.scene import build, compile_scene, load_compiled
+
+
+def compile_item(scene, root=""):
+    """Compile a scene description
+
+    Args:
+        scene (str|dict): path to json scene file or content of scene
+        root (str)      : directory relative paths of a content start from
+
+    Return:
+        (dict): compiled scene (@see oldisplay.scene.compile_scene)
+    """
+    if isinstance(scene, dict):
+        return compile_scene(json.dumps(scene), root=root)
+    return load_compiled(scene)
+
+
+def render(compiled, size, background="white"):
+    """Render compiled scene on a new surface
+
+    Args:
+        compiled (dict)         : compiled scene
+        size (2-int-tuple)      : size of surface
+        background (color)      : color of background
+
+    Return:
+        (pygame.Surface): rendered scene
+    """
+    FontManager.font_sizing_cache.update(compiled['fonts'])
+    surface = pg.Surface(size)
+    draw.fill(surface, Color.get(background))
+    components = [build(spec) for spec in compiled['components']]
+    for component in components:
+        component.init(surface)
+    for component in components:
+        component.update(surface)
+    return surface
+
+
+def to_array(surface):
+    """Return (height, width, 3) uint8 array of surface pixels"""
+    return np.ascontiguousarray(pg.surfarray.array3d(surface).swapaxes(0, 1))
+
+
+# --------------------------------------------------------------------------- #
+# Workers
+
+def _init_worker():
+    """Initialize pygame without display in a worker process"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pg.font.init()
+
+
+def _render_task(task):
+    """Render a scene of batch, return array or path of file written"""
+    compiled, size, background, path = task
+    surface = render(compiled, size, background)
+    if path is None:
+        return to_array(surface)
+    pg.image.save(surface, path)
+    return path
+
+
+def render_batch(scenes, size, background="white", output=None, fmt="png",
+                 processes=None, root=""):
+    """Render scenes in a pool of worker processes
+
+    Args:
+        scenes (list)           : scene descriptions, path to json scene
+            files or content of scenes (dict)
+        size (2-int-tuple)      : size of images in pixels
+        background (color)      : color of background
+        output (str)            : directory to write images in
+            default is None, images are returned as arrays
+        fmt (str)               : format of images written ('png', 'jpg', ...)
+        processes (int)         : number of worker processes
+            default is number of cpus
+        root (str)              : directory relative paths of scene contents
+            start from
+
+    Return:
+        (list): (height, width, 3) uint8 arrays or paths of images written,
+            in order of scenes
+    """
+    if not pg.font.get_init():
+        pg.font.init()
+    compiled = [compile_item(scene, root=root) for scene in scenes]
+    if output is not None:
+        os.makedirs(output, exist_ok=True)
+    tasks = [
+        (
+            item, size, background,
+            None if output is None else os.path.join(output, f"{i:06d}.{fmt}"),
+        )
+        for i, item in enumerate(compiled)
+    ]
+    if not tasks:
+        return []
+
+    processes = min(processes or os.cpu_count() or 1, len(tasks))
+    chunksize = max(1, len(tasks) // (4 * processes))
+    context = multiprocessing.get_context("spawn")  # no pygame state shared
+    with context.Pool(processes, initializer=_init_worker) as pool:
+        return pool.map(_render_task, tasks, chunksize=chunksize)
@@ -0,0 +1,267 @@
+"""Tools to account and bound memory used by caches
+
+About:
+    Caches of the package (fonts, glyphs, rendered texts, tiles, images, ...)
+    are Cache objects registered in a central registry, which reports their
+    number of entries, estimated size in bytes and hit / miss statistics.
+
+    Each cache has its own eviction policy:
+        'lru'   : least recently used entries are evicted first
+        'ttl'   : entries not used for ttl seconds are evicted, then oldest
+        None    : entries are never evicted (cheap, bounded caches)
+    and can be bounded in number of entries. A global budget in bytes is
+    enforced by the registry (@see CacheRegistry.enforce), evicting entries
+    of the biggest caches first.
+
+Examples:
+    >>> from oldisplay.caches import registry
+    >>> registry.budget = 64 * 2**20
+    >>> registry.watch(window)
+    >>> registry.report()
+    {'fonts': {'instances': 1, 'entries': 3, 'bytes': 196608, 'hits': ...
+"""
+import heapq
+import sys
+import time
+import weakref
+from collections import OrderedDict
+
+import pygame as pg
+
+FONT_BYTES = 64 * 1024  # rough memory used by a loaded font
+POLICIES = ["lru", "ttl", None]
+
+
+def estimate_size(value):
+    """Estimated number of bytes used by value"""
+    if isinstance(value, pg.Surface):
+        return value.get_pitch() * value.get_height()
+    if isinstance(value, pg.font.Font):
+        return FONT_BYTES
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(item) for item in value.values())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+class Cache(OrderedDict):
+    """Dictionary with statistics and eviction, registered in registry
+
+    About:
+        Failed lookups (cache[key] raising KeyError, cache.get returning
+        default) are counted as misses, other lookups as hits.
+    """
+
+    def __init__(self, name, policy="lru", ttl=None, max_entries=None,
+                 sizeof=estimate_size, register=True):
+        """Initialize a cache
+
+        Args:
+            name (str)          : name of cache, caches of the same kind
+                (caches of different instances of a component) share name
+            policy (str)        : eviction policy, 'lru', 'ttl' or None
+            ttl (float)         : time in seconds an entry is kept without
+                being used ('ttl' policy)
+            max_entries (int)   : maximum number of entries
+            sizeof (callable)   : estimate size in bytes of an entry value
+            register (bool)     : register cache in registry
+        """
+        super().__init__()
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be within {POLICIES}, got {policy}")
+        assert policy != "ttl" or ttl is not None, "ttl policy requires ttl"
+        self.name = name
+        self.policy = policy
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._used = {}  # key: time of last use ('ttl' policy)
+        if register:
+            registry.register(self)
+
+    def __getitem__(self, key):
+        try:
+            value = super().__getitem__(key)
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        if self.policy == "lru":
+            self.move_to_end(key)
+        elif self.policy == "ttl":
+            self._used[key] = time.monotonic()
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if self.policy == "ttl":
+            self._used[key] = time.monotonic()
+        if self.max_entries is not None and len(self) > self.max_entries:
+            self.evict(len(self) - self.max_entries)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._used.pop(key, None)
+
+    def clear(self):
+        super().clear()
+        self._used.clear()
+
+    # ----------------------------------------------------------------------- #
+    # Accounting
+
+    @property
+    def nbytes(self):
+        """Estimated number of bytes used by entries"""
+        sizeof = self.sizeof
+        return sum(sizeof(value) for value in self.values())
+
+    def stats(self):
+        """Statistics of cache (dict)"""
+        return {
+            'entries': len(self),
+            'bytes': self.nbytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    # ----------------------------------------------------------------------- #
+    # Eviction
+
+    @property
+    def evictable(self):
+        """Whether entries can be evicted to respect memory budget"""
+        return self.policy is not None
+
+    def evict(self, count=1):
+        """Evict count entries, least recently used / oldest first
+
+        Return:
+            (int): number of bytes freed (estimated)
+        """
+        freed = 0
+        for _ in range(min(count, len(self))):
+            key, value = self.popitem(last=False)
+            self._used.pop(key, None)
+            freed += self.sizeof(value)
+            self.evictions += 1
+        return freed
+
+    def expire(self, now=None):
+        """Evict entries not used for ttl seconds ('ttl' policy)
+
+        Return:
+            (int): number of bytes freed (estimated)
+        """
+        if self.policy != "ttl":
+            return 0
+        limit = (time.monotonic() if now is None else now) - self.ttl
+        freed = 0
+        for key in [key for key, used in self._used.items() if used < limit]:
+            freed += self.sizeof(super().__getitem__(key))
+            del self[key]
+            self.evictions += 1
+        return freed
+
+
+class CacheRegistry:
+    """Registry of caches enforcing a global memory budget"""
+
+    def __init__(self, budget=None):
+        """Initialize a registry
+
+        Args:
+            budget (int): maximum number of bytes used by evictable caches
+                default is None, unbounded
+        """
+        self.budget = budget
+        self._caches = weakref.WeakValueDictionary()  # id: cache
+
+    def register(self, cache):
+        """Account cache in registry"""
+        self._caches[id(cache)] = cache
+
+    def caches(self, name=None):
+        """Registered caches (of given name)"""
+        return [
+            cache for cache in list(self._caches.values())
+            if name is None or cache.name == name
+        ]
+
+    @property
+    def nbytes(self):
+        """Estimated number of bytes used by evictable caches"""
+        return sum(cache.nbytes for cache in self.caches() if cache.evictable)
+
+    def report(self):
+        """Statistics of caches, summed by name
+
+        Return:
+            (dict): name -> dict with keys 'instances', 'entries', 'bytes',
+                'hits', 'misses', 'evictions' and 'hit_rate'
+        """
+        report = {}
+        for cache in self.caches():
+            stats = cache.stats()
+            total = report.setdefault(cache.name, dict.fromkeys(
+                ['instances', *stats], 0
+            ))
+            total['instances'] += 1
+            for key, value in stats.items():
+                total[key] += value
+        for total in report.values():
+            lookups = total['hits'] + total['misses']
+            total['hit_rate'] = total['hits'] / lookups if lookups else None
+        return dict(sorted(report.items()))
+
+    def enforce(self, now=None):
+        """Expire ttl entries and evict entries until budget is respected
+
+        About:
+            Entries are evicted one at a time from the biggest evictable cache
+
+        Return:
+            (int): number of bytes freed (estimated)
+        """
+        caches = [cache for cache in self.caches() if cache.evictable]
+        freed = sum(cache.expire(now) for cache in caches)
+        if self.budget is None:
+            return freed
+        sizes = [cache.nbytes for cache in caches]
+        excess = sum(sizes) - self.budget
+        heap = [(-size, index) for index, size in enumerate(sizes)]
+        heapq.heapify(heap)  # biggest cache first
+        while excess > 0 and heap:
+            size, index = heapq.heappop(heap)
+            cache = caches[index]
+            if not len(cache):
+                continue
+            evicted = cache.evict()
+            heapq.heappush(heap, (size + evicted, index))
+            excess -= evicted
+            freed += evicted
+        return freed
+
+    def watch(self, window, every=60):
+        """Enforce budget once every given number of frames of window"""
+        def hook(screen, ticks):
+            if not ticks % every:
+                self.enforce()
+
+        window.frame_hooks.append(hook)
+        return hook
+
+
+registry = CacheRegistry()
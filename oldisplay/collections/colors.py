@@ -111,6 +111,9 @@ class Color(tuple):
                 raise ValueError("Color component must be b/w 0 and 255")
         return tuple.__new__(cls, (r, g, b))
 
+    def __getnewargs__(self):
+        return tuple(self)
+
     @property
     def r(self):
         """Red component of color"""
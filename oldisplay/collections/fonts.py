@@ -1,15 +1,29 @@
 import pygame as pg
 from logzero import logger
+from olutils import read_params
+
+from oldisplay.caches import Cache
 
 FONTS = pg.font.get_fonts()
 
 
 class FontManager:
 
-    font_sizing_cache = {
-        # fontname: (height factor, height offset)
+    dft_params = {
+        'font': None,
+        'height': 12,
+        'bold': False,
+        'italic': False,
+        'underline': False,
     }
-    font_cache = {}
+    font_sizing_cache = Cache("font_sizing", policy=None)
+    # fontname: (height factor, height offset)
+    font_cache = Cache("fonts")
+    # font key: font
+    glyph_cache = Cache("glyphs")
+    # (font key, color): {char: surface}
+    metrics_cache = Cache("font_metrics")
+    # font key: {char: advance, (char, char): kerning}
 
     @classmethod
     def sizing_params(cls, fontname):
@@ -29,6 +43,7 @@ class FontManager:
         except KeyError:
             pass
 
+        key = fontname
         if (fontname is not None) and (fontname not in FONTS):
             logger.warning(f"Unknown font {fontname}, using default")
             fontname = None
@@ -41,7 +56,7 @@ class FontManager:
         offset = (h1 * s2 - s1 * h2) / (s2 - s1)
 
         params = (factor, offset)
-        cls.font_sizing_cache[fontname] = params
+        cls.font_sizing_cache[key] = params
         return params
 
     @classmethod
@@ -51,15 +66,20 @@ class FontManager:
         return int(round((height - offset) / factor))
 
     @classmethod
-    def get(cls, **params):
-        """Font of text (pygame.font.Font)"""
-        key = (
+    def key(cls, **params):
+        """Key identifying font of text in caches"""
+        return (
             params['font'],
             params['height'],
             params['bold'],
             params['italic'],
             params['underline'],
         )
+
+    @classmethod
+    def get(cls, **params):
+        """Font of text (pygame.font.Font)"""
+        key = cls.key(**params)
         try:
             return cls.font_cache[key]
         except KeyError:
@@ -76,3 +96,160 @@ class FontManager:
 
         cls.font_cache[key] = font
         return font
+
+    @classmethod
+    def layout(cls, string, **params):
+        """Glyphs of text and their x-position, rendering only unknown glyphs
+
+        About:
+            Each glyph is rendered once per font and color, a text is then
+            composed by blitting glyphs at positions given by their advance
+            and the kerning b/w consecutive characters. Positions can differ by
+            a pixel from font.render as fonts use sub-pixel advances.
+
+        Args:
+            string (str)    : text to compose
+            **params        : font parameters (@see FontManager.get)
+                and color of text (Color)
+
+        Return:
+            (list, int): list of (glyph surface, x) and width of text
+        """
+        key = cls.key(**params)
+        font = cls.get(**params)
+        color = params['color']
+        try:
+            glyphs = cls.glyph_cache[(key, color)]
+        except KeyError:
+            glyphs = cls.glyph_cache[(key, color)] = {}
+        metrics = cls.get_metrics(key)
+
+        items = []
+        x, width, prev = 0, 0, None
+        for char in string:
+            try:
+                glyph = glyphs[char]
+            except KeyError:
+                glyph = glyphs[char] = font.render(char, True, color)
+            try:
+                advance = metrics[char]
+            except KeyError:
+                advance = cls.advance(metrics, font, char)
+            if prev is not None:
+                try:
+                    x += metrics[(prev, char)]
+                except KeyError:
+                    x += cls.kerning(metrics, font, prev, char)
+            items.append((glyph, x))
+            width = max(width, x + glyph.get_width())
+            x += advance
+            prev = char
+        return items, width
+
+    # ----------------------------------------------------------------------- #
+    # Measures (no rendering)
+
+    @classmethod
+    def get_metrics(cls, key):
+        """Table of character advances and pair kerning of a font (dict)"""
+        try:
+            return cls.metrics_cache[key]
+        except KeyError:
+            metrics = cls.metrics_cache[key] = {}
+            return metrics
+
+    @classmethod
+    def advance(cls, metrics, font, char):
+        """Compute and store horizontal advance of char in metrics table"""
+        metric = font.metrics(char)[0]
+        advance = metrics[char] = (
+            font.size(char)[0] if metric is None else metric[4]
+        )
+        return advance
+
+    @classmethod
+    def kerning(cls, metrics, font, prev, char):
+        """Compute and store kerning b/w prev and char in metrics table"""
+        if prev not in metrics:
+            cls.advance(metrics, font, prev)
+        kerning = metrics[(prev, char)] = (
+            font.size(prev + char)[0] - metrics[prev] - font.size(char)[0]
+        )
+        return kerning
+
+    @classmethod
+    def extents(cls, **look):
+        """Vertical metrics of font
+
+        Args:
+            **look: font parameters, missing ones are taken from dft_params
+
+        Return:
+            (dict): 'ascent', 'descent' (negative), 'height' and 'linesize'
+                in pixels
+        """
+        font = cls.get(**read_params(look, cls.dft_params, safe=False))
+        return {
+            'ascent': font.get_ascent(),
+            'descent': font.get_descent(),
+            'height': font.get_height(),
+            'linesize': font.get_linesize(),
+        }
+
+    @classmethod
+    def measure(cls, string, **look):
+        """Size in pixels of text once rendered, without rendering it
+
+        Args:
+            string (str): text to measure
+            **look      : font parameters, missing ones are taken from
+                dft_params, others are ignored (color, ...)
+
+        Return:
+            (2-int-tuple): width and height in pixels
+        """
+        font = cls.get(**read_params(look, cls.dft_params, safe=False))
+        return font.size(string)
+
+    @classmethod
+    def measure_many(cls, strings, exact=True, **look):
+        """Sizes in pixels of many texts sharing the same font
+
+        Args:
+            strings (iterable[str]) : texts to measure
+            exact (bool)            : measure each text with font
+                when False, widths are sums of character advances and pair
+                kerning, memoized per font (as fonts use sub-pixel advances,
+                it can differ by a few pixels on long texts), height is the
+                height of font
+            **look                  : font parameters (@see measure)
+
+        Return:
+            (list[2-int-tuple]): width and height in pixels of each text
+        """
+        params = read_params(look, cls.dft_params, safe=False)
+        font = cls.get(**params)
+        if exact:
+            size = font.size
+            return [size(string) for string in strings]
+
+        metrics = cls.get_metrics(cls.key(**params))
+        height = font.get_height()
+        sizes = []
+        for string in strings:
+            width, prev = 0, None
+            for char in string:
+                try:
+                    width += metrics[char]
+                except KeyError:
+                    width += cls.advance(metrics, font, char)
+                if prev is not None:
+                    try:
+                        width += metrics[(prev, char)]
+                    except KeyError:
+                        width += cls.kerning(metrics, font, prev, char)
+                prev = char
+            if prev is not None:
+                width += font.size(prev)[0] - metrics[prev]  # extent of last
+            sizes.append((width, height))
+        return sizes
@@ -1,12 +1,21 @@
 """Classic components for an application"""
+from .bulk import create_many
+from .canvas import Canvas
 from .disk import ActiveDisk, Disk
+from .graph import Graph
 from .grid import Grid, FillingGrid
-from .image import Image
+from .group import Group
+from .image import ActiveImage, Image
 from .line import (
     Segment,
     Line,
     LineSet,
 )
 from .marker import Cross
+from .panel import Panel
+from .particles import ParticleSystem
 from .rectangle import ActiveRectangle, Rectangle
-from .text import ActiveText, Text
+from .series import StripChart, TimeSeries
+from .table import Table
+from .text import ActiveText, GlyphText, Paragraph, Text
+from .viewport import Viewport
@@ -0,0 +1,126 @@
+"""Tools to create many components at once"""
+import copy
+import inspect
+
+import numpy as np
+
+from .component import LocatedObject
+from .shape import Shape
+
+
+def _hashable(value):
+    """Return hashable version of a parameter value"""
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, *(_hashable(item) for item in value))
+    return value
+
+
+def _as_columns(values, n):
+    """Return (n, 2) array of int from one or n 2-int-tuples"""
+    values = np.asarray(values)
+    if values.ndim == 1:
+        values = np.broadcast_to(values, (n, 2))
+    if values.shape != (n, 2):
+        raise ValueError(f"Expecting {n} (x, y) values, got {values.shape}")
+    return values
+
+
+def _check_signature(cls):
+    """Raise TypeError if cls is not built from (ref_pos, size, **kwargs)"""
+    params = list(inspect.signature(cls.__init__).parameters)[1:3]
+    if params != ["ref_pos", "size"]:
+        raise TypeError(
+            f"{cls.__name__} is not built from (ref_pos, size), "
+            f"got ({', '.join(params)})"
+        )
+
+
+def _copy_state(state):
+    """Return state of a new instance, mutable attributes copied"""
+    return {
+        key: copy.copy(value) if isinstance(value, (dict, list, set))
+        else value
+        for key, value in state.items()
+    }
+
+
+def create_many(cls, ref_pos, size, **kwargs):
+    """Create many located shapes from columns of parameters
+
+    About:
+        Building components one by one reads and converts their parameters for
+        each of them. Here, parameters are read once per distinct look: a
+        component is built normally for each look, the others are copies of it
+        placed in a vectorized pass. Mutable attributes of prototype (look
+        parameters, ...) are copied for each component so that changing one
+        does not change the others.
+
+    Examples:
+        >>> rectangles = create_many(
+        ...     ActiveRectangle,
+        ...     ref_pos=np.array([(0, 0), (10, 0), (20, 0)]),
+        ...     size=(10, 10),
+        ...     color=[('red', 'blue'), ('green', 'blue'), ('red', 'blue')],
+        ...     width=1,
+        ... )
+
+    Args:
+        cls (type)          : class of components, must be built from
+            (ref_pos, size, **kwargs) (Rectangle, ActiveRectangle, ...)
+        ref_pos (array-like): (n, 2) reference positions
+        size (array-like)   : (n, 2) sizes or one size for all components
+        **kwargs            : look and alignment of components
+            list or numpy.ndarray of n items -> one value per component
+            other                           -> value for all components
+
+    Return:
+        (list): n components
+    """
+    if not (issubclass(cls, LocatedObject) and issubclass(cls, Shape)):
+        raise TypeError(f"{cls.__name__} is not a located shape")
+    _check_signature(cls)
+    n = len(ref_pos)
+    ref_pos = _as_columns(ref_pos, n)
+    size = _as_columns(size, n)
+
+    columns = {}
+    shared = {}
+    for key, value in kwargs.items():
+        if isinstance(value, np.ndarray) and len(value) == n:
+            columns[key] = value.tolist()
+        elif isinstance(value, list) and len(value) == n:
+            columns[key] = value
+        else:
+            shared[key] = value
+
+    # Group components by look
+    looks = {}
+    for i in range(n):
+        look = tuple(_hashable(column[i]) for column in columns.values())
+        looks.setdefault(look, []).append(i)
+
+    components = [None] * n
+    for rows in looks.values():
+        rows = np.array(rows)
+        first = rows[0]
+        params = dict(shared)
+        params.update({key: column[first] for key, column in columns.items()})
+        prototype = cls(
+            tuple(ref_pos[first].tolist()), tuple(size[first].tolist()),
+            **params
+        )
+
+        # Place copies of prototype
+        x, y = cls.position_func(
+            ref_pos[rows].T.copy(), size[rows].T,
+            prototype.h_align, prototype.v_align,
+        )
+        state = prototype.__dict__
+        for row, ref, dim, pos in zip(
+                rows.tolist(), ref_pos[rows].tolist(), size[rows].tolist(),
+                zip(x.tolist(), y.tolist())):
+            component = cls.__new__(cls)
+            component.__dict__.update(_copy_state(state))
+            component.place(tuple(ref), tuple(dim), pos)
+            components[row] = component
+    return components
@@ -0,0 +1,198 @@
+"""Objects to accumulate drawings across frames"""
+import numpy as np
+import pygame as pg
+
+from oldisplay import draw
+from oldisplay.collections import Color
+from .component import LocatedObject
+from .shape import Shape
+
+
+class Canvas(LocatedObject, Shape):
+    """Surface keeping what is drawn on it from one frame to the other
+
+    About:
+        Drawing commands (points, lines, stamps, ...) are queued and executed
+        once on the surface of canvas at next display, which then only blits
+        that surface: displaying a long history costs the same as displaying
+        nothing. Positions are relative to top-left of canvas.
+
+        Drawings can fade out: at each frame, before new commands, every pixel
+        gets closer to background (transparent when no background) by a
+        fraction fade, in a single pass on pixel arrays.
+    """
+
+    dft_look = {
+        'color': "black",  # default color of drawings
+    }
+    par_conv = {'color': Color.get}
+
+    def __init__(self, ref_pos, size, background=None, fade=0, **kwargs):
+        """Initialize a canvas
+
+        Args:
+            ref_pos (2-int-tuple)   : reference position of canvas
+                default is top-left
+            size (2-int-tuple)      : size of canvas in pixels
+            background (color)      : color of canvas
+                default is None, canvas is transparent
+            fade (float)            : fraction of intensity drawings lose at
+                each frame, 0 to keep drawings
+            align (str)             : alignment with ref_pos
+                'center', 'top-left', 'bot-right', 'top-center', ...
+            color (color)           : default color of drawings
+        """
+        super().__init__(ref_pos, size, **kwargs)
+        self.background = (
+            None if background is None else Color.get(background)
+        )
+        assert 0 <= fade < 1, "fade must be within [0, 1)"
+        self.fade = fade
+        self._surface = None
+        self._pending = []  # (function, args) drawn at next display
+        self._faded = True  # whether every pixel is back to background
+
+    # ----------------------------------------------------------------------- #
+    # Surface
+
+    @property
+    def surface(self):
+        """Persistent surface of canvas (pygame.Surface)"""
+        if self._surface is None or self._surface.get_size() != self.size:
+            self._surface = pg.Surface(self.size, pg.SRCALPHA)
+            draw.fill(self._surface, self.blank)
+            self._faded = True
+        return self._surface
+
+    @property
+    def blank(self):
+        """Color of an empty pixel"""
+        if self.background is None:
+            return (0, 0, 0, 0)
+        return self.background
+
+    def clear(self):
+        """Erase drawings, including pending ones"""
+        self._pending.clear()
+        self._push(draw.fill, self.blank)
+
+    def flush(self):
+        """Draw pending commands on surface of canvas"""
+        surface = self.surface
+        pending, self._pending = self._pending, []
+        for func, args in pending:
+            func(surface, *args)
+        if pending:
+            self._faded = False
+
+    # ----------------------------------------------------------------------- #
+    # Commands
+
+    def _push(self, func, *args):
+        """Queue func(surface, *args) for next display"""
+        self._pending.append((func, args))
+        self.invalidate()
+
+    def _color(self, color):
+        """Color of a command (default color of look when None)"""
+        return self.params['color'] if color is None else Color.get(color)
+
+    def point(self, pos, color=None, radius=0):
+        """Draw a point (a disk when radius is given)"""
+        color = self._color(color)
+        if radius:
+            self._push(draw.circle, color, tuple(pos), radius)
+        else:
+            self._push(draw.fill, color, (*pos, 1, 1))
+
+    def points(self, pos, colors=None):
+        """Draw many single pixel points at once
+
+        Args:
+            pos (array-like)    : (n, 2) positions of points
+            colors (array-like) : (n, 3) colors or one color of points
+                default is color of look
+        """
+        pos = np.asarray(pos, dtype=np.intp).reshape(-1, 2)
+        if colors is None or isinstance(colors, str):
+            colors = self._color(colors)[:3]
+        colors = np.broadcast_to(
+            np.asarray(colors, dtype=np.uint8), (len(pos), 3)
+        )
+        self._push(draw.custom, self.write_points, pos, colors)
+
+    def line(self, p1, p2, color=None, width=1):
+        """Draw a segment from p1 to p2"""
+        color = self._color(color)
+        self._push(draw.line, color, tuple(p1), tuple(p2), width)
+
+    def lines(self, points, color=None, width=1, closed=False):
+        """Draw a continuous line through points"""
+        points = [tuple(point) for point in points]
+        if len(points) < 2:
+            return
+        self._push(draw.lines, self._color(color), closed, points, width)
+
+    def stamp(self, source, pos):
+        """Draw a surface with its top-left at pos"""
+        self._push(draw.blit, source, tuple(pos))
+
+    # ----------------------------------------------------------------------- #
+    # Display
+
+    @staticmethod
+    def write_points(surface, pos, colors):
+        """Write pixels of points in surface"""
+        width, height = surface.get_size()
+        xs, ys = pos[:, 0], pos[:, 1]
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        xs, ys = xs[inside], ys[inside]
+        pixels = pg.surfarray.pixels3d(surface)
+        pixels[xs, ys] = colors[inside]
+        del pixels  # unlock surface
+        alpha = pg.surfarray.pixels_alpha(surface)
+        alpha[xs, ys] = 255
+        del alpha
+
+    def write_fade(self, surface):
+        """Bring every pixel closer to background by fraction fade
+
+        Return:
+            (bool): whether every pixel is back to background
+        """
+        keep = min(255, int(round(256 * (1 - self.fade))))
+        if self.background is None:
+            alpha = pg.surfarray.pixels_alpha(surface)
+            faded = alpha.astype(np.uint16)
+            faded *= keep
+            faded >>= 8
+            alpha[...] = faded
+            done = not alpha.any()
+            del alpha  # unlock surface
+            return done
+        pixels = pg.surfarray.pixels3d(surface)
+        background = np.array(self.background[:3], dtype=np.int32)
+        delta = pixels.astype(np.int32) - background
+        # Shift of a negative value rounds toward -inf: go toward 0 instead
+        faded = np.sign(delta) * ((np.abs(delta) * keep) >> 8)
+        pixels[...] = faded + background
+        done = not faded.any()
+        del pixels  # unlock surface
+        return done
+
+    def step(self):
+        """Fade drawings by one frame"""
+        if not self.fade or self._faded:
+            return
+        self._faded = draw.custom(self.surface, self.write_fade)
+        self.invalidate()
+
+    def update(self, surface, events=None):
+        """Fade previous drawings, draw new ones and display canvas"""
+        self.step()
+        self.flush()
+        return super().update(surface, events=events)
+
+    def display(self, surface, **params):
+        """Display surface of canvas"""
+        draw.blit(surface, self.surface, self.position)
@@ -2,7 +2,7 @@
 import pygame as pg
 from abc import ABC, abstractmethod
 
-from oldisplay import align
+from oldisplay import align, inputs
 
 
 class Component(ABC):
@@ -11,8 +11,11 @@ class Component(ABC):
     To Implement:
         *   update      update display
         (*) init        additional initiation once pygame is initialized
+        (*) track       follow events without displaying anything
     """
 
+    _parent = None
+
     def __init__(self, **kwargs):
         """Initialize component
 
@@ -27,6 +30,42 @@ class Component(ABC):
     def update(self, surface, events=None):
         """Update display on surface"""
 
+    def track(self, events=None):
+        """Follow events without displaying component
+
+        About:
+            Used by containers that reuse a cached display of the component
+        """
+
+    # ----------------------------------------------------------------------- #
+    # Hierarchy
+
+    @property
+    def parent(self):
+        """Container of component (None when at top level)"""
+        return self._parent
+
+    def invalidate(self):
+        """Notify container that display of component changed
+
+        About:
+            Called automatically when position or size changes, must be called
+            after any other change of look (params, points, ...)
+        """
+        if self._parent is not None:
+            self._parent.invalidate_cache()
+
+    def to_local(self, position):
+        """Convert a screen position to coordinates used by component"""
+        if self._parent is None:
+            return position
+        return self._parent.to_inner(position)
+
+    @property
+    def bbox(self):
+        """Area covered by component (pygame.Rect), None when unknown"""
+        return None
+
     # ----------------------------------------------------------------------- #
     # Utils
 
@@ -111,7 +150,7 @@ class ActiveComponent(Component):
 
     def _check_hover(self):
         """Return whether mouse is within component"""
-        self.is_hovered = self.is_within(pg.mouse.get_pos())
+        self.is_hovered = self.is_within(self.to_local(inputs.get_mouse_pos()))
         return self.is_hovered
 
     def _display(self, surface):
@@ -124,11 +163,11 @@ class ActiveComponent(Component):
             func = self.display_normal
         return func(surface)
 
-    def update(self, surface, events=None):
-        """Refresh component state"""
+    def track(self, events=None):
+        """Refresh mouse state of component"""
         events = [] if events is None else events
+        state = (self.is_hovered, self.is_clicked)
 
-        # Mouse / Event tracking
         if not self.enabled:
             self.is_clicked = False
             self.is_hovered = False
@@ -137,11 +176,19 @@ class ActiveComponent(Component):
             for event in events:
                 self._check_event(event)
 
+        if state != (self.is_hovered, self.is_clicked):
+            self.invalidate()
+
+    def update(self, surface, events=None):
+        """Refresh component state"""
+
+        # Mouse / Event tracking
+        self.track(events)
+
         # Display
         if self.visible:
             self._display(surface)
 
-
     # ----------------------------------------------------------------------- #
     # ---- To implement
 
@@ -231,6 +278,16 @@ class LocatedObject:
             )
         return self._pos
 
+    @property
+    def bbox(self):
+        """Area covered by component (pygame.Rect), None when unknown"""
+        if self.size is None:
+            return None
+        top_left = align.compute_top_left(
+            self.ref_pos, self.size, self.h_align, self.v_align
+        )
+        return pg.Rect(top_left, self.size)
+
     @property
     def ref_pos(self):
         """Reference position"""
@@ -241,6 +298,7 @@ class LocatedObject:
         """Reference position"""
         self._ref_pos = value
         self._pos = None
+        self.invalidate()
 
     @property
     def size(self):
@@ -252,3 +310,17 @@ class LocatedObject:
         """Set size value"""
         self._size = value
         self._pos = None
+        self.invalidate()
+
+    def place(self, ref_pos, size, position=None):
+        """Set reference position and size at once
+
+        Args:
+            ref_pos (2-int-tuple)   : reference position
+            size (2-int-tuple)      : size of component
+            position (2-int-tuple)  : utility position if already computed
+        """
+        self._ref_pos = ref_pos
+        self._size = size
+        self._pos = position
+        self.invalidate()
@@ -1,8 +1,7 @@
 """Objects to draw disks and circles"""
-import numpy as np
-import pygame as pg
+import math
 
-from oldisplay import align
+from oldisplay import align, draw
 from .component import LocatedObject
 from .shape import Shape2D, ActiveShape
 
@@ -47,11 +46,11 @@ class Disk(LocatedObject, Shape2D):
         w_outline = bool(params['outline'] and params['width'])
         if params['color']:
             # When drawn with border, reduce radius so it does not poke out
-            pg.draw.circle(
+            draw.circle(
                 surface, params['color'], self.center, self.radius - w_outline
             )
         if w_outline:
-            pg.draw.circle(
+            draw.circle(
                 surface, params['outline'], self.center, self.radius, params['width']
             )
 
@@ -61,8 +60,5 @@ class ActiveDisk(Disk, ActiveShape):
 
     def is_within(self, position):
         """Return whether position is within disk"""
-        position = np.array(position)
-        return (
-            np.linalg.norm(position-self.center)
-            <= self.radius
-        )
+        x, y = self.center
+        return math.hypot(position[0] - x, position[1] - y) <= self.radius
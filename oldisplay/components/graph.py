@@ -0,0 +1,325 @@
+"""Objects to draw node-link graphs of many nodes and edges"""
+import multiprocessing
+import queue
+
+import numpy as np
+import pygame as pg
+
+from oldisplay import draw, inputs
+from oldisplay.collections import Color
+from .component import LocatedObject
+from .shape import Shape
+
+LAYOUT_CHUNK = 512  # number of nodes whose repulsion is computed at once
+
+
+# --------------------------------------------------------------------------- #
+# Layout
+
+def layout_step(pos, edges, k, temperature, size):
+    """Move nodes by one iteration of force-directed layout (in place)
+
+    About:
+        Fruchterman-Reingold: nodes repulse each other (k² / distance) and
+        linked nodes attract each other (distance² / k), moves are bounded by
+        temperature and nodes are kept within area.
+
+    Args:
+        pos (numpy.ndarray)     : (n, 2) float positions of nodes
+        edges (numpy.ndarray)   : (m, 2) int indexes of linked nodes
+        k (float)               : ideal distance b/w nodes
+        temperature (float)     : maximum move of a node
+        size (2-int-tuple)      : size of area
+    """
+    n = len(pos)
+    disp = np.zeros_like(pos)
+    for start in range(0, n, LAYOUT_CHUNK):
+        delta = pos[start:start+LAYOUT_CHUNK, None, :] - pos[None, :, :]
+        dist2 = np.einsum("ijk,ijk->ij", delta, delta)
+        dist2[dist2 < 1e-2] = np.inf  # node itself and stacked nodes
+        disp[start:start+LAYOUT_CHUNK] = np.einsum(
+            "ijk,ij->ik", delta, k * k / dist2
+        )
+    if len(edges):
+        delta = pos[edges[:, 0]] - pos[edges[:, 1]]
+        force = delta * (np.hypot(delta[:, 0], delta[:, 1]) / k)[:, None]
+        np.subtract.at(disp, edges[:, 0], force)
+        np.add.at(disp, edges[:, 1], force)
+    length = np.maximum(np.hypot(disp[:, 0], disp[:, 1]), 1e-9)
+    pos += disp * (np.minimum(length, temperature) / length)[:, None]
+    np.clip(pos[:, 0], 0, size[0] - 1, out=pos[:, 0])
+    np.clip(pos[:, 1], 0, size[1] - 1, out=pos[:, 1])
+
+
+def force_layout(pos, edges, size, iterations=300):
+    """Iterate force-directed layout, cooling down at each iteration
+
+    Args:
+        pos (numpy.ndarray)     : (n, 2) initial positions of nodes
+        edges (numpy.ndarray)   : (m, 2) indexes of linked nodes
+        size (2-int-tuple)      : size of area
+        iterations (int)        : number of iterations
+
+    Yield:
+        (numpy.ndarray): (n, 2) positions after each iteration
+    """
+    pos = np.array(pos, dtype=np.float64)
+    edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+    k = np.sqrt(size[0] * size[1] / max(1, len(pos)))
+    temperature = max(size) / 10
+    for i in range(iterations):
+        layout_step(pos, edges, k, temperature * (1 - i / iterations), size)
+        yield pos
+
+
+def _layout_worker(pos, edges, size, iterations, every, results, stop):
+    """Run layout, putting (iteration, positions) in results every few ones"""
+    for i, pos in enumerate(force_layout(pos, edges, size, iterations), 1):
+        if stop.is_set():
+            return
+        if not i % every or i == iterations:
+            results.put((i, pos.astype(np.float32)))
+    results.put(None)  # layout is over
+
+
+# --------------------------------------------------------------------------- #
+# Component
+
+class Graph(LocatedObject, Shape):
+    """Nodes linked by edges, stored in numpy arrays
+
+    About:
+        Node positions (relative to top-left of area), colors and edges are
+        arrays: edges are drawn in one command with no component per edge
+        (@see draw.segments) and nodes are stamps of a disk blitted at once.
+        Hovered node is found with a vectorized distance computation.
+
+        Layout can run in a worker process (@see start_layout), positions are
+        streamed back and taken into account at next update, the frame never
+        waits for layout.
+    """
+
+    dft_look = {
+        'color': "steel_blue",  # color of nodes
+        'edge_color': "gray",
+        'edge_width': 1,
+        'hover_color': "orange",  # color of hovered node, None to keep color
+    }
+    par_conv = {'color': Color.get, 'edge_color': Color.get}
+
+    def __init__(self, ref_pos, size, nodes, edges, radius=4, **kwargs):
+        """Initialize a graph
+
+        Args:
+            ref_pos (2-int-tuple)   : reference position of area
+                default is top-left
+            size (2-int-tuple)      : size of area in pixels
+            nodes (array-like)      : (n, 2) positions of nodes in area
+            edges (array-like)      : (m, 2) indexes of linked nodes
+            radius (int)            : radius of nodes in pixels
+            align (str)             : alignment with ref_pos
+                'center', 'top-left', 'bot-right', 'top-center', ...
+            color (color)           : color of nodes
+            edge_color (color)      : color of edges
+            edge_width (int)        : width of edges
+            hover_color (color)     : color of hovered node
+        """
+        super().__init__(ref_pos, size, **kwargs)
+        self.radius = radius
+        self.pos = np.array(nodes, dtype=np.float32).reshape(-1, 2)
+        self.edges = np.array(edges, dtype=np.intp).reshape(-1, 2)
+        self.colors = np.empty((len(self.pos), 3), dtype=np.uint8)
+        self.colors[:] = self.params['color'][:3]
+        self.hovered = None  # index of hovered node
+
+        self._stamps = {}  # color: surface of a node
+        self._layout = None  # (process, results queue, stop event)
+        self.iteration = 0  # last layout iteration received
+        self.layout_exitcode = None  # exit code of a layout that failed
+
+    def __len__(self):
+        return len(self.pos)
+
+    # ----------------------------------------------------------------------- #
+    # Nodes
+
+    def set_colors(self, colors, nodes=None):
+        """Change color of nodes
+
+        Args:
+            colors (array-like) : (n, 3) colors or one color
+            nodes (array-like)  : indexes or mask of nodes, default is all
+        """
+        if isinstance(colors, str):
+            colors = Color.get(colors)[:3]
+        nodes = slice(None) if nodes is None else nodes
+        self.colors[nodes] = colors
+        self.invalidate()
+
+    def move(self, pos, nodes=None):
+        """Change position of nodes
+
+        Args:
+            pos (array-like)    : (n, 2) positions or one position
+            nodes (array-like)  : indexes or mask of nodes, default is all
+        """
+        nodes = slice(None) if nodes is None else nodes
+        self.pos[nodes] = pos
+        self.invalidate()
+
+    def node_at(self, position):
+        """Index of node at position relative to area (None if no node)"""
+        if not len(self.pos):
+            return None
+        delta = self.pos - position
+        dist2 = np.einsum("ij,ij->i", delta, delta)
+        index = int(np.argmin(dist2))
+        if dist2[index] > self.radius ** 2:
+            return None
+        return index
+
+    def is_within(self, position):
+        """Return whether position (in coordinates of graph) is on a node"""
+        x0, y0 = self.position
+        return self.node_at((position[0] - x0, position[1] - y0)) is not None
+
+    def act_click_node(self, index):
+        """Called after click on node of index"""
+
+    def track(self, events=None):
+        """Follow hovered node and clicks on nodes"""
+        x, y = self.to_local(inputs.get_mouse_pos())
+        x0, y0 = self.position
+        hovered = self.node_at((x - x0, y - y0))
+        if hovered != self.hovered:
+            self.hovered = hovered
+            self.invalidate()
+        if hovered is None:
+            return
+        for event in (events or []):
+            if event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
+                self.act_click_node(hovered)
+
+    # ----------------------------------------------------------------------- #
+    # Layout
+
+    def start_layout(self, iterations=300, every=5):
+        """Run force-directed layout in a worker process
+
+        Args:
+            iterations (int): number of iterations of layout
+            every (int)     : number of iterations b/w positions sent back
+        """
+        self.stop_layout()
+        context = multiprocessing.get_context("spawn")  # no pygame state
+        results = context.Queue(maxsize=4)
+        stop = context.Event()
+        process = context.Process(
+            target=_layout_worker,
+            args=(
+                self.pos.copy(), self.edges, self.size, iterations, every,
+                results, stop,
+            ),
+            daemon=True,
+        )
+        process.start()
+        self._layout = (process, results, stop)
+        self.iteration = 0
+        self.layout_exitcode = None
+
+    @property
+    def layout_running(self):
+        """Whether a layout is running (an ended worker is collected)"""
+        if self._layout is not None and not self._layout[0].is_alive():
+            self.poll_layout()
+        return self._layout is not None
+
+    def poll_layout(self):
+        """Take last positions sent by layout, never waits
+
+        About:
+            A worker that ended without sending end of layout failed, its exit
+            code is kept in layout_exitcode
+
+        Return:
+            (bool): whether positions changed
+        """
+        if self._layout is None:
+            return False
+        process, results, _ = self._layout
+        alive = process.is_alive()  # before reading: all it sent is readable
+        last, over = None, False
+        while True:
+            try:
+                item = results.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                over = True
+                break
+            last = item
+        if over or not alive:
+            self._layout = None
+            results.close()
+            if not over:
+                self.layout_exitcode = process.exitcode
+        if last is None:
+            return False
+        self.iteration, pos = last
+        self.move(pos)
+        return True
+
+    def stop_layout(self):
+        """Stop running layout, positions stay where they are, never waits"""
+        if self._layout is None:
+            return
+        process, results, stop = self._layout
+        self._layout = None
+        stop.set()
+        if process.is_alive():
+            process.terminate()  # may be blocked putting positions
+        results.cancel_join_thread()
+        results.close()
+
+    # ----------------------------------------------------------------------- #
+    # Display
+
+    def get_stamp(self, color):
+        """Surface of a node of color"""
+        try:
+            return self._stamps[color]
+        except KeyError:
+            pass
+        radius = self.radius
+        stamp = pg.Surface((2 * radius + 1, 2 * radius + 1), pg.SRCALPHA)
+        pg.draw.circle(stamp, color, (radius, radius), radius)
+        self._stamps[color] = stamp
+        return stamp
+
+    def update(self, surface, events=None):
+        """Take positions of layout, follow mouse and display graph"""
+        self.poll_layout()
+        self.track(events)
+        return super().update(surface, events=events)
+
+    def display(self, surface, **params):
+        """Display edges then nodes"""
+        x0, y0 = self.position
+        if len(self.edges):
+            draw.segments(
+                surface, params['edge_color'],
+                self.pos[self.edges[:, 0]] + (x0, y0),
+                self.pos[self.edges[:, 1]] + (x0, y0),
+                params['edge_width'],
+            )
+        if not len(self.pos):
+            return
+        radius = self.radius
+        colors = [tuple(color) for color in self.colors.tolist()]
+        if self.hovered is not None and params['hover_color'] is not None:
+            colors[self.hovered] = tuple(Color.get(params['hover_color']))[:3]
+        stamps = {color: self.get_stamp(color) for color in set(colors)}
+        draw.blits(surface, [
+            (stamps[color], (x0 + x - radius, y0 + y - radius))
+            for color, (x, y) in zip(colors, self.pos.astype(int).tolist())
+        ])
@@ -0,0 +1,169 @@
+"""Objects to gather components"""
+import pygame as pg
+
+from oldisplay import draw
+from .component import Component, LocatedObject
+
+
+class Group(LocatedObject, Component):
+    """Set of components displayed, moved and hidden as a unit
+
+    About:
+        Components of group are located relatively to the top-left corner of
+        the group. They are drawn on a surface owned by the group which is then
+        blitted at group position.
+
+        When cached, the surface is only redrawn when a component of the group
+        notifies a change (@see Component.invalidate), moving or displaying
+        the group then costs one blit whatever the number of components.
+    """
+
+    def __init__(self, ref_pos, size, components=None, cached=True,
+                 **kwargs):
+        """Initialize a group
+
+        Args:
+            ref_pos (2-int-tuple)   : reference position of group
+                default is top-left
+            size (2-int-tuple)      : size of group in pixels
+            components (list)       : components of group
+            cached (bool)           : reuse display of components until one
+                of them changes
+            align (str)             : alignment with ref_pos
+                'center', 'top-left', 'bot-right', 'top-center', ...
+        """
+        super().__init__(ref_pos, size, **kwargs)
+        self.cached = cached
+        self.surface = None
+        self._components = []
+        self._dirty = True
+        self._visible = True
+        self._alpha = 255
+        for component in ([] if components is None else components):
+            self.add(component)
+
+    # ----------------------------------------------------------------------- #
+    # Content
+
+    @property
+    def components(self):
+        """Components of group (list)"""
+        return self._components
+
+    def add(self, component):
+        """Add component to group"""
+        component._parent = self
+        self._components.append(component)
+        if self.surface is not None:
+            component.init(self.surface)
+        self.invalidate_cache()
+
+    def remove(self, component):
+        """Remove component from group"""
+        self._components.remove(component)
+        component._parent = None
+        self.invalidate_cache()
+
+    def __iter__(self):
+        return iter(self._components)
+
+    def __len__(self):
+        return len(self._components)
+
+    # ----------------------------------------------------------------------- #
+    # Visibility
+
+    @property
+    def visible(self):
+        """Whether group should be displayed"""
+        return self._visible
+
+    def show(self):
+        """Display group"""
+        self._visible = True
+        self.invalidate()
+
+    def hide(self):
+        """Stop displaying group"""
+        self._visible = False
+        self.invalidate()
+
+    @property
+    def alpha(self):
+        """Opacity of group, from 0 (transparent) to 255 (opaque)"""
+        return self._alpha
+
+    @alpha.setter
+    def alpha(self, value):
+        """Set opacity of group"""
+        self._alpha = value
+        if self.surface is not None:
+            self.surface.set_alpha(value)
+        self.invalidate()
+
+    # ----------------------------------------------------------------------- #
+    # Cache management
+
+    @property
+    def dirty(self):
+        """Whether surface of group must be redrawn"""
+        return self._dirty or not self.cached
+
+    def invalidate_cache(self):
+        """Mark surface of group as outdated and notify container"""
+        self._dirty = True
+        self.invalidate()
+
+    def to_inner(self, position):
+        """Convert a screen position to coordinates of group components"""
+        x, y = self.to_local(position)
+        x0, y0 = self.position
+        return x - x0, y - y0
+
+    # ----------------------------------------------------------------------- #
+    # Display
+
+    def init(self, surface):
+        """Build surface of group and initiate its components"""
+        self.surface = pg.Surface(self.size, pg.SRCALPHA)
+        self.surface.set_alpha(self._alpha)
+        for component in self._components:
+            component.init(self.surface)
+        self._dirty = True
+
+    def track(self, events=None):
+        """Follow events for all components of group"""
+        for component in self._components:
+            component.track(events)
+
+    def clear(self):
+        """Clear surface of group before redrawing its components"""
+        draw.fill(self.surface, (0, 0, 0, 0))
+
+    def render(self):
+        """Redraw components of group on its surface
+
+        About:
+            Events are followed beforehand (@see track), components are
+            updated without them so that they are not handled twice
+        """
+        self.clear()
+        for component in self._components:
+            component.update(self.surface)
+        self._dirty = False
+
+    def update(self, surface, events=None):
+        """Follow events and display group on surface
+
+        About:
+            Events are followed first so that a change of state of a
+            component (hover, click, ...) is displayed on the same frame
+        """
+        if not self._visible:
+            return
+        if self.surface is None or self.surface.get_size() != self.size:
+            self.init(surface)
+        self.track(events)
+        if self.dirty:
+            self.render()
+        draw.blit(surface, self.surface, self.position)
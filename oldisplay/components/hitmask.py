@@ -0,0 +1,32 @@
+"""Tools to test hits on the opaque pixels of a surface"""
+import weakref
+
+import pygame as pg
+
+_masks = weakref.WeakKeyDictionary()  # surface: mask, dropped with surface
+
+
+def get_mask(surface):
+    """Return mask of opaque pixels of surface, computed once per surface"""
+    try:
+        return _masks[surface]
+    except KeyError:
+        pass
+    mask = _masks[surface] = pg.mask.from_surface(surface)
+    return mask
+
+
+def hit(surface, top_left, position):
+    """Return whether position is on an opaque pixel of surface
+
+    Args:
+        surface (pygame.Surface): surface displayed
+        top_left (2-int-tuple)  : position of surface
+        position (2-int-tuple)  : position to test
+    """
+    x = int(position[0] - top_left[0])
+    y = int(position[1] - top_left[1])
+    dx, dy = surface.get_size()
+    if not (0 <= x < dx and 0 <= y < dy):
+        return False  # out of bounding box, mask not needed
+    return bool(get_mask(surface).get_at((x, y)))
@@ -1,16 +1,116 @@
 import pygame as pg
 
-from oldisplay.components.component import LocatedObject, Component
+from oldisplay import draw
+from oldisplay.caches import Cache
+from oldisplay.components.component import (
+    ActiveComponent, LocatedObject, Component
+)
+from oldisplay.components.hitmask import hit
 
 
 class Image(LocatedObject, Component):
 
+    images = Cache("images")
+    # (path, size): scaled surface, loaded again when evicted
+
     def __init__(self, path, ref_pos, size, **kwargs):
         super().__init__(ref_pos, size, **kwargs)
-        self.image = pg.transform.scale(
-            pg.image.load(path),size
+        self.path = path
+        self._alpha = None
+        self.load()
+
+    def load(self):
+        """Load image in cache of images (fails early on a bad path)
+
+        Return:
+            (pygame.Surface): image scaled to size
+        """
+        return self.get_image(self.path)
+
+    def get_image(self, path):
+        """Surface of image at path, scaled to size (pygame.Surface)"""
+        key = (path, tuple(self.size))
+        try:
+            return self.cls.images[key]
+        except KeyError:
+            pass
+        image = self.cls.images[key] = pg.transform.scale(
+            pg.image.load(path), key[1]
         )
+        return image
+
+    @property
+    def image(self):
+        """Surface of image, scaled to its size (pygame.Surface)"""
+        return self.get_image(self.path)
+
+    @property
+    def alpha(self):
+        """Opacity of image, from 0 (transparent) to 255 (opaque)"""
+        return 255 if self._alpha is None else self._alpha
+
+    @alpha.setter
+    def alpha(self, value):
+        """Set opacity of image"""
+        self._alpha = value
+        self.invalidate()
+
+    def blit(self, surface, image):
+        """Display image surface"""
+        image.set_alpha(self._alpha)  # surface is shared by same images
+        draw.blit(surface, image, self.position)
 
     def update(self, surface, **params):
         """Display disk regarding given look parameters"""
-        surface.blit(self.image, self.position)
+        self.blit(surface, self.image)
+
+
+class ActiveImage(Image, ActiveComponent):
+    """Image w. potential change when hovered or clicked
+
+    About:
+        By default, only opaque pixels of the image react to the mouse: the
+        mask of the image is computed once and only looked up when the mouse is
+        within the box of the image.
+    """
+
+    def __init__(self, path, ref_pos, size, hovered=None, clicked=None,
+                 pixel_perfect=True, **kwargs):
+        """Initialize an active image
+
+        Args:
+            path (str)              : path to image
+            ref_pos (2-int-tuple)   : reference position of image
+                default is top-left
+            size (2-int-tuple)      : size of image in pixels
+            hovered (str)           : path to image displayed when hovered
+            clicked (str)           : path to image displayed when clicked
+            pixel_perfect (bool)    : only react on opaque pixels of image
+                rather than on its box
+            align (str)             : alignment with ref_pos
+                'center', 'top-left', 'bot-right', 'top-center', ...
+        """
+        super().__init__(path, ref_pos, size, **kwargs)
+        self.path_h = path if hovered is None else hovered
+        self.path_c = self.path_h if clicked is None else clicked
+        self.pixel_perfect = pixel_perfect
+
+    update = ActiveComponent.update
+
+    def is_within(self, position):
+        """Return whether position is on image"""
+        if self.pixel_perfect:
+            return hit(self.image, self.position, position)
+        return self.bbox.collidepoint(position)
+
+    def display_normal(self, surface):
+        """Display image"""
+        self.blit(surface, self.image)
+
+    def display_hovered(self, surface):
+        """Display hovered image"""
+        self.blit(surface, self.get_image(self.path_h))
+
+    def display_clicked(self, surface):
+        """Display clicked image"""
+        self.blit(surface, self.get_image(self.path_c))
@@ -1,6 +1,8 @@
 """Objects to draw lines"""
 import pygame as pg
 
+from oldisplay import draw
+
 from .shape import Shape1D
 
 
@@ -14,7 +16,7 @@ def draw_segment(surface, p1, p2, color, width):
         Line width extend centered on base line, when width is even the extra
         pixel goes on the right/bottom of the line (x/y positively)
     """
-    pg.draw.line(surface, color, p1, p2, width)
+    draw.line(surface, color, p1, p2, width)
 
 
 def draw_line(surface, points, color, width, closed=False):
@@ -24,7 +26,7 @@ def draw_line(surface, points, color, width, closed=False):
         Line width extend centered on base line, when width is even the extra
         pixel goes on the right/bottom of the line (x/y positively)
     """
-    pg.draw.lines(surface, color, closed, points, width)
+    draw.lines(surface, color, closed, points, width)
 
 
 def draw_lines(surface, lines, color, width):
@@ -38,6 +40,19 @@ def draw_lines(surface, lines, color, width):
         draw_line(surface, points, color, width)
 
 
+def points_bbox(points, width):
+    """Return area covered by a line of given width (pygame.Rect)"""
+    if not points:
+        return None
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    margin = width // 2 + 1
+    x_min, y_min = min(xs) - margin, min(ys) - margin
+    return pg.Rect(
+        x_min, y_min, max(xs) + margin - x_min, max(ys) + margin - y_min
+    )
+
+
 # --------------------------------------------------------------------------- #
 # Classes
 
@@ -57,9 +72,14 @@ class Segment(Shape1D):
         self.p1 = p1
         self.p2 = p2
 
+    @property
+    def bbox(self):
+        """Area covered by segment (pygame.Rect)"""
+        return points_bbox([self.p1, self.p2], self.params['width'])
+
     def display(self, surface, **params):
         """Display segment"""
-        draw_segment(surface, params['color'], self.p1, self.p2, params['width'])
+        draw_segment(surface, self.p1, self.p2, params['color'], params['width'])
 
 
 class Line(Shape1D):
@@ -76,6 +96,11 @@ class Line(Shape1D):
         super().__init__(**kwargs)
         self.points = points
 
+    @property
+    def bbox(self):
+        """Area covered by line (pygame.Rect)"""
+        return points_bbox(self.points, self.params['width'])
+
     def display(self, surface, **params):
         """Display line"""
         draw_line(surface, self.points, params['color'], params['width'])
@@ -95,6 +120,14 @@ class LineSet(Shape1D):
         super().__init__(**kwargs)
         self.lines = lines
 
+    @property
+    def bbox(self):
+        """Area covered by lines (pygame.Rect)"""
+        return points_bbox(
+            [point for points in self.lines for point in points],
+            self.params['width'],
+        )
+
     def display(self, surface, **params):
         """Display line"""
         draw_lines(surface, self.lines, params['color'], params['width'])
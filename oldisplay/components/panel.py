@@ -0,0 +1,94 @@
+"""Objects to split a screen in areas refreshed at their own rate"""
+import pygame as pg
+
+from oldisplay import draw
+from oldisplay.collections import Color
+from .group import Group
+
+
+class Panel(Group):
+    """Area of screen with its own components and refresh interval
+
+    About:
+        A panel is a group whose surface is redrawn at most once per interval:
+        on other frames its last surface is blitted as is, so a slow or static
+        panel costs one blit whatever its content.
+
+        Examples of panels of a screen:
+            live plot   -> Panel(..., interval=16, cached=False)   60 Hz
+            status bar  -> Panel(..., interval=500, cached=False)  2 Hz
+            legend      -> Panel(...)           redrawn only when it changes
+    """
+
+    clock = staticmethod(pg.time.get_ticks)  # current time in ms
+
+    def __init__(self, ref_pos, size, components=None, interval=None,
+                 background=None, cached=True, **kwargs):
+        """Initialize a panel
+
+        Args:
+            ref_pos (2-int-tuple)   : reference position of panel
+                default is top-left
+            size (2-int-tuple)      : size of panel in pixels
+            components (list)       : components of panel
+            interval (int)          : minimum time in ms b/w two redraws
+                default is None, redrawing as soon as panel is outdated
+            background (color)      : color of panel background
+                default is None, panel is transparent
+            cached (bool)           : only redraw components when one of them
+                changes, otherwise at each interval
+            align (str)             : alignment with ref_pos
+                'center', 'top-left', 'bot-right', 'top-center', ...
+        """
+        super().__init__(ref_pos, size, components=components, cached=cached,
+                         **kwargs)
+        self.interval = interval
+        self.background = None if background is None else Color.get(background)
+        self.last_render = None  # time of last redraw in ms
+        self.renders = 0  # number of redraws
+
+    @property
+    def due(self):
+        """Whether panel must be redrawn now"""
+        if not self.dirty:
+            return False
+        if self.interval is None or self.last_render is None:
+            return True
+        return self.clock() - self.last_render >= self.interval
+
+    # ----------------------------------------------------------------------- #
+    # Display
+
+    def init(self, surface):
+        """Build surface of panel and initiate its components"""
+        flags = pg.SRCALPHA if self.background is None else 0
+        self.surface = pg.Surface(self.size, flags)
+        self.surface.set_alpha(self._alpha)
+        for component in self._components:
+            component.init(self.surface)
+        self._dirty = True
+        self.last_render = None
+
+    def clear(self):
+        """Fill surface of panel with its background"""
+        if self.background is None:
+            super().clear()
+        else:
+            draw.fill(self.surface, self.background)
+
+    def render(self):
+        """Redraw components of panel on its surface"""
+        super().render()
+        self.last_render = self.clock()
+        self.renders += 1
+
+    def update(self, surface, events=None):
+        """Follow events, display last surface of panel, redrawn when due"""
+        if not self._visible:
+            return
+        if self.surface is None or self.surface.get_size() != self.size:
+            self.init(surface)
+        self.track(events)
+        if self.due:
+            self.render()
+        draw.blit(surface, self.surface, self.position)
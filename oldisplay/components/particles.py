@@ -0,0 +1,188 @@
+"""Objects to draw many moving particles"""
+import time
+
+import numpy as np
+import pygame as pg
+
+from oldisplay import draw
+from oldisplay.collections import Color
+from .component import LocatedObject
+from .shape import Shape
+
+
+class ParticleSystem(LocatedObject, Shape):
+    """Particles moving in an area, stored in numpy arrays
+
+    About:
+        Position, velocity, color and remaining life of particles are stored in
+        arrays of fixed capacity: particles are spawned in free slots and
+        killed by masks, nothing is reallocated. Particles are integrated all
+        at once at each update.
+
+        Particles are drawn by writing pixels through surfarray: a single
+        pixel for radius 0, the footprint of a disk (computed once) otherwise.
+        Positions are relative to top-left of area, particles leaving the area
+        are killed.
+    """
+
+    dft_look = {
+        'color': "black",
+    }
+    par_conv = {'color': Color.get}
+
+    def __init__(self, ref_pos, size, capacity, radius=0, gravity=(0, 0),
+                 drag=0, **kwargs):
+        """Initialize a particle system
+
+        Args:
+            ref_pos (2-int-tuple)   : reference position of area
+                default is top-left
+            size (2-int-tuple)      : size of area in pixels
+            capacity (int)          : maximum number of particles
+            radius (int)            : radius of particles in pixels
+            gravity (2-float-tuple) : acceleration of particles in pixels/s²
+            drag (float)            : fraction of velocity lost per second
+            align (str)             : alignment with ref_pos
+                'center', 'top-left', 'bot-right', 'top-center', ...
+            color (color)           : default color of spawned particles
+        """
+        super().__init__(ref_pos, size, **kwargs)
+        self.capacity = capacity
+        self.radius = radius
+        self.gravity = np.array(gravity, dtype=np.float32)
+        self.drag = drag
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.life = np.zeros(capacity, dtype=np.float32)  # in seconds
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        self._footprint = None
+        self._last_step = None
+
+    def __len__(self):
+        return int(self.alive.sum())
+
+    # ----------------------------------------------------------------------- #
+    # Particles
+
+    def spawn(self, pos, vel=(0, 0), life=np.inf, color=None):
+        """Add particles in free slots
+
+        Args:
+            pos (array-like)    : (n, 2) positions of particles
+            vel (array-like)    : (n, 2) or one velocity in pixels/s
+            life (array-like)   : (n,) or one life duration in seconds
+            color (array-like)  : (n, 3) colors or one color of particles
+                default is color of look
+
+        Return:
+            (numpy.ndarray): slots of spawned particles, particles exceeding
+                capacity are not spawned
+        """
+        pos = np.asarray(pos, dtype=np.float32).reshape(-1, 2)
+        slots = np.flatnonzero(~self.alive)[:len(pos)]
+        n = len(slots)
+        self.pos[slots] = pos[:n]
+        self.vel[slots] = np.broadcast_to(vel, (len(pos), 2))[:n]
+        self.life[slots] = np.broadcast_to(life, (len(pos),))[:n]
+        if color is None:
+            color = self.params['color']
+        elif isinstance(color, str):
+            color = Color.get(color)
+        self.color[slots] = np.broadcast_to(color, (len(pos), 3))[:n]
+        self.alive[slots] = True
+        self.invalidate()
+        return slots
+
+    def kill(self, mask=None):
+        """Kill particles of mask (all particles if None)"""
+        if mask is None:
+            self.alive[:] = False
+        else:
+            self.alive[mask] = False
+        self.invalidate()
+
+    def step(self, dt=None):
+        """Move particles and age them by dt seconds
+
+        Args:
+            dt (float): time elapsed in seconds
+                default is time elapsed since last step (at most 0.1s)
+        """
+        now = time.perf_counter()
+        if dt is None:
+            dt = 0 if self._last_step is None else now - self._last_step
+            dt = min(dt, 0.1)
+        self._last_step = now
+        if not dt:
+            return
+
+        alive = self.alive
+        vel = self.vel
+        if self.gravity.any():
+            vel += self.gravity * dt
+        if self.drag:
+            vel *= max(0, 1 - self.drag * dt)
+        self.pos += vel * dt
+        self.life -= dt
+
+        # Kill dead and out of area particles
+        dx, dy = self.size
+        x, y = self.pos[:, 0], self.pos[:, 1]
+        alive &= self.life > 0
+        alive &= (x >= 0) & (x < dx) & (y >= 0) & (y < dy)
+        self.invalidate()
+
+    # ----------------------------------------------------------------------- #
+    # Display
+
+    @property
+    def footprint(self):
+        """(dx, dy) offsets of pixels covered by a particle"""
+        if self._footprint is None:
+            radius = self.radius
+            dx, dy = np.mgrid[-radius:radius+1, -radius:radius+1]
+            inside = dx ** 2 + dy ** 2 <= radius ** 2
+            self._footprint = np.column_stack([dx[inside], dy[inside]])
+        return self._footprint
+
+    def update(self, surface, events=None):
+        """Move particles and display them"""
+        self.step()
+        return super().update(surface, events=events)
+
+    def display(self, surface, **params):
+        """Display living particles"""
+        if self.alive.any():
+            draw.custom(surface, self.write)
+
+    def write(self, surface):
+        """Write pixels of living particles in surface"""
+        slots = np.flatnonzero(self.alive)
+        if not len(slots):
+            return
+        x0, y0 = self.position
+        dx, dy = draw.get_offset(surface)
+        pos = self.pos[slots].astype(np.intp) + (x0 + dx, y0 + dy)
+        colors = self.color[slots]
+
+        if surface.get_bytesize() == 4:
+            # Write mapped colors, one integer per pixel
+            shifts = surface.get_shifts()
+            channels = colors.astype(np.uint32)
+            colors = (
+                channels[:, 0] << shifts[0] | channels[:, 1] << shifts[1]
+                | channels[:, 2] << shifts[2] | surface.get_masks()[3]
+            )
+            pixels = pg.surfarray.pixels2d(surface)
+        else:
+            pixels = pg.surfarray.pixels3d(surface)
+        width, height = surface.get_size()
+        offsets = self.footprint if self.radius else [(0, 0)]
+        for ox, oy in offsets:
+            xs, ys = pos[:, 0] + ox, pos[:, 1] + oy
+            inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+            pixels[xs[inside], ys[inside]] = colors[inside]
+        del pixels  # unlock surface
@@ -1,8 +1,9 @@
 """Objects to draw rectangles"""
 import pygame as pg
 
+from oldisplay import draw
 from .component import LocatedObject
-from .line import LineSet
+from .line import draw_segment
 from .shape import Shape2D, ActiveShape
 
 
@@ -23,13 +24,25 @@ class Rectangle(LocatedObject, Shape2D):
             outline (color)         : outline color
             width (int)             : width of outline
         """
+        self._rect = None
         super().__init__(ref_pos, size, **kwargs)
-        self.cache = pg.Rect(self.position, size)
+
+    @property
+    def cache(self):
+        """Area of rectangle (pygame.Rect), rebuilt once moved or resized"""
+        if self._rect is None:
+            self._rect = pg.Rect(self.position, self.size)
+        return self._rect
+
+    def invalidate(self):
+        """Forget area of rectangle and notify container"""
+        self._rect = None
+        super().invalidate()
 
     def display(self, surface, **params):
         """Display rectangle regarding given look parameters"""
         if params['color']:
-            pg.draw.rect(surface, params['color'], self.cache)
+            draw.rect(surface, params['color'], self.cache)
         if params['outline'] and params['width']:
             # Build my own outline as pg.draw.rect draw awkward outline
             # # (that goes outside rectangle and ignore corners)
@@ -42,13 +55,12 @@ class Rectangle(LocatedObject, Shape2D):
             delta_m = (width-1) // 2 + ((width+1) % 2)
             x_lft, x_rgt = x+delta_p, x+dx-delta_m
             y_top, y_bot = y+delta_p, y+dy-delta_m
-            line = LineSet([
-                [(x, y_top), (x+dx, y_top)],
-                [(x, y_bot), (x+dx, y_bot)],
-                [(x_lft, y), (x_lft, y+dx)],
-                [(x_rgt, y), (x_rgt, y+dx)],
-            ], color=params['outline'], width=width)
-            line.update(surface)
+            # Draw segments directly, no line component built at each frame
+            color = params['outline']
+            draw_segment(surface, (x, y_top), (x+dx, y_top), color, width)
+            draw_segment(surface, (x, y_bot), (x+dx, y_bot), color, width)
+            draw_segment(surface, (x_lft, y), (x_lft, y+dx), color, width)
+            draw_segment(surface, (x_rgt, y), (x_rgt, y+dx), color, width)
 
 
 class ActiveRectangle(Rectangle, ActiveShape):
@@ -0,0 +1,287 @@
+"""Objects to draw streamed series of values"""
+import math
+
+import numpy as np
+import pygame as pg
+
+from oldisplay import draw
+from oldisplay.collections import Color
+from .component import LocatedObject
+from .shape import Shape1D
+
+
+class TimeSeries(LocatedObject, Shape1D):
+    """Line of last values of a stream, decimated to the width of its area
+
+    About:
+        Values are stored in a ring buffer of given capacity, the last
+        capacity values are displayed from left to right of the area.
+
+        Consecutive values falling in the same pixel column are reduced to
+        their min and max (bucket), so the number of drawn points never
+        exceeds twice the width of the area. Buckets are cached and only
+        computed for values appended since last display.
+    """
+
+    def __init__(self, ref_pos, size, capacity, y_range=None, **kwargs):
+        """Initialize a time series
+
+        Args:
+            ref_pos (2-int-tuple)   : reference position of area
+                default is top-left
+            size (2-int-tuple)      : size of area in pixels
+            capacity (int)          : number of last values displayed
+            y_range (2-float-tuple) : values displayed at bottom and top
+                default is min and max of displayed values
+            align (str)             : alignment with ref_pos
+                'center', 'top-left', 'bot-right', 'top-center', ...
+            color (color)           : color of line
+            width (int)             : width of line
+        """
+        super().__init__(ref_pos, size, **kwargs)
+        assert capacity > 0
+        self.capacity = capacity
+        self.y_range = y_range
+        self.step = math.ceil(capacity / size[0])  # values per bucket
+
+        self._values = np.zeros(capacity)
+        self._count = 0  # number of values appended so far
+
+        bucket_nb = capacity // self.step + 2
+        self._mins = np.zeros(bucket_nb)
+        self._maxs = np.zeros(bucket_nb)
+        self._decimated = 0  # number of values reduced to buckets
+
+        self._points = None
+
+    # ----------------------------------------------------------------------- #
+    # Data
+
+    @property
+    def count(self):
+        """Number of values appended so far"""
+        return self._count
+
+    @property
+    def start(self):
+        """Index of first value displayed"""
+        return max(0, self._count - self.capacity)
+
+    def __len__(self):
+        return self._count - self.start
+
+    def append(self, value):
+        """Append a value to series"""
+        self._values[self._count % self.capacity] = value
+        self._count += 1
+        self._points = None
+        self.invalidate()
+
+    def extend(self, values):
+        """Append values to series"""
+        values = np.asarray(values, dtype=float)
+        count = self._count + len(values)
+        values = values[-self.capacity:]
+        index = (count - len(values)) % self.capacity
+        split = min(len(values), self.capacity - index)
+        self._values[index:index+split] = values[:split]
+        self._values[:len(values)-split] = values[split:]
+        self._count = count
+        self._points = None
+        self.invalidate()
+
+    def values(self, start=None, stop=None):
+        """Return copy of values between absolute indexes start and stop"""
+        start = self.start if start is None else max(start, self.start)
+        stop = self._count if stop is None else min(stop, self._count)
+        if stop <= start:
+            return np.empty(0)
+        return np.take(
+            self._values, np.arange(start, stop) % self.capacity
+        )
+
+    # ----------------------------------------------------------------------- #
+    # Decimation
+
+    def _reduce(self, first, last):
+        """Compute buckets first to last (included)"""
+        step = self.step
+        values = self.values(first * step, (last + 1) * step)
+        offset = max(first * step, self.start) - first * step
+        padded = np.full((last - first + 1) * step, np.nan)
+        padded[offset:offset+len(values)] = values
+        padded = padded.reshape(-1, step)
+        indexes = np.arange(first, last + 1) % len(self._mins)
+        self._mins[indexes] = np.nanmin(padded, axis=1)
+        self._maxs[indexes] = np.nanmax(padded, axis=1)
+
+    def buckets(self):
+        """Return min and max values of displayed buckets
+
+        Return:
+            (2-numpy.ndarray-tuple): min and max values of each bucket, first
+                bucket is leftmost column of area
+        """
+        if not len(self):
+            return np.empty(0), np.empty(0)
+        step = self.step
+        first = self.start // step
+        last = (self._count - 1) // step
+
+        # Only buckets that received new values are computed
+        new = max(self._decimated, self.start) // step
+        if new <= last:
+            self._reduce(new, last)
+        if self.start % step and first < new:
+            self._reduce(first, first)  # some of its values were dropped
+        self._decimated = self._count
+
+        indexes = np.arange(first, last + 1) % len(self._mins)
+        return self._mins[indexes], self._maxs[indexes]
+
+    @property
+    def points(self):
+        """Points of line to draw (relative to top-left of area)"""
+        if self._points is not None:
+            return self._points
+        mins, maxs = self.buckets()
+        if not len(mins):
+            return []
+        if self.y_range is None:
+            y_min, y_max = mins.min(), maxs.max()
+        else:
+            y_min, y_max = self.y_range
+        dx, dy = self.size
+        scale = (dy - 1) / (y_max - y_min) if y_max > y_min else 0
+
+        xs = np.minimum(np.repeat(np.arange(len(mins)), 2), dx - 1)
+        ys = np.empty(2 * len(mins))
+        ys[0::2] = (y_max - mins) * scale
+        ys[1::2] = (y_max - maxs) * scale
+        ys = np.clip(ys, 0, dy - 1)
+        self._points = np.column_stack([xs, ys]).tolist()
+        return self._points
+
+    # ----------------------------------------------------------------------- #
+    # Display
+
+    def display(self, surface, **params):
+        """Display decimated line"""
+        points = self.points
+        if len(points) < 2:
+            return
+        x0, y0 = self.position
+        with draw.translate(surface, (x0, y0)):
+            draw.lines(
+                surface, params['color'], False, points, params['width']
+            )
+
+
+class StripChart(LocatedObject, Shape1D):
+    """Chart scrolling left as values are pushed, drawn incrementally
+
+    About:
+        The chart keeps its own surface: at each display, already drawn pixels
+        are shifted left (pygame.Surface.scroll) and only segments of values
+        pushed since last display are drawn, whatever the visible history.
+    """
+
+    dft_look = {
+        'color': "black",
+        'width': 1,
+        'background': "white",
+    }
+    par_conv = {'color': Color.get, 'background': Color.get}
+
+    def __init__(self, ref_pos, size, y_range, step=1, **kwargs):
+        """Initialize a strip chart
+
+        Args:
+            ref_pos (2-int-tuple)   : reference position of chart
+                default is top-left
+            size (2-int-tuple)      : size of chart in pixels
+            y_range (2-float-tuple) : values displayed at bottom and top
+            step (int)              : number of pixels b/w consecutive values
+            align (str)             : alignment with ref_pos
+                'center', 'top-left', 'bot-right', 'top-center', ...
+            color (color)           : color of line
+            width (int)             : width of line
+            background (color)      : color of chart background
+        """
+        super().__init__(ref_pos, size, **kwargs)
+        assert y_range[1] > y_range[0]
+        assert step > 0
+        self.y_range = y_range
+        self.step = step
+        self.surface = None
+        self._pending = []
+        self._last = None  # y pixel of last drawn value
+
+    def push(self, value):
+        """Add a value at the right of chart (NaN for a gap in line)"""
+        self._pending.append(value)
+        self.invalidate()
+
+    def extend(self, values):
+        """Add values at the right of chart"""
+        self._pending.extend(values)
+        self.invalidate()
+
+    def to_pixel(self, value):
+        """Return y pixel of value on chart surface"""
+        y_min, y_max = self.y_range
+        dy = self.size[1] - 1
+        return min(max(round((y_max - value) * dy / (y_max - y_min)), 0), dy)
+
+    def init(self, surface):
+        """Build surface of chart"""
+        self.surface = pg.Surface(self.size)
+        self.surface.fill(self.params['background'])
+        self._last = None
+
+    def draw_pending(self, **params):
+        """Scroll chart surface and draw values pushed since last call"""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        dx, dy = self.size
+        step = self.step
+
+        # Keep only values that will be visible
+        pending = pending[-(dx // step + 1):]
+        shift = step * len(pending)
+        if shift >= dx:
+            draw.fill(self.surface, params['background'])
+            self._last = None
+        else:
+            self.surface.scroll(-shift, 0)
+            draw.fill(
+                self.surface, params['background'], (dx - shift, 0, shift, dy)
+            )
+
+        # Line is broken at NaN values
+        x = dx - 1 - shift
+        runs = [[] if self._last is None else [(x, self._last)]]
+        for value in pending:
+            x += step
+            if math.isnan(value):
+                runs.append([])
+            else:
+                runs[-1].append((x, self.to_pixel(value)))
+        for points in runs:
+            if len(points) > 1:
+                draw.lines(
+                    self.surface, params['color'], False, points,
+                    params['width'],
+                )
+            elif points:
+                self.surface.set_at(points[0], params['color'])
+                draw.touch(self.surface)
+        self._last = runs[-1][-1][1] if runs[-1] else None
+
+    def display(self, surface, **params):
+        """Display chart, history is dropped when size changes"""
+        if self.surface is None or self.surface.get_size() != tuple(self.size):
+            self.init(surface)
+        self.draw_pending(**params)
+        draw.blit(surface, self.surface, self.position)
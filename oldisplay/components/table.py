@@ -0,0 +1,291 @@
+"""Objects to display tables of any number of rows"""
+import pygame as pg
+
+from oldisplay import draw, inputs
+from oldisplay.collections import Color, FontManager
+from .component import LocatedObject
+from .shape import Shape2D
+from .text import Text
+
+
+class Table(LocatedObject, Shape2D):
+    """Table scrolled by pixels, only visible rows are rendered
+
+    About:
+        Rows are pulled from a provider when they become visible: a sequence
+        of rows or a function returning row of an index. Each visible row is
+        composed of glyphs (@see FontManager.layout) on a surface of its own,
+        surfaces of rows leaving the area are reused for rows entering it:
+        memory used only depends on size of table, not on number of rows.
+
+        Table is scrolled with mouse wheel when hovered or through scroll /
+        scroll_to, scrolling is eased over frames if smoothing is set.
+    """
+
+    dft_look = dict(Text.dft_look, stripe=None, header_color=None)
+    par_conv = Text.par_conv  # backgrounds are optional (None)
+
+    def __init__(self, ref_pos, size, rows, columns, n_rows=None,
+                 header=None, padding=2, wheel_step=40, smoothing=0,
+                 **kwargs):
+        """Initialize a table
+
+        Args:
+            ref_pos (2-int-tuple)   : reference position of table
+                default is top-left
+            size (2-int-tuple)      : size of table in pixels
+            rows (sequence|callable): rows of table (sequence of values), as a
+                sequence of rows or a function returning row of an index
+            columns (list)          : width of columns in pixels
+            n_rows (int)            : number of rows
+                default is len(rows), required when rows is a function
+            header (list)           : titles of columns, displayed above rows
+                and not scrolled
+            padding (int)           : space around text of cells in pixels
+            wheel_step (int)        : pixels scrolled by a wheel notch
+            smoothing (float)       : fraction of remaining scroll kept at
+                each frame, 0 scrolls at once
+            align (str)             : alignment with ref_pos
+                'center', 'top-left', 'bot-right', 'top-center', ...
+
+            # Aspect parameters
+            @see Text, and
+            stripe (color)          : background of odd rows
+            header_color (color)    : background of header
+        """
+        super().__init__(ref_pos, size, **kwargs)
+        self.columns = list(columns)
+        self.header = header
+        self.padding = padding
+        self.wheel_step = wheel_step
+        assert 0 <= smoothing < 1, "smoothing must be within [0, 1)"
+        self.smoothing = smoothing
+        self._offset = 0  # pixels scrolled
+        self._target = 0  # pixels to scroll to
+        self._row_height = None
+        self._header = None  # surface of header
+        self._surfaces = {}  # index: surface of visible row
+        self.renders = 0  # number of rows rendered
+
+        self._rows = None
+        self._n_rows = None
+        self.set_rows(rows, n_rows)
+
+    # ----------------------------------------------------------------------- #
+    # Content
+
+    def set_rows(self, rows, n_rows=None):
+        """Change rows of table
+
+        Args:
+            rows (sequence|callable): rows of table
+            n_rows (int)            : number of rows
+                default is len(rows), required when rows is a function
+        """
+        if n_rows is None:
+            assert not callable(rows), "n_rows required for a row function"
+            n_rows = len(rows)
+        self._rows = rows
+        self._n_rows = n_rows
+        self.refresh()
+
+    @property
+    def n_rows(self):
+        """Number of rows"""
+        return self._n_rows
+
+    @n_rows.setter
+    def n_rows(self, value):
+        """Change number of rows (rows appended or removed by provider)"""
+        self._n_rows = value
+        self.scroll_to_offset(self._target)
+
+    def get_row(self, index):
+        """Values of row at index, pulled from provider"""
+        if callable(self._rows):
+            return self._rows(index)
+        return self._rows[index]
+
+    def refresh(self):
+        """Render visible rows again (data of provider changed)"""
+        self._surfaces.clear()
+        self.invalidate()
+
+    @property
+    def materialized(self):
+        """Indexes of rows currently rendered (list)"""
+        return sorted(self._surfaces)
+
+    # ----------------------------------------------------------------------- #
+    # Geometry
+
+    @property
+    def row_height(self):
+        """Height of a row in pixels, requires pygame.init()"""
+        if self._row_height is None:
+            font = FontManager.get(**self.params)
+            self._row_height = font.get_linesize() + 2 * self.padding
+        return self._row_height
+
+    @property
+    def header_height(self):
+        """Height of header in pixels"""
+        return 0 if self.header is None else self.row_height
+
+    @property
+    def body_height(self):
+        """Height of area showing rows in pixels"""
+        return max(0, self.size[1] - self.header_height)
+
+    @property
+    def max_offset(self):
+        """Number of pixels scrolled once last row is at bottom"""
+        return max(0, self._n_rows * self.row_height - self.body_height)
+
+    @property
+    def offset(self):
+        """Number of pixels scrolled (float)"""
+        return self._offset
+
+    def visible_range(self):
+        """First and last + 1 indexes of rows (partly) visible"""
+        top = round(self._offset)
+        first = top // self.row_height
+        last = (top + self.body_height - 1) // self.row_height + 1
+        return first, max(first, min(last, self._n_rows))
+
+    # ----------------------------------------------------------------------- #
+    # Scrolling
+
+    def scroll_to_offset(self, offset):
+        """Scroll to given number of pixels from top"""
+        self._target = min(max(0, offset), self.max_offset)
+        if not self.smoothing:
+            self._offset = self._target
+        self.invalidate()
+
+    def scroll(self, pixels):
+        """Scroll by given number of pixels, down when positive"""
+        self.scroll_to_offset(self._target + pixels)
+
+    def scroll_to(self, index):
+        """Scroll so that row at index is at top"""
+        self.scroll_to_offset(index * self.row_height)
+
+    def step(self):
+        """Move scroll offset toward its target (smoothing)"""
+        gap = self._target - self._offset
+        if not gap:
+            return
+        if abs(gap) < 0.5:
+            self._offset = self._target
+        else:
+            self._offset = self._target - gap * self.smoothing
+        self.invalidate()
+
+    def is_within(self, position):
+        """Return whether position is within table"""
+        return pg.Rect(self.position, self.size).collidepoint(position)
+
+    def track(self, events=None):
+        """Scroll with mouse wheel when table is hovered"""
+        for event in (events or []):
+            if event.type != pg.MOUSEWHEEL:
+                continue
+            if self.is_within(self.to_local(inputs.get_mouse_pos())):
+                self.scroll(-event.y * self.wheel_step)
+
+    # ----------------------------------------------------------------------- #
+    # Display
+
+    def init(self, surface):
+        """Forget renders (fonts are available from now on)"""
+        self._row_height = None
+        self._header = None
+        self._surfaces.clear()
+
+    def compose(self, surface, values, background=None):
+        """Draw values of a row on row surface, clipped to their column"""
+        draw.fill(
+            surface,
+            (0, 0, 0, 0) if background is None else Color.get(background),
+        )
+        padding, height = self.padding, surface.get_height()
+        x = 0
+        for width, value in zip(self.columns, values):
+            glyphs, _ = FontManager.layout(str(value), **self.params)
+            surface.set_clip(pg.Rect(x, 0, width - padding, height))
+            x0 = x + padding
+            draw.blits(surface, [
+                (glyph, (x0 + gx, padding)) for glyph, gx in glyphs
+            ])
+            x += width
+        surface.set_clip(None)
+
+    def materialize(self, first, last):
+        """Render rows entering the visible range on surfaces of rows leaving it
+
+        Return:
+            (dict): index -> surface of visible rows
+        """
+        prev = self._surfaces
+        free = [
+            surface for index, surface in prev.items()
+            if not first <= index < last
+        ]
+        size = (sum(self.columns), self.row_height)
+        stripe = self.params['stripe']
+        visible = {}
+        for index in range(first, last):
+            surface = prev.get(index)
+            if surface is None:
+                if free:
+                    surface = free.pop()
+                else:
+                    surface = pg.Surface(size, pg.SRCALPHA)
+                self.compose(
+                    surface, self.get_row(index),
+                    stripe if index % 2 else None,
+                )
+                self.renders += 1
+            visible[index] = surface
+        self._surfaces = visible
+        return visible
+
+    def update(self, surface, events=None):
+        """Scroll and display table"""
+        self.track(events)
+        self.step()
+        return super().update(surface, events=events)
+
+    def display(self, surface, **params):
+        """Display header and visible rows, partly visible rows clipped"""
+        x0, y0 = self.position
+        width = min(sum(self.columns), self.size[0])
+        if self.header is not None:
+            if self._header is None:
+                self._header = pg.Surface(
+                    (sum(self.columns), self.row_height), pg.SRCALPHA
+                )
+                self.compose(self._header, self.header, params['header_color'])
+            draw.blit(
+                surface, self._header, (x0, y0),
+                area=pg.Rect(0, 0, width, min(self.size[1], self.row_height)),
+            )
+            y0 += self.header_height
+
+        first, last = self.visible_range()
+        visible = self.materialize(first, last)
+        top = round(self._offset)
+        bottom = top + self.body_height
+        height = self.row_height
+        for index in range(first, last):
+            y = index * height
+            clip_top = max(0, top - y)
+            clip_bot = min(height, bottom - y)
+            if clip_bot <= clip_top:
+                continue
+            draw.blit(
+                surface, visible[index], (x0, y0 + y + clip_top - top),
+                area=pg.Rect(0, clip_top, width, clip_bot - clip_top),
+            )
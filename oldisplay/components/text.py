@@ -1,8 +1,11 @@
 """Objects to draw text"""
 import pygame as pg
 
+from oldisplay import draw
+from oldisplay.caches import Cache
 from oldisplay.collections import Color, FontManager
 from .component import LocatedObject
+from .hitmask import hit
 from .shape import ActiveShape, Shape2D
 
 
@@ -46,11 +49,11 @@ class Text(LocatedObject, Shape2D):
         super().__init__(ref_pos=ref_pos, size=None, **kwargs)
         self._string = string
         self._rotate = rotate
-        self._surfaces = {}
+        self._surfaces = Cache("text_surfaces")
 
     def init(self, *args, **kwargs):
-        """Initiate font and surface cache, requires pygame.init()"""
-        self.size = self.get_surf().get_size()
+        """Initiate size of text, requires pygame.init()"""
+        self.size = self.get_size()
 
     @property
     def string(self):
@@ -67,7 +70,7 @@ class Text(LocatedObject, Shape2D):
         params = self.params if params is None else params
         font = FontManager.get(**params)
         color = Color.get(params['color'])
-        key = (font, color)
+        key = (FontManager.key(**params), color)  # fonts can be evicted
         try:
             return self._surfaces[key]
         except KeyError:
@@ -75,13 +78,46 @@ class Text(LocatedObject, Shape2D):
         surf = font.render(self.string, True, color)
         if self.rotate:
             surf = pg.transform.rotate(surf, self.rotate)
+        self.forget_renders()
         self._surfaces[key] = surf
         return surf
 
+    @property
+    def looks(self):
+        """Look parameters text can be displayed with (list)"""
+        return [self.params]
+
+    def forget_renders(self):
+        """Drop renders of looks text no longer has
+
+        About:
+            Colors of an animation are rendered once each, only renders of
+            current looks are kept
+        """
+        keys = {
+            (FontManager.key(**params), Color.get(params['color']))
+            for params in self.looks
+        }
+        for key in [key for key in self._surfaces if key not in keys]:
+            del self._surfaces[key]
+
+    def get_size(self, params=None):
+        """Size of text, only rendered when text is rotated"""
+        params = self.params if params is None else params
+        font = FontManager.get(**params)
+        key = (FontManager.key(**params), Color.get(params['color']))
+        try:
+            return self._surfaces[key].get_size()
+        except KeyError:
+            pass
+        if self.rotate:
+            return self.get_surf(params).get_size()
+        return font.size(self.string)
+
     def get_pos(self, params=None):
         """Position of text"""
         params = self.params if params is None else params
-        size = self.get_surf(params).get_size()
+        size = self.get_size(params)
         return self.cls.position_func(
             self.ref_pos, size, self.h_align, self.v_align
         )
@@ -94,15 +130,301 @@ class Text(LocatedObject, Shape2D):
         """
         surf = self.get_surf(params=params)
         position = self.get_pos(params=params)
-        surface.blit(surf, position)
+        draw.blit(surface, surf, position)
 
 
 class ActiveText(Text, ActiveShape):
     """Text with look change when hovered or clicked"""
 
+    def __init__(self, string, ref_pos, rotate=None, pixel_perfect=False,
+                 **kwargs):
+        """Initiate params of text to display
+
+        Args:
+            pixel_perfect (bool)    : only react on pixels of characters
+                rather than on box of text (useful for rotated texts)
+            @see Text
+        """
+        super().__init__(string, ref_pos, rotate=rotate, **kwargs)
+        self.pixel_perfect = pixel_perfect
+
+    @property
+    def looks(self):
+        """Look parameters of each state (list)"""
+        return [self.params_n, self.params_h, self.params_c]
+
     def is_within(self, position):
         """Return whether position is within hit box"""
+        if self.pixel_perfect:
+            params = self.params_n
+            return hit(self.get_surf(params), self.get_pos(params), position)
         x, y = position
         sx, sy = self.position
         dx, dy = self.size
         return (sx < x < sx+dx) and (sy < y < sy+dy)
+
+
+class GlyphText(LocatedObject, Shape2D):
+    """Text that can change at each frame without rendering fonts
+
+    About:
+        Text is composed of glyphs rendered once per font and color
+        (@see FontManager.layout), changing string (counters, timers, ...)
+        only blits cached glyphs. No rotation available.
+    """
+
+    dft_look = Text.dft_look
+    par_conv = Text.par_conv
+
+    def __init__(self, string, ref_pos, **kwargs):
+        """Initiate params of text to display
+
+        Args:
+            string (str)            : text displayed, can be changed
+            ref_pos (2-int-tuple)   : position of text
+            align (str)             : alignment with ref_pos
+                'center', 'top-left', 'bot-right', 'top-center', ...
+
+            # Aspect parameters
+            height (int)            : height of text in pixels
+            font (str)              : name of font
+                @see pygame.font.get_fonts()
+            color (color descr)     : color of display
+            bold (bool)             : use bold writing
+            italic  (bool)          : use italic writing
+            underline (bool)        : underline writing
+        """
+        super().__init__(ref_pos=ref_pos, size=None, **kwargs)
+        self._string = str(string)
+        self._glyphs = None
+
+    def init(self, *args, **kwargs):
+        """Compose text, requires pygame.init()"""
+        self.compose()
+
+    @property
+    def string(self):
+        """Text displayed (str)"""
+        return self._string
+
+    @string.setter
+    def string(self, value):
+        """Change text displayed"""
+        value = str(value)
+        if value == self._string:
+            return
+        self._string = value
+        self._glyphs = None
+        self.invalidate()
+
+    def compose(self):
+        """Compute glyphs of text and size of text"""
+        glyphs, width = FontManager.layout(self._string, **self.params)
+        height = FontManager.get(**self.params).get_height()
+        self._glyphs = glyphs
+        if self.size != (width, height):
+            self.size = (width, height)
+        return glyphs
+
+    def display(self, surface, **params):
+        """Display text
+
+        Args:
+            surface (pygame.Surface): surface to draw on (can be a screen)
+        """
+        glyphs = self.compose() if self._glyphs is None else self._glyphs
+        x0, y0 = self.position
+        draw.blits(surface, [(glyph, (x0 + x, y0)) for glyph, x in glyphs])
+
+
+class Paragraph(LocatedObject, Shape2D):
+    """Text wrapped on words to fit the width of a box
+
+    About:
+        Line breaks are computed with font metrics (no rendering) and cached
+        by text wrapped, width and font. Only lines that were not displayed
+        before are rendered. Text added at the end of a paragraph (through
+        append or string) only wraps again the last line of paragraph with
+        the text added: streamed text does not fill cache with every
+        intermediate paragraph.
+    """
+
+    dft_look = Text.dft_look
+    par_conv = Text.par_conv
+
+    wrap_cache = Cache("paragraph_wraps", max_entries=1024)
+    # (text, width, font key): lines
+
+    _width = None  # width used to wrap paragraphs
+
+    def __init__(self, string, ref_pos, size, spacing=0, **kwargs):
+        """Initiate params of paragraph to display
+
+        Args:
+            string (str)            : text displayed, "\\n" starts a new
+                paragraph
+            ref_pos (2-int-tuple)   : reference position of box
+            size (2-int-tuple)      : size of box in pixels
+                lines out of box are not displayed
+            spacing (int)           : number of pixels b/w lines
+            align (str)             : alignment with ref_pos
+                'center', 'top-left', 'bot-right', 'top-center', ...
+
+            # Aspect parameters
+            @see Text
+        """
+        super().__init__(ref_pos=ref_pos, size=size, **kwargs)
+        self.spacing = spacing
+        self._string = ""
+        self._paragraphs = []  # list of (paragraph, lines)
+        self._width = size[0]
+        self._surfaces = Cache("paragraph_lines")
+        self._surfaces_key = None  # font and color of rendered lines
+        self.string = string
+
+    @property
+    def string(self):
+        """Text displayed (str)"""
+        return self._string
+
+    @string.setter
+    def string(self, value):
+        """Change text displayed"""
+        prev = self._paragraphs if self._width == self.size[0] else []
+        self._string = value
+        self._width = self.size[0]
+        self._paragraphs = [
+            self.extend(prev[i] if i < len(prev) else None, paragraph)
+            for i, paragraph in enumerate(value.split("\n"))
+        ]
+        self.invalidate()
+
+    def extend(self, wrapped, paragraph):
+        """Wrap paragraph, only wrapping its end again if it extends wrapped
+
+        Args:
+            wrapped (tuple)     : (paragraph, lines) previously wrapped
+            paragraph (str)     : paragraph to wrap
+
+        Return:
+            (tuple): (paragraph, lines)
+        """
+        if wrapped is None or not paragraph.startswith(wrapped[0]):
+            return paragraph, self.wrap(paragraph)
+        head, lines = wrapped
+        if head == paragraph:
+            return wrapped
+        # Lines before last one are not affected by text added
+        tail = self.wrap(lines[-1] + paragraph[len(head):])
+        return paragraph, lines[:-1] + tail
+
+    def append(self, string):
+        """Add string at the end of text"""
+        first, *others = string.split("\n")
+        wrapped = self._paragraphs.pop()
+        self._paragraphs.append(self.extend(wrapped, wrapped[0] + first))
+        self._paragraphs.extend(
+            (paragraph, self.wrap(paragraph)) for paragraph in others
+        )
+        self._string += string
+        self.invalidate()
+
+    def invalidate(self):
+        """Wrap text again once width of box changed and notify container"""
+        if self._width is not None and self.size[0] != self._width:
+            self.string = self._string  # invalidates again
+            return
+        super().invalidate()
+
+    @property
+    def lines(self):
+        """Lines of text once wrapped (list[str])"""
+        return [line for _, lines in self._paragraphs for line in lines]
+
+    # ----------------------------------------------------------------------- #
+    # Layout
+
+    def wrap(self, paragraph):
+        """Return lines of a paragraph fitting width of box"""
+        width = self.size[0]
+        key = (paragraph, width, FontManager.key(**self.params))
+        try:
+            return self.cls.wrap_cache[key]
+        except KeyError:
+            pass
+
+        font = FontManager.get(**self.params)
+        lines = []
+        line = None
+        for word in paragraph.split(" "):
+            candidate = word if line is None else f"{line} {word}"
+            if font.size(candidate)[0] <= width:
+                line = candidate
+                continue
+            if line is not None:
+                lines.append(line)
+            # Cut words longer than box
+            while font.size(word)[0] > width and len(word) > 1:
+                cut = self.cut(font, word, width)
+                lines.append(word[:cut])
+                word = word[cut:]
+            line = word
+        lines.append("" if line is None else line)
+
+        self.cls.wrap_cache[key] = lines
+        return lines
+
+    @staticmethod
+    def cut(font, word, width):
+        """Length of longest start of word fitting width (at least 1)
+
+        About:
+            Binary search, O(log n) calls to font.size for a word of n chars
+        """
+        low, high = 1, len(word) - 1  # start of low chars fits or is a char
+        while low < high:
+            middle = (low + high + 1) // 2
+            if font.size(word[:middle])[0] <= width:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def get_line_surf(self, line, params=None):
+        """Surface of a line of text (pygame.Surface)
+
+        About:
+            Lines rendered with other look parameters are forgotten
+        """
+        params = self.params if params is None else params
+        key = (FontManager.key(**params), Color.get(params['color']))
+        if key != self._surfaces_key:
+            self._surfaces.clear()
+            self._surfaces_key = key
+        try:
+            return self._surfaces[line]
+        except KeyError:
+            pass
+        font = FontManager.get(**params)
+        surf = self._surfaces[line] = font.render(line, True, key[1])
+        return surf
+
+    def display(self, surface, **params):
+        """Display lines fitting in box
+
+        Args:
+            surface (pygame.Surface): surface to draw on (can be a screen)
+        """
+        x0, y0 = self.position
+        step = FontManager.get(**params).get_linesize() + self.spacing
+        lines = self.lines[:max(0, (self.size[1] - step) // step + 1)]
+        draw.blits(surface, [
+            (self.get_line_surf(line, params), (x0, y0 + i * step))
+            for i, line in enumerate(lines)
+        ])
+
+        # Forget lines that are no longer displayed
+        if len(self._surfaces) > len(lines):
+            kept = set(lines)
+            for line in [line for line in self._surfaces if line not in kept]:
+                del self._surfaces[line]
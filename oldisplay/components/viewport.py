@@ -0,0 +1,428 @@
+"""Objects to display a world larger than the screen"""
+import math
+
+import pygame as pg
+
+from oldisplay import draw
+from oldisplay.caches import Cache
+from .component import ActiveComponent, Component, LocatedObject
+
+
+class TileCache:
+    """Static components of a world rendered by square tiles
+
+    About:
+        A tile is rendered once, the first time it is visible, and then reused
+        until a static component notifies a change. Tiles are also kept scaled
+        to the zoom of viewport so that frames at a steady zoom only blit
+        them, scaled tiles are dropped when zoom changes.
+    """
+
+    def __init__(self, viewport, components, tile_size, max_tiles=None):
+        """Initialize tile cache
+
+        Args:
+            viewport (Viewport)     : viewport using tiles
+            components (list)       : static components (world coordinates)
+            tile_size (int)         : size of tiles in pixels (world scale)
+            max_tiles (int)         : max number of tiles kept in memory
+                least recently used tiles are dropped first
+        """
+        self.viewport = viewport
+        self.tile_size = tile_size
+        self.max_tiles = max_tiles
+        self.components = []
+        self._tiles = Cache("viewport_tiles", max_entries=max_tiles)
+        self._scaled = Cache("viewport_scaled_tiles", max_entries=max_tiles)
+        self._zoom = None  # zoom of scaled tiles
+        self._index = None
+        for component in components:
+            self.add(component)
+
+    def add(self, component):
+        """Add a static component"""
+        component._parent = self
+        self.components.append(component)
+        self.invalidate_cache()
+
+    def remove(self, component):
+        """Remove a static component"""
+        self.components.remove(component)
+        component._parent = None
+        self.invalidate_cache()
+
+    def init(self, surface):
+        """Initiate static components"""
+        for component in self.components:
+            component.init(surface)
+        self.clear()
+
+    def clear(self):
+        """Drop all rendered tiles"""
+        self._tiles.clear()
+        self._scaled.clear()
+        self._index = None
+
+    def invalidate_cache(self):
+        """Drop rendered tiles as a static component changed"""
+        self.clear()
+        self.viewport.invalidate()
+
+    def to_inner(self, position):
+        """Convert a screen position to world coordinates"""
+        return self.viewport.to_inner(position)
+
+    def __len__(self):
+        return len(self._tiles)
+
+    # ----------------------------------------------------------------------- #
+    # Tiles
+
+    def tile_range(self, rect):
+        """Return (i, j) indexes of tiles overlapping rect"""
+        size = self.tile_size
+        return (
+            (i, j)
+            for i in range(rect.left // size, (rect.right - 1) // size + 1)
+            for j in range(rect.top // size, (rect.bottom - 1) // size + 1)
+        )
+
+    def build_index(self):
+        """Map (i, j) tile indexes to static components overlapping them"""
+        index = {}
+        unbounded = []
+        for rank, component in enumerate(self.components):
+            bbox = component.bbox
+            if bbox is None:
+                unbounded.append((rank, component))
+                continue
+            for key in self.tile_range(bbox):
+                index.setdefault(key, []).append((rank, component))
+        self._index = (index, unbounded)
+        return self._index
+
+    def get(self, i, j):
+        """Return surface of tile (i, j), render it if needed"""
+        key = (i, j)
+        try:
+            return self._tiles[key]
+        except KeyError:
+            pass
+
+        index, unbounded = (
+            self.build_index() if self._index is None else self._index
+        )
+        ranked = index.get(key, [])
+        if unbounded:
+            ranked = sorted(ranked + unbounded, key=lambda item: item[0])
+        size = self.tile_size
+        tile = pg.Surface((size, size), pg.SRCALPHA)
+        with draw.translate(tile, (-i * size, -j * size)):
+            for _, component in ranked:
+                component.update(tile)
+
+        self._tiles[key] = tile
+        return tile
+
+    def get_scaled(self, i, j, zoom):
+        """Return surface of tile (i, j) scaled to zoom, scale it if needed
+
+        About:
+            Scaled size is the difference of rounded screen positions of tile
+            edges so that tiles join without gap nor overlap
+        """
+        if zoom == 1:
+            return self.get(i, j)
+        if zoom != self._zoom:
+            self._scaled.clear()
+            self._zoom = zoom
+        key = (i, j)
+        try:
+            return self._scaled[key]
+        except KeyError:
+            pass
+        size = self.tile_size
+        scaled = self._scaled[key] = pg.transform.scale(self.get(i, j), (
+            round((i + 1) * size * zoom) - round(i * size * zoom),
+            round((j + 1) * size * zoom) - round(j * size * zoom),
+        ))
+        return scaled
+
+    def display(self, surface, area, view, origin, zoom):
+        """Blit tiles covering view on area of surface
+
+        Args:
+            surface (pygame.Surface): surface to draw on
+            area (pygame.Rect)      : area of surface showing view
+            view (pygame.Rect)      : visible area of world
+            origin (2-num-tuple)    : world position shown at top-left of area
+            zoom (float)            : screen pixels per world pixel
+        """
+        size = self.tile_size
+        x0 = area.left - round(origin[0] * zoom)
+        y0 = area.top - round(origin[1] * zoom)
+        for i, j in self.tile_range(view):
+            tile = self.get_scaled(i, j, zoom)
+            x = x0 + round(i * size * zoom)
+            y = y0 + round(j * size * zoom)
+            blit_clipped(surface, tile, (x, y), area)
+
+
+def blit_clipped(surface, source, dest, area):
+    """Blit source at dest on surface, only the part within area"""
+    rect = pg.Rect(dest, source.get_size()).clip(area)
+    if not rect.width or not rect.height:
+        return
+    draw.blit(
+        surface, source, rect.topleft,
+        area=rect.move(-dest[0], -dest[1]),
+    )
+
+
+class Viewport(LocatedObject, Component):
+    """Area of screen showing part of a world through a camera
+
+    About:
+        Components of viewport are located in world coordinates, the camera
+        defines which part of the world is visible (origin) and at which
+        scale (zoom). Components out of sight are skipped.
+
+        Static components are rendered once by tiles (@see TileCache) so that
+        panning reuses what has already been drawn, dynamic components are
+        drawn at each frame.
+    """
+
+    def __init__(self, ref_pos, size, components=None, static=None,
+                 origin=(0, 0), zoom=1, tile_size=256, max_tiles=None,
+                 **kwargs):
+        """Initialize a viewport
+
+        Args:
+            ref_pos (2-int-tuple)   : reference position of viewport
+                default is top-left
+            size (2-int-tuple)      : size of viewport on screen in pixels
+            components (list)       : dynamic components of world
+            static (list)           : static components of world
+            origin (2-num-tuple)    : world position shown at top-left
+            zoom (float)            : screen pixels per world pixel
+            tile_size (int)         : size of tiles for static components
+            max_tiles (int)         : max number of tiles kept in memory
+            align (str)             : alignment with ref_pos
+                'center', 'top-left', 'bot-right', 'top-center', ...
+        """
+        super().__init__(ref_pos, size, **kwargs)
+        self._origin = tuple(origin)
+        self._zoom = zoom
+        self._frame = None
+        self._components = []
+        self.tiles = TileCache(
+            self, [] if static is None else static,
+            tile_size=tile_size, max_tiles=max_tiles,
+        )
+        for component in ([] if components is None else components):
+            self.add(component)
+
+    # ----------------------------------------------------------------------- #
+    # Content
+
+    @property
+    def components(self):
+        """Dynamic components of world (list)"""
+        return self._components
+
+    def add(self, component, static=False):
+        """Add component to world"""
+        if static:
+            return self.tiles.add(component)
+        component._parent = self
+        self._components.append(component)
+        self.invalidate()
+
+    def remove(self, component):
+        """Remove component from world"""
+        if component in self.tiles.components:
+            return self.tiles.remove(component)
+        self._components.remove(component)
+        component._parent = None
+        self.invalidate()
+
+    def invalidate_cache(self):
+        """Notify container that a dynamic component changed"""
+        self.invalidate()
+
+    # ----------------------------------------------------------------------- #
+    # Camera
+
+    @property
+    def origin(self):
+        """World position shown at top-left of viewport"""
+        return self._origin
+
+    @origin.setter
+    def origin(self, value):
+        """Set world position shown at top-left of viewport"""
+        self._origin = tuple(value)
+        self.invalidate()
+
+    @property
+    def zoom(self):
+        """Number of screen pixels per world pixel"""
+        return self._zoom
+
+    @zoom.setter
+    def zoom(self, value):
+        """Set number of screen pixels per world pixel"""
+        assert value > 0, "zoom must be positive"
+        self._zoom = value
+        self.invalidate()
+
+    @property
+    def view(self):
+        """Visible area of world (pygame.Rect)"""
+        x0, y0 = self._origin
+        dx, dy = self.size
+        left, top = math.floor(x0), math.floor(y0)
+        return pg.Rect(
+            left, top,
+            math.ceil(x0 + dx / self._zoom) - left,
+            math.ceil(y0 + dy / self._zoom) - top,
+        )
+
+    def to_world(self, position):
+        """Convert a position relative to viewport into world coordinates"""
+        x, y = position
+        x0, y0 = self._origin
+        return x0 + x / self._zoom, y0 + y / self._zoom
+
+    def to_view(self, position):
+        """Convert a world position into a position relative to viewport"""
+        x, y = position
+        x0, y0 = self._origin
+        return (x - x0) * self._zoom, (y - y0) * self._zoom
+
+    def to_inner(self, position):
+        """Convert a screen position to world coordinates"""
+        x, y = self.to_local(position)
+        vx, vy = self.position
+        return self.to_world((x - vx, y - vy))
+
+    def pan(self, dx, dy):
+        """Move camera by (dx, dy) screen pixels"""
+        x0, y0 = self._origin
+        self.origin = (x0 + dx / self._zoom, y0 + dy / self._zoom)
+
+    def look_at(self, position):
+        """Center camera on world position"""
+        x, y = position
+        dx, dy = self.size
+        self.origin = (x - dx / 2 / self._zoom, y - dy / 2 / self._zoom)
+
+    def zoom_at(self, factor, position=None):
+        """Multiply zoom by factor keeping a viewport position still
+
+        Args:
+            factor (float)          : zoom multiplier
+            position (2-int-tuple)  : position relative to viewport
+                default is center of viewport
+        """
+        if position is None:
+            position = (self.size[0] / 2, self.size[1] / 2)
+        wx, wy = self.to_world(position)
+        x, y = position
+        self._zoom *= factor
+        self.origin = (wx - x / self._zoom, wy - y / self._zoom)
+
+    # ----------------------------------------------------------------------- #
+    # Display
+
+    def init(self, surface):
+        """Initiate components of world"""
+        self.tiles.init(surface)
+        for component in self._components:
+            component.init(surface)
+
+    def release(self, view):
+        """Reset mouse state of active components out of view
+
+        About:
+            Culled components are not tracked, they would otherwise come
+            back into view hovered or clicked
+        """
+        for component in self._components:
+            if not isinstance(component, ActiveComponent):
+                continue
+            if not (component.is_hovered or component.is_clicked):
+                continue
+            bbox = component.bbox
+            if bbox is not None and not view.colliderect(bbox):
+                component.is_hovered = component.is_clicked = False
+                component.invalidate()
+
+    def track(self, events=None):
+        """Follow events for visible dynamic components"""
+        view = self.view
+        self.release(view)
+        for component in self._components:
+            bbox = component.bbox
+            if bbox is None or view.colliderect(bbox):
+                component.track(events)
+
+    def render(self, region, events=None):
+        """Draw dynamic components on frame surface covering world region"""
+        if self._frame is None or self._frame.get_size() != region.size:
+            self._frame = pg.Surface(region.size, pg.SRCALPHA)
+        frame = self._frame
+        draw.fill(frame, (0, 0, 0, 0))
+        with draw.translate(frame, (-region.left, -region.top)):
+            for component in self._components:
+                bbox = component.bbox
+                if bbox is None or region.colliderect(bbox):
+                    component.update(frame, events=events)
+        return frame
+
+    def dynamic_region(self, view):
+        """Area of world covered by visible dynamic components, None if empty
+
+        About:
+            Whole view when a visible component has no bbox
+        """
+        region = None
+        for component in self._components:
+            bbox = component.bbox
+            if bbox is None:
+                return view
+            if not view.colliderect(bbox):
+                continue
+            region = bbox if region is None else region.union(bbox)
+        return None if region is None else region.clip(view)
+
+    def update(self, surface, events=None):
+        """Display visible part of world on surface
+
+        About:
+            Static tiles are blitted already scaled, only the part of world
+            covered by visible dynamic components is drawn at world scale and
+            scaled at each frame
+        """
+        view = self.view
+        self.release(view)
+        area = pg.Rect(self.position, self.size)
+        x0, y0 = self._origin
+        zoom = self._zoom
+        self.tiles.display(surface, area, view, self._origin, zoom)
+
+        region = self.dynamic_region(view)
+        if region is None or not region.width or not region.height:
+            return
+        frame = self.render(region, events)
+        left = round(region.left * zoom)
+        top = round(region.top * zoom)
+        if zoom != 1:
+            frame = pg.transform.scale(frame, (
+                round(region.right * zoom) - left,
+                round(region.bottom * zoom) - top,
+            ))
+        blit_clipped(surface, frame, (
+            area.left + left - round(x0 * zoom),
+            area.top + top - round(y0 * zoom),
+        ), area)
@@ -0,0 +1,359 @@
+"""Drawing primitives used by components
+
+About:
+    Components draw through those functions rather than pygame.draw so that a
+    container can change the coordinate system of a surface (@see translate):
+    components keep their own coordinates whatever the surface they are drawn
+    on (screen, cached surface of a group, tile of a viewport, ...).
+
+    Drawing on a surface can also be recorded rather than executed (@see
+    record): the display list obtained can be compared to the one of previous
+    frame and replayed on any surface. Surfaces used as sources of blits are
+    identified by a stamp renewed each time they are drawn on, components
+    writing pixels without these functions must call touch on the surface
+    they modify and draw on recorded surfaces through custom.
+"""
+import itertools
+import weakref
+from contextlib import contextmanager
+
+import numpy as np
+import pygame as pg
+
+_offsets = {
+    # surface: (dx, dy) added to any position drawn on surface
+}
+_recorders = {
+    # surface: display list recording drawings on surface
+}
+_stamps = weakref.WeakKeyDictionary()  # surface: stamp of its content
+_counter = itertools.count()
+
+
+@contextmanager
+def translate(surface, offset):
+    """Shift positions drawn on surface by offset within context
+
+    Args:
+        surface (pygame.Surface): surface to draw on
+        offset (2-int-tuple)    : (dx, dy) shift in pixels
+            offsets of nested contexts add up
+    """
+    prev = _offsets.get(surface)
+    dx, dy = offset
+    if prev is not None:
+        dx, dy = dx + prev[0], dy + prev[1]
+    _offsets[surface] = (dx, dy)
+    try:
+        yield
+    finally:
+        if prev is None:
+            del _offsets[surface]
+        else:
+            _offsets[surface] = prev
+
+
+def get_offset(surface):
+    """Return current (dx, dy) shift of positions drawn on surface"""
+    return _offsets.get(surface, (0, 0))
+
+
+def _shift(offset, point):
+    """Return point shifted by offset"""
+    return point[0] + offset[0], point[1] + offset[1]
+
+
+# --------------------------------------------------------------------------- #
+# Display lists
+
+class DisplayList:
+    """Drawing commands recorded on a surface
+
+    About:
+        Commands are (function, args) called with the target surface first.
+        Their keys (name and args) give the digest of the list, two lists
+        with equal digests draw the same pixels. A list with a custom command
+        is volatile: its digest is None.
+    """
+
+    def __init__(self):
+        """Initialize an empty display list"""
+        self.commands = []
+        self.keys = []
+        self.volatile = False
+
+    def __len__(self):
+        return len(self.commands)
+
+    def add(self, func, args, key):
+        """Record call of func(surface, *args) identified by key"""
+        self.commands.append((func, args))
+        self.keys.append(key)
+
+    @property
+    def digest(self):
+        """Keys of commands (tuple) to compare lists, None if list is volatile
+
+        About:
+            Keys are compared rather than hashed: a hash collision would make
+            two different frames look identical
+        """
+        if self.volatile:
+            return None
+        return tuple(self.keys)
+
+    def replay(self, surface):
+        """Execute commands on surface"""
+        for func, args in self.commands:
+            func(surface, *args)
+
+
+@contextmanager
+def record(surface):
+    """Record drawings on surface within context instead of executing them
+
+    Examples:
+        >>> with draw.record(screen) as display_list:
+        ...     for component in components:
+        ...         component.update(screen)
+        >>> if display_list.digest != last_digest:
+        ...     display_list.replay(screen)
+
+    Return:
+        (DisplayList): commands recorded
+    """
+    display_list = DisplayList()
+    prev = _recorders.get(surface)
+    _recorders[surface] = display_list
+    try:
+        yield display_list
+    finally:
+        if prev is None:
+            del _recorders[surface]
+        else:
+            _recorders[surface] = prev
+
+
+def touch(surface):
+    """Notify that content of surface changed (renew its stamp)
+
+    About:
+        Surfaces never stamped get a stamp when first used as a source
+    """
+    if surface in _stamps:
+        _stamps[surface] = next(_counter)
+
+
+def stamp(surface):
+    """Return stamp identifying current content of surface"""
+    try:
+        return _stamps[surface]
+    except KeyError:
+        value = _stamps[surface] = next(_counter)
+        return value
+
+
+def custom(surface, func, *args):
+    """Call func(surface, *args), recorded as a volatile command if needed
+
+    About:
+        For drawings not covered by primitives (pixels written through
+        surfarray, ...). Offset of surface is restored when replayed.
+    """
+    recorder = _recorders.get(surface)
+    if recorder is None:
+        touch(surface)
+        return func(surface, *args)
+    offset = get_offset(surface)
+
+    def call(target):
+        with translate(target, offset):
+            func(target, *args)
+
+    recorder.add(call, (), None)
+    recorder.volatile = True
+
+
+# --------------------------------------------------------------------------- #
+# Primitives
+
+def fill(surface, color, rect=None):
+    """Fill surface with color (@see pygame.Surface.fill)"""
+    offset = _offsets.get(surface)
+    if offset is not None and rect is not None:
+        rect = pg.Rect(rect).move(offset)
+    recorder = _recorders.get(surface)
+    if recorder is not None:
+        rect = None if rect is None else tuple(pg.Rect(rect))
+        args = (color, rect)
+        return recorder.add(
+            pg.Surface.fill, args, ("fill", tuple(color), rect)
+        )
+    touch(surface)
+    return surface.fill(color, rect)
+
+
+def rect(surface, color, rect, width=0):
+    """Draw rectangle on surface (@see pygame.draw.rect)"""
+    offset = _offsets.get(surface)
+    if offset is not None:
+        rect = pg.Rect(rect).move(offset)
+    recorder = _recorders.get(surface)
+    if recorder is not None:
+        args = (color, tuple(pg.Rect(rect)), width)
+        return recorder.add(
+            pg.draw.rect, args, ("rect", tuple(color), *args[1:])
+        )
+    touch(surface)
+    return pg.draw.rect(surface, color, rect, width)
+
+
+def circle(surface, color, center, radius, width=0):
+    """Draw circle on surface (@see pygame.draw.circle)"""
+    offset = _offsets.get(surface)
+    if offset is not None:
+        center = _shift(offset, center)
+    recorder = _recorders.get(surface)
+    if recorder is not None:
+        args = (color, tuple(center), radius, width)
+        return recorder.add(
+            pg.draw.circle, args, ("circle", tuple(color), *args[1:])
+        )
+    touch(surface)
+    return pg.draw.circle(surface, color, center, radius, width)
+
+
+def line(surface, color, p1, p2, width=1):
+    """Draw segment on surface (@see pygame.draw.line)"""
+    offset = _offsets.get(surface)
+    if offset is not None:
+        p1, p2 = _shift(offset, p1), _shift(offset, p2)
+    recorder = _recorders.get(surface)
+    if recorder is not None:
+        args = (color, tuple(p1), tuple(p2), width)
+        return recorder.add(
+            pg.draw.line, args, ("line", tuple(color), *args[1:])
+        )
+    touch(surface)
+    return pg.draw.line(surface, color, p1, p2, width)
+
+
+def lines(surface, color, closed, points, width=1):
+    """Draw continuous line on surface (@see pygame.draw.lines)"""
+    offset = _offsets.get(surface)
+    if offset is not None:
+        points = [_shift(offset, point) for point in points]
+    recorder = _recorders.get(surface)
+    if recorder is not None:
+        points = tuple(tuple(point) for point in points)
+        args = (color, closed, points, width)
+        return recorder.add(
+            pg.draw.lines, args, ("lines", tuple(color), *args[1:])
+        )
+    touch(surface)
+    return pg.draw.lines(surface, color, closed, points, width)
+
+
+def segments(surface, color, starts, ends, width=1):
+    """Draw many segments on surface in one command
+
+    About:
+        Segments following each other (end of one is start of next) are
+        drawn as continuous lines (@see pygame.draw.lines), others one by
+        one. Command is recorded with coordinates as key.
+
+    Args:
+        surface (pygame.Surface): surface to draw on
+        color (color)           : color of segments
+        starts (array-like)     : (n, 2) first points of segments
+        ends (array-like)       : (n, 2) last points of segments
+        width (int)             : width of segments
+    """
+    starts = np.asarray(starts, dtype=np.float64).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=np.float64).reshape(-1, 2)
+    offset = _offsets.get(surface)
+    if offset is not None:
+        starts, ends = starts + offset, ends + offset
+    recorder = _recorders.get(surface)
+    if recorder is not None:
+        args = (color, starts, ends, width)
+        return recorder.add(_segments, args, (
+            "segments", tuple(color), width,
+            starts.tobytes(), ends.tobytes(),
+        ))
+    touch(surface)
+    return _segments(surface, color, starts, ends, width)
+
+
+def _segments(surface, color, starts, ends, width):
+    """Draw segments, continuous runs at once"""
+    if not len(starts):
+        return
+    breaks = np.flatnonzero((starts[1:] != ends[:-1]).any(axis=1)) + 1
+    bounds = [0, *breaks.tolist(), len(starts)]
+    starts, ends = starts.tolist(), ends.tolist()
+    line, lines = pg.draw.line, pg.draw.lines
+    for first, last in zip(bounds, bounds[1:]):
+        if last - first == 1:
+            line(surface, color, starts[first], ends[first], width)
+        else:
+            lines(
+                surface, color, False,
+                [starts[first], *ends[first:last]], width,
+            )
+
+
+def blit(surface, source, dest, area=None, special_flags=0):
+    """Draw source surface on surface (@see pygame.Surface.blit)
+
+    About:
+        Alpha of source is recorded along with the command and set back
+        when replayed: surfaces shared by components (cached images, ...) can
+        be given a different alpha by each of them.
+    """
+    offset = _offsets.get(surface)
+    if offset is not None:
+        dest = _shift(offset, dest)
+    recorder = _recorders.get(surface)
+    if recorder is not None:
+        area = None if area is None else tuple(pg.Rect(area))
+        alpha = source.get_alpha()
+        args = (source, alpha, tuple(dest), area, special_flags)
+        return recorder.add(
+            _blit, args, ("blit", stamp(source), *args[1:])
+        )
+    touch(surface)
+    return surface.blit(source, dest, area, special_flags)
+
+
+def _blit(surface, source, alpha, dest, area, special_flags):
+    """Replay blit command"""
+    source.set_alpha(alpha)
+    surface.blit(source, dest, area, special_flags)
+
+
+def blits(surface, sequence):
+    """Draw (source, dest) surfaces on surface (@see pygame.Surface.blits)"""
+    offset = _offsets.get(surface)
+    if offset is not None:
+        sequence = [
+            (source, _shift(offset, dest)) for source, dest in sequence
+        ]
+    recorder = _recorders.get(surface)
+    if recorder is not None:
+        sequence = [(source, tuple(dest)) for source, dest in sequence]
+        alphas = [source.get_alpha() for source, _ in sequence]
+        key = tuple(
+            (stamp(source), alpha, dest)
+            for (source, dest), alpha in zip(sequence, alphas)
+        )
+        return recorder.add(_blits, (sequence, alphas), ("blits", key))
+    touch(surface)
+    return surface.blits(sequence, doreturn=False)
+
+
+def _blits(surface, sequence, alphas):
+    """Replay blits command"""
+    for (source, _), alpha in zip(sequence, alphas):
+        source.set_alpha(alpha)
+    surface.blits(sequence, doreturn=False)
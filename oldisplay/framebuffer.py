@@ -0,0 +1,227 @@
+"""Tools to read frames displayed by a window without copying them"""
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pygame as pg
+
+_created = set()  # names of blocks created by this process
+
+
+@contextmanager
+def frame_view(surface):
+    """Give access to pixels of surface without copy
+
+    About:
+        The surface is locked as long as the view (or an array sharing its
+        memory) exists, no reference must be kept once the frame is read. Use
+        it within a frame hook of a window (@see Window.frame_hooks) to read a
+        frame once it has been drawn and before it is displayed.
+
+    Examples:
+        >>> def analyse(screen, ticks):
+        ...     with frame_view(screen) as pixels:
+        ...         mean = pixels.mean(axis=(0, 1))
+        >>> window.frame_hooks.append(analyse)
+
+    Return:
+        (numpy.ndarray): (width, height, 3) array of uint8 (x, y indexing)
+    """
+    pixels = pg.surfarray.pixels3d(surface)
+    try:
+        yield pixels
+    finally:
+        del pixels
+
+
+class SharedFrameRing:
+    """Ring of frames in shared memory readable by other local processes
+
+    About:
+        Each published frame gets a sequence number and is written in slot
+        (sequence % slots). A slot is marked as being written while copied so
+        that readers never return a torn frame.
+
+        Frames are stored as (width, height, 3) arrays of uint8 (x, y
+        indexing), as given by pygame.surfarray.
+
+    Examples:
+        >>> ring = SharedFrameRing.create((700, 700), name="screen")
+        >>> window.frame_hooks.append(ring.publish)
+        ... # In another process
+        >>> reader = SharedFrameRing.attach("screen")
+        >>> seq, frame = reader.read()
+    """
+
+    _version = 1
+    _header = 5  # version, width, height, slots, last sequence
+    _writing = -1
+
+    def __init__(self, shm, owner=False):
+        """Initialize ring over shared memory, @see create and attach"""
+        self.shm = shm
+        self.owner = owner
+        header = np.ndarray((self._header,), np.int64, buffer=shm.buf)
+        version, width, height, slots, _ = header
+        if version != self._version:
+            raise ValueError(
+                f"Shared memory '{shm.name}' is not a frame ring"
+                f" (version={version})"
+            )
+        self.size = (int(width), int(height))
+        self.slots = int(slots)
+        self._header_arr = header
+        self._seqs = np.ndarray(
+            (self.slots,), np.int64, buffer=shm.buf,
+            offset=self._header * 8,
+        )
+        self._frames = np.ndarray(
+            (self.slots, width, height, 3), np.uint8, buffer=shm.buf,
+            offset=(self._header + self.slots) * 8,
+        )
+
+    @classmethod
+    def nbytes(cls, size, slots):
+        """Size of shared memory required for a ring"""
+        width, height = size
+        return (cls._header + slots) * 8 + slots * width * height * 3
+
+    @classmethod
+    def create(cls, size, slots=4, name=None):
+        """Create a ring of frames in a new shared memory block
+
+        Args:
+            size (2-int-tuple)  : size of frames in pixels
+            slots (int)         : number of frames kept
+            name (str)          : name of shared memory block
+                default is a random name (@see self.name)
+        """
+        assert slots > 1
+        shm = shared_memory.SharedMemory(
+            name=name, create=True, size=cls.nbytes(size, slots)
+        )
+        header = np.ndarray((cls._header,), np.int64, buffer=shm.buf)
+        header[:] = (cls._version, size[0], size[1], slots, -1)
+        seqs = np.ndarray(
+            (slots,), np.int64, buffer=shm.buf, offset=cls._header * 8
+        )
+        seqs[:] = cls._writing
+        _created.add(shm.name)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """Attach to an existing ring of frames
+
+        About:
+            Until python 3.13, attaching registers the block to resource
+            tracker of process, which unlinks it when process exits although
+            it belongs to the creator: it is unregistered right away (unless
+            block was created by this process)
+        """
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:  # python < 3.13
+            shm = shared_memory.SharedMemory(name=name)
+            if shared_memory._USE_POSIX and name not in _created:
+                resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(shm)
+
+    @property
+    def name(self):
+        """Name of shared memory block"""
+        return self.shm.name
+
+    @property
+    def sequence(self):
+        """Sequence number of last published frame (-1 if none)"""
+        return int(self._header_arr[4])
+
+    # ----------------------------------------------------------------------- #
+    # Writing
+
+    def publish(self, surface, frame=None):
+        """Copy surface in next slot of ring
+
+        Args:
+            surface (pygame.Surface): frame to publish
+            frame (int)             : unused, allows use as a frame hook
+
+        Return:
+            (int): sequence number of frame
+        """
+        if surface.get_size() != self.size:
+            raise ValueError(
+                f"Frame size {surface.get_size()} differs from ring size"
+                f" {self.size}"
+            )
+        seq = self.sequence + 1
+        slot = seq % self.slots
+        self._seqs[slot] = self._writing
+        pg.pixelcopy.surface_to_array(self._frames[slot], surface)
+        self._seqs[slot] = seq
+        self._header_arr[4] = seq
+        return seq
+
+    # ----------------------------------------------------------------------- #
+    # Reading
+
+    def view(self, seq=None):
+        """Return frame without copy
+
+        About:
+            The frame is overwritten once (slots - 1) other frames have been
+            published, check is_valid(seq) after reading it
+
+        Args:
+            seq (int): sequence number of frame, default is last one
+
+        Return:
+            (int, numpy.ndarray): sequence number and frame
+                (None, None) if frame is not available
+        """
+        seq = self.sequence if seq is None else seq
+        if seq < 0 or not self.is_valid(seq):
+            return None, None
+        return seq, self._frames[seq % self.slots]
+
+    def is_valid(self, seq):
+        """Whether frame with sequence number seq is still in ring"""
+        return int(self._seqs[seq % self.slots]) == seq
+
+    def read(self, seq=None, retries=8):
+        """Return a copy of frame
+
+        Args:
+            seq (int)       : sequence number of frame, default is last one
+            retries (int)   : number of attempts when last frame is being
+                overwritten during copy
+
+        Return:
+            (int, numpy.ndarray): sequence number and frame
+                (None, None) if frame is not available
+        """
+        for _ in range(retries):
+            frame_seq, frame = self.view(seq)
+            if frame_seq is None:
+                return None, None
+            frame = frame.copy()
+            if self.is_valid(frame_seq):
+                return frame_seq, frame
+            if seq is not None:
+                return None, None
+        return None, None
+
+    def close(self):
+        """Close access to ring, free memory if ring was created here"""
+        self._header_arr = self._seqs = self._frames = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+            _created.discard(self.shm.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,240 @@
+"""Tools to record and replay inputs of a window
+
+About:
+    Components read the mouse position through get_mouse_pos, which can be
+    overridden (@see set_mouse_pos) so that recorded sessions are replayed
+    without any device.
+
+    A recording is a gzip file of json lines, data only: a header, then for
+    each frame with events or a mouse move, [frame index, mouse position or
+    null if unchanged, [[event type, event attributes], ...]]. Attributes
+    that are not plain data (numbers, strings, sequences of them) are not
+    recorded.
+
+Examples:
+    Record a session:
+    >>> recorder = EventRecorder("session.ole")
+    >>> recorder.attach(window)
+    >>> window.open()
+    >>> window.wait_close()
+    >>> recorder.close()
+
+    Replay it as a benchmark:
+    >>> report = replay("session.ole", window)
+    >>> print(report['mean'], report['p95'])
+"""
+import gzip
+import json
+import os
+import time
+
+import numpy as np
+import pygame as pg
+
+EVENTS_VERSION = 2
+
+_mouse_pos = None  # position returned instead of the actual mouse position
+_PLAIN = (bool, int, float, str, type(None))
+
+
+def get_mouse_pos():
+    """Return position of mouse (overridden position when one is set)"""
+    if _mouse_pos is None:
+        return pg.mouse.get_pos()
+    return _mouse_pos
+
+
+def set_mouse_pos(position):
+    """Override position of mouse, None to use actual mouse again"""
+    global _mouse_pos
+    _mouse_pos = None if position is None else tuple(position)
+
+
+# --------------------------------------------------------------------------- #
+# Recording
+
+class EventRecorder:
+    """Record events processed by a window and mouse positions per frame"""
+
+    def __init__(self, path):
+        """Initialize a recorder
+
+        Args:
+            path (str): path of recording file
+        """
+        self.path = path
+        self.file = None
+        self.records = 0  # number of frames recorded
+        self._mouse_pos = None
+
+    def start(self, size=None):
+        """Open recording file
+
+        Args:
+            size (2-int-tuple): size of recorded window
+        """
+        self.file = gzip.open(self.path, "wt", compresslevel=6)
+        self._write({'version': EVENTS_VERSION, 'size': size})
+
+    def _write(self, record):
+        """Write a record as a json line"""
+        self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def capture(self, frame, events, mouse_pos):
+        """Record events and mouse position of a frame"""
+        if mouse_pos == self._mouse_pos:
+            mouse_pos = None
+        else:
+            self._mouse_pos = mouse_pos
+        if mouse_pos is None and not events:
+            return
+        self._write([frame, mouse_pos, [
+            [event.type, _plain_attributes(event.dict)] for event in events
+        ]])
+        self.records += 1
+
+    def attach(self, window):
+        """Record each frame of window (through a frame hook)"""
+        if self.file is None:
+            self.start(window.settings.size)
+
+        def hook(screen, ticks):
+            self.capture(ticks, window.events, get_mouse_pos())
+
+        window.frame_hooks.append(hook)
+        return hook
+
+    def close(self):
+        """Close recording file"""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _is_plain(value):
+    """Whether value is json data read back as is (sequences as tuples)"""
+    if isinstance(value, (tuple, list)):
+        return all(_is_plain(item) for item in value)
+    return isinstance(value, _PLAIN)
+
+
+def _plain_attributes(attributes):
+    """Attributes of event that can be recorded"""
+    return {
+        key: value for key, value in attributes.items() if _is_plain(value)
+    }
+
+
+def _as_tuple(value):
+    """Convert json lists back into tuples"""
+    if isinstance(value, list):
+        return tuple(_as_tuple(item) for item in value)
+    return value
+
+
+def read_events(path):
+    """Read a recording
+
+    Return:
+        (dict, list): header of recording and list of (frame index, mouse
+            position or None, list of pygame events)
+    """
+    records = []
+    with gzip.open(path, "rt") as file:
+        try:
+            header = json.loads(file.readline())
+        except ValueError:
+            header = None
+        if not isinstance(header, dict) or (
+                header.get('version') != EVENTS_VERSION):
+            raise ValueError(f"{path} is not an event recording")
+        header['size'] = _as_tuple(header['size'])
+        for line in file:
+            frame, mouse_pos, events = json.loads(line)
+            records.append((frame, _as_tuple(mouse_pos), [
+                pg.event.Event(kind, {
+                    key: _as_tuple(value) for key, value in attributes.items()
+                })
+                for kind, attributes in events
+            ]))
+    return header, records
+
+
+# --------------------------------------------------------------------------- #
+# Replay
+
+def summarize(times):
+    """Statistics of frame durations
+
+    Args:
+        times (numpy.ndarray): duration of each frame in seconds
+
+    Return:
+        (dict): 'frames', 'total', 'mean', 'p50', 'p95', 'p99', 'max'
+            (in seconds) and 'fps' (frames per second)
+    """
+    if not len(times):
+        return {'frames': 0, 'times': times}
+    total = float(times.sum())
+    return {
+        'frames': len(times),
+        'times': times,
+        'total': total,
+        'mean': float(times.mean()),
+        'p50': float(np.percentile(times, 50)),
+        'p95': float(np.percentile(times, 95)),
+        'p99': float(np.percentile(times, 99)),
+        'max': float(times.max()),
+        'fps': len(times) / total if total else float("inf"),
+    }
+
+
+def replay(path, window, frames=None):
+    """Replay a recording on window, headless and as fast as possible
+
+    About:
+        Window is started without display (SDL dummy driver unless another
+        driver is set), recorded events and mouse positions are fed to each
+        frame and the duration of each frame is measured.
+
+    Args:
+        path (str)      : path of recording
+        window (Window) : window with components to replay session on
+        frames (int)    : number of frames to replay
+            default is up to last recorded frame
+
+    Return:
+        (dict): statistics of frame durations (@see summarize)
+            'times' -> duration of each frame in seconds
+    """
+    _, records = read_events(path)
+    if frames is None:
+        frames = records[-1][0] + 1 if records else 0
+    by_frame = {frame: (pos, events) for frame, pos, events in records}
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    times = np.zeros(frames)
+    window.start()
+    try:
+        for frame in range(frames):
+            pos, events = by_frame.get(frame, (None, []))
+            if pos is not None:
+                set_mouse_pos(pos)
+            pg.event.get()  # keep window responsive, actual inputs ignored
+            start = time.perf_counter()
+            window.draw_frame(events=events)
+            times[frame] = time.perf_counter() - start
+            window.ticks += 1
+            if window.stop:
+                times = times[:frame + 1]
+                break
+    finally:
+        set_mouse_pos(None)
+        window.end()
+    return summarize(times)
@@ -0,0 +1,314 @@
+"""Tools to find allocations and garbage collection pauses of frames
+
+About:
+    A FrameProfiler attached to a window (@see Window.profiler) measures
+    each phase of its frames:
+        'events'            : getting events from pygame queue
+        'clean'             : filling screen with background
+        'update:<Class>'    : updating components, by class of component
+        'replay'            : drawing recorded frame (skip_identical setting)
+        'hooks'             : frame hooks
+        'flip'              : displaying frame
+    For each phase, it accounts time spent, bytes allocated (peak of traced
+    memory during phase, through tracemalloc), bytes retained and garbage
+    collections triggered (through gc callbacks) with their pause time.
+    Tracing allocations slows frames down, this is a diagnostic mode.
+
+    An IdleCollector replaces automatic garbage collection of a window:
+    objects alive once window is started (components, fonts, caches, ...) are
+    frozen (@see gc.freeze) so that collections do not go through them, and
+    collections run at the end of frames that leave enough time before next
+    one. A collection is forced when garbage piles up (frames never leaving
+    enough time).
+
+Examples:
+    Find which components allocate:
+    >>> profiler = FrameProfiler()
+    >>> profiler.attach(window)
+    >>> replay("session.ole", window)
+    >>> profiler.detach(window)
+    >>> profiler.report()
+    {'update:Text': {'calls': 300, 'time': 0.08, 'allocated': 5242880, ...
+
+    Collect garbage in idle time:
+    >>> collector = IdleCollector(min_slack=0.003)
+    >>> collector.attach(window)
+    >>> window.open()
+"""
+import gc
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import numpy as np
+
+STATS = ['calls', 'time', 'allocated', 'retained', 'collections', 'gc_time']
+
+
+# --------------------------------------------------------------------------- #
+# Profiling
+
+class FrameProfiler:
+    """Account allocations and garbage collections of frames by phase"""
+
+    clock = staticmethod(time.perf_counter)  # current time in seconds
+
+    def __init__(self, frames=1000, traceback=1):
+        """Initialize a profiler
+
+        Args:
+            frames (int)    : number of last frames to keep statistics of
+            traceback (int) : number of frames stored in allocation traces
+                (@see tracemalloc.start)
+        """
+        self.frames = frames
+        self.traceback = traceback
+        self.phases = {}  # phase: dict of stats (@see STATS)
+        self.history = []  # stats of last frames, dict with keys of STATS
+
+        self._phase = None  # phase running
+        self._frame = None  # stats of frame running
+        self._frame_start = None
+        self._gc_start = None
+        self._tracing = False  # whether tracemalloc was started by profiler
+        self._baseline = None  # snapshot of traced memory once attached
+        self._snapshot = None  # snapshot of traced memory once detached
+
+    # ----------------------------------------------------------------------- #
+    # Installation
+
+    def attach(self, window):
+        """Start tracing allocations and measuring frames of window"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.traceback)
+            self._tracing = True
+        self._baseline = self.take_snapshot()
+        self._snapshot = None
+        gc.callbacks.append(self._on_gc)
+        window.profiler = self
+
+    def detach(self, window):
+        """Stop tracing and measuring frames of window"""
+        window.profiler = None
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self._tracing:
+            self._snapshot = self.take_snapshot()
+            tracemalloc.stop()
+            self._tracing = False
+
+    def reset(self):
+        """Forget statistics"""
+        self.phases.clear()
+        self.history.clear()
+
+    # ----------------------------------------------------------------------- #
+    # Measures
+
+    def _on_gc(self, phase, info):
+        """Account pause of a garbage collection to phase running"""
+        if phase == "start":
+            self._gc_start = self.clock()
+            return
+        if self._gc_start is None:
+            return
+        pause = self.clock() - self._gc_start
+        self._gc_start = None
+        for stats in [self.phases.get(self._phase), self._frame]:
+            if stats is not None:
+                stats['collections'] += 1
+                stats['gc_time'] += pause
+
+    @contextmanager
+    def measure(self, phase):
+        """Account time and allocations of block to phase
+
+        About:
+            Measures do not nest: traced peak is reset at each measure
+        """
+        stats = self.phases.get(phase)
+        if stats is None:
+            stats = self.phases[phase] = dict.fromkeys(STATS, 0)
+        self._phase = phase
+        tracemalloc.reset_peak()
+        memory = tracemalloc.get_traced_memory()[0]
+        start = self.clock()
+        try:
+            yield stats
+        finally:
+            duration = self.clock() - start
+            current, peak = tracemalloc.get_traced_memory()
+            self._phase = None
+            stats['calls'] += 1
+            stats['time'] += duration
+            stats['allocated'] += peak - memory
+            stats['retained'] += current - memory
+            if self._frame is not None:
+                self._frame['allocated'] += peak - memory
+                self._frame['retained'] += current - memory
+
+    # ----------------------------------------------------------------------- #
+    # Frame
+
+    def start_frame(self):
+        """Start accounting a frame (@see Window.draw_frame)"""
+        self._frame = dict.fromkeys(STATS, 0)
+        self._frame_start = self.clock()
+
+    def end_frame(self):
+        """Store statistics of frame"""
+        frame, self._frame = self._frame, None
+        if frame is None:
+            return
+        frame['calls'] = 1
+        frame['time'] = self.clock() - self._frame_start
+        self.history.append(frame)
+        if len(self.history) > self.frames:
+            del self.history[0]
+
+    # ----------------------------------------------------------------------- #
+    # Reports
+
+    def report(self, sort="allocated"):
+        """Statistics of phases, in decreasing order of given statistic
+
+        Return:
+            (dict): phase -> dict with keys 'calls', 'time' (s), 'allocated'
+                (bytes), 'retained' (bytes), 'collections', 'gc_time' (s) and
+                'per_call' (bytes allocated per call)
+        """
+        report = {}
+        for phase, stats in self.phases.items():
+            report[phase] = dict(stats, per_call=(
+                stats['allocated'] / stats['calls'] if stats['calls'] else 0
+            ))
+        return dict(sorted(
+            report.items(), key=lambda item: item[1][sort], reverse=True
+        ))
+
+    def frame_stats(self):
+        """Statistics of last frames
+
+        Return:
+            (dict): statistic -> numpy.ndarray of its value at each frame,
+                keys are STATS but 'calls'
+        """
+        return {
+            key: np.array([frame[key] for frame in self.history])
+            for key in STATS if key != "calls"
+        }
+
+    @staticmethod
+    def take_snapshot():
+        """Snapshot of traced memory, tracing itself excluded"""
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+    def growth(self, limit=10, key_type="lineno"):
+        """Lines of code retaining the most memory since profiler attached
+
+        Return:
+            (list): list of tracemalloc.StatisticDiff
+        """
+        if self._baseline is None:
+            return []
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.take_snapshot()
+        return snapshot.compare_to(self._baseline, key_type)[:limit]
+
+
+# --------------------------------------------------------------------------- #
+# Garbage collection
+
+class IdleCollector:
+    """Collect garbage of a window in idle time of frames"""
+
+    clock = staticmethod(time.perf_counter)  # current time in seconds
+
+    def __init__(self, min_slack=0.002, max_pending=None, freeze=True):
+        """Initialize a collector
+
+        Args:
+            min_slack (float)   : time in seconds a frame must leave before
+                next one for a collection to run
+            max_pending (int)   : number of pending allocations forcing a
+                collection even without slack
+                default is 10 times threshold of first generation
+            freeze (bool)       : freeze objects alive once window started
+        """
+        self.min_slack = min_slack
+        self.max_pending = max_pending
+        self.freeze = freeze
+        self.collections = [0, 0, 0]  # number of collections per generation
+        self.forced = 0  # number of collections run without slack
+        self.pause = 0  # time spent collecting in seconds
+
+        self._hook = None
+        self._frozen = False
+        self._enabled = None  # whether automatic collection was enabled
+
+    def attach(self, window):
+        """Disable automatic collection, collect at end of frames of window"""
+        self._enabled = gc.isenabled()
+        gc.disable()
+        if self.max_pending is None:
+            self.max_pending = 10 * gc.get_threshold()[0]
+
+        def hook(screen, ticks):
+            self.on_frame(window)
+
+        self._hook = hook
+        window.frame_hooks.append(hook)
+        return hook
+
+    def detach(self, window):
+        """Give garbage collection back to Python"""
+        if self._hook in window.frame_hooks:
+            window.frame_hooks.remove(self._hook)
+        self._hook = None
+        if self._frozen:
+            gc.unfreeze()
+            self._frozen = False
+        if self._enabled:
+            gc.enable()
+
+    def generation(self):
+        """Oldest generation exceeding its threshold (as gc would collect)"""
+        counts, thresholds = gc.get_count(), gc.get_threshold()
+        for generation in [2, 1]:
+            if thresholds[generation] and (
+                counts[generation] >= thresholds[generation]
+            ):
+                return generation
+        return 0
+
+    def collect(self):
+        """Run a collection"""
+        generation = self.generation()
+        start = self.clock()
+        gc.collect(generation)
+        self.pause += self.clock() - start
+        self.collections[generation] += 1
+
+    def on_frame(self, window):
+        """Collect garbage if frame of window leaves enough time"""
+        if self.freeze and not self._frozen:
+            # Everything alive after first frame lives along with window
+            gc.collect()
+            gc.freeze()
+            self._frozen = True
+            return
+        pending = gc.get_count()[0]
+        if not pending:
+            return
+        if window.frame_start is not None:
+            elapsed = self.clock() - window.frame_start
+            if 1 / window.settings.fps - elapsed >= self.min_slack:
+                self.collect()
+                return
+        if pending >= self.max_pending:
+            self.forced += 1
+            self.collect()
@@ -0,0 +1,225 @@
+"""Tools to record frames displayed by a window"""
+import os
+import queue
+import struct
+import zlib
+from threading import Thread
+
+import numpy as np
+import pygame as pg
+from logzero import logger
+
+ZLIB_MAGIC = b"OLZ1"
+ZLIB_HEADER = struct.Struct("<4sII")  # magic, width, height
+ZLIB_FRAME = struct.Struct("<II")  # frame index, compressed length
+
+
+def read_zlib_frames(path):
+    """Iterate over frames of a zlib recording
+
+    Examples:
+        Frames can be piped to a video encoder as raw rgb24 frames:
+        >>> for index, frame in read_zlib_frames("session.olz"):
+        ...     ffmpeg.stdin.write(frame.tobytes())
+
+    Return:
+        (iterator[int, numpy.ndarray]): frame index and (height, width, 3)
+            array of uint8
+    """
+    with open(path, "rb") as file:
+        magic, width, height = ZLIB_HEADER.unpack(
+            file.read(ZLIB_HEADER.size)
+        )
+        if magic != ZLIB_MAGIC:
+            raise ValueError(f"{path} is not a zlib recording")
+        while True:
+            head = file.read(ZLIB_FRAME.size)
+            if not head:
+                return
+            index, length = ZLIB_FRAME.unpack(head)
+            data = zlib.decompress(file.read(length))
+            yield index, np.frombuffer(data, np.uint8).reshape(
+                height, width, 3
+            )
+
+
+class FrameRecorder:
+    """Record frames of a window without encoding them in the render loop
+
+    About:
+        Frames are copied into a pool of preallocated buffers, compression and
+        writing happen in a worker thread. When no buffer is free the policy
+        decides whether to drop the frame or to wait for the worker.
+
+        Formats:
+            'png'   : one png file per frame in directory path
+            'raw'   : raw rgb24 frames appended to file path, can be read
+                by a video encoder (ffmpeg -f rawvideo -pix_fmt rgb24 ...)
+            'zlib'  : zlib compressed rgb24 frames in file path
+                @see read_zlib_frames
+
+    Examples:
+        >>> recorder = FrameRecorder("session.olz", fmt="zlib", every=2)
+        >>> window.frame_hooks.append(recorder.capture)
+        >>> window.open()
+        >>> window.wait_close()
+        >>> recorder.close()
+    """
+
+    formats = ("png", "raw", "zlib")
+    policies = ("drop", "block")
+
+    def __init__(self, path, fmt="png", every=1, buffers=8, policy="drop",
+                 level=1):
+        """Initialize a recorder
+
+        Args:
+            path (str)      : directory for png, file otherwise
+            fmt (str)       : format of recording (within self.formats)
+            every (int)     : record one frame every k frames
+            buffers (int)   : number of frames that can wait for writing
+            policy (str)    : what to do when all buffers are used
+                'drop'  -> skip frame
+                'block' -> wait for a buffer to be free
+            level (int)     : zlib compression level
+        """
+        if fmt not in self.formats:
+            raise ValueError(f"fmt must be within {self.formats}, got '{fmt}'")
+        if policy not in self.policies:
+            raise ValueError(
+                f"policy must be within {self.policies}, got '{policy}'"
+            )
+        assert every > 0 and buffers > 0
+        self.path = path
+        self.fmt = fmt
+        self.every = every
+        self.policy = policy
+        self.level = level
+        self.buffer_nb = buffers
+
+        self.size = None
+        self.captured = 0
+        self.dropped = 0
+        self.written = 0
+
+        self._calls = 0
+        self._free = queue.Queue()
+        self._pending = queue.Queue()
+        self._thread = None
+        self._file = None
+
+    @property
+    def running(self):
+        """Whether recorder is running"""
+        return self._thread is not None
+
+    def start(self, size):
+        """Allocate buffers and start writing thread
+
+        Args:
+            size (2-int-tuple): size of frames to record in pixels
+        """
+        assert not self.running, "Recorder is already running"
+        self.size = tuple(size)
+        for _ in range(self.buffer_nb):
+            self._free.put(np.empty((*self.size, 3), np.uint8))
+
+        if self.fmt == "png":
+            os.makedirs(self.path, exist_ok=True)
+        else:
+            self._file = open(self.path, "wb")
+            if self.fmt == "zlib":
+                self._file.write(ZLIB_HEADER.pack(ZLIB_MAGIC, *self.size))
+
+        self._thread = Thread(target=self._work, daemon=True)
+        self._thread.start()
+
+    def capture(self, surface, frame=None):
+        """Copy surface to be recorded
+
+        Args:
+            surface (pygame.Surface): frame to record
+            frame (int)             : index of frame
+                default is number of calls to capture
+
+        Return:
+            (bool): whether frame has been recorded
+        """
+        index = self._calls if frame is None else frame
+        self._calls += 1
+        if index % self.every:
+            return False
+        if not self.running:
+            self.start(surface.get_size())
+        elif surface.get_size() != self.size:
+            raise ValueError(
+                f"Frame size {surface.get_size()} differs from recording size"
+                f" {self.size}"
+            )
+
+        try:
+            buffer = self._free.get(block=(self.policy == "block"))
+        except queue.Empty:
+            self.dropped += 1
+            return False
+        pg.pixelcopy.surface_to_array(buffer, surface)
+        self._pending.put((index, buffer))
+        self.captured += 1
+        return True
+
+    def close(self):
+        """Wait for all recorded frames to be written and stop recording"""
+        if not self.running:
+            return
+        self._pending.put(None)
+        self._thread.join()
+        self._thread = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        while not self._free.empty():
+            self._free.get()
+        logger.debug(
+            f"Recording {self.path} closed: {self.written} frames written"
+            f", {self.dropped} dropped"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    # ----------------------------------------------------------------------- #
+    # Writing
+
+    def _work(self):
+        """Write frames until receiving None"""
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            index, buffer = item
+            try:
+                self._write(index, buffer)
+                self.written += 1
+            except Exception as error:
+                logger.error(f"Failed to write frame {index}: {error}")
+            finally:
+                self._free.put(buffer)
+
+    def _write(self, index, buffer):
+        """Write one frame (buffer is indexed by x, y)"""
+        if self.fmt == "png":
+            pg.image.save(
+                pg.surfarray.make_surface(buffer),
+                os.path.join(self.path, f"frame_{index:06d}.png"),
+            )
+            return
+        data = np.ascontiguousarray(buffer.transpose(1, 0, 2)).tobytes()
+        if self.fmt == "raw":
+            self._file.write(data)
+            return
+        data = zlib.compress(data, self.level)
+        self._file.write(ZLIB_FRAME.pack(index, len(data)))
+        self._file.write(data)
@@ -0,0 +1,316 @@
+"""Tools to load components from declarative scene files
+
+A scene file is a json file describing components:
+    {
+        "components": [
+            {"type": "FillingGrid", "dx": 50, "dy": 50, "color": "cyan"},
+            {"type": "ActiveRectangle", "ref_pos": [100, 0], "size": [50, 50],
+             "color": ["green", "blue"], "outline": "purple", "width": 10},
+            {"type": "Text", "string": "title", "ref_pos": [350, 0],
+             "align": "top-mid", "height": 20, "font": "arial"},
+            {"type": "Group", "ref_pos": [0, 400], "size": [200, 100],
+             "components": [...]}
+        ]
+    }
+
+    type            : name of a class within oldisplay.components
+    args            : list of positional arguments (optional)
+    components      : children of a container (Group, Viewport, ...)
+    static          : static children of a Viewport
+    other keys      : keyword arguments of component
+        lists are converted to tuples (positions, sizes, colors, points)
+        for active components, a list of values of a look parameter gives its
+            value per state (normal, hovered, clicked), "DFT" keeps value of
+            previous state
+        paths ("path" key) are relative to directory of scene file
+
+Compiled scenes (colors, alignments and per-state looks resolved, font sizing
+measured) are cached next to the scene file and used as long as the content of
+the file does not change. Caches are json files of plain data, reading one
+never runs code.
+"""
+import hashlib
+import json
+import os
+
+import pygame as pg
+from logzero import logger
+
+from oldisplay import align, components
+from oldisplay.collections import Color, FontManager
+from oldisplay.components.shape import ActiveShape, Shape
+
+CACHE_VERSION = 2
+CACHE_EXT = ".cache"
+CHILDREN_KEYS = ("components", "static")
+
+
+# --------------------------------------------------------------------------- #
+# Compilation
+
+def _convert(value):
+    """Convert json value to python value expected by components"""
+    if isinstance(value, list):
+        return tuple(_convert(item) for item in value)
+    return value
+
+
+def _is_color(value):
+    """Whether value is a (r, g, b) tuple"""
+    return (
+        isinstance(value, tuple) and len(value) == 3
+        and all(isinstance(item, int) for item in value)
+    )
+
+
+def _resolve_states(cls, key, value):
+    """Return value of look parameter for normal, hovered and clicked states
+
+    About:
+        "DFT" as the value of a state keeps value of previous state
+    """
+    if not isinstance(value, tuple) or (key in cls.par_conv
+                                        and _is_color(value)):
+        value = (value,)
+    states = []
+    prev = cls.dft_look[key]
+    for state in value:
+        state = prev if state == "DFT" else state
+        states.append(state)
+        prev = state
+    return tuple(states)
+
+
+def _resolve_look(cls, kwargs, fonts):
+    """Convert look parameters of kwargs once for all"""
+    active = issubclass(cls, ActiveShape)
+    for key in list(kwargs):
+        if key not in cls.dft_look:
+            continue
+        if active:
+            values = _resolve_states(cls, key, kwargs[key])
+        else:
+            values = (kwargs[key],)
+        if key in cls.par_conv:
+            values = tuple(
+                None if value is None else cls.par_conv[key](value)
+                for value in values
+            )
+        if key == 'font':
+            for font in values:
+                fonts[font] = FontManager.sizing_params(font)
+        kwargs[key] = values if active else values[0]
+    if 'font' in cls.dft_look and 'font' not in kwargs:
+        font = cls.dft_look['font']
+        fonts[font] = FontManager.sizing_params(font)
+
+
+def compile_spec(spec, fonts, root=""):
+    """Compile description of a component
+
+    Args:
+        spec (dict)     : description of component
+        fonts (dict)    : sizing params of fonts used, filled with fonts of
+            component
+        root (str)      : directory relative paths start from
+
+    Return:
+        (tuple): (class name, args, kwargs) to build component
+    """
+    spec = dict(spec)
+    clsname = spec.pop("type")
+    cls = getattr(components, clsname, None)
+    if not isinstance(cls, type):
+        raise ValueError(f"Unknown component type '{clsname}'")
+
+    args = [_convert(value) for value in spec.pop("args", [])]
+    children = {
+        key: spec.pop(key) for key in CHILDREN_KEYS if key in spec
+    }
+    kwargs = {key: _convert(value) for key, value in spec.items()}
+    if 'path' in kwargs:
+        kwargs['path'] = os.path.join(root, kwargs['path'])
+
+    if 'align' in kwargs and hasattr(cls, 'dft_location'):
+        kwargs.update(align.read_align_params(
+            {'align': kwargs.pop('align')}, cls.dft_location
+        ))
+    if issubclass(cls, Shape):
+        _resolve_look(cls, kwargs, fonts)
+    for key, specs in children.items():
+        kwargs[key] = [compile_spec(child, fonts, root) for child in specs]
+    return clsname, args, kwargs
+
+
+def compile_scene(content, root=""):
+    """Compile content of a scene file
+
+    Args:
+        content (str|bytes) : content of scene file
+        root (str)          : directory relative paths start from
+
+    Return:
+        (dict): compiled scene
+            'components'    -> list of compiled components (@see compile_spec)
+            'fonts'         -> sizing params of fonts used
+    """
+    if not pg.font.get_init():
+        pg.font.init()
+    scene = json.loads(content)
+    fonts = {}
+    specs = [
+        compile_spec(spec, fonts, root) for spec in scene.get("components", [])
+    ]
+    return {'components': specs, 'fonts': fonts}
+
+
+def build(compiled):
+    """Build a component from its compiled description"""
+    clsname, args, kwargs = compiled
+    kwargs = dict(kwargs)
+    for key in CHILDREN_KEYS:
+        if key in kwargs:
+            kwargs[key] = [build(child) for child in kwargs[key]]
+    return getattr(components, clsname)(*args, **kwargs)
+
+
+# --------------------------------------------------------------------------- #
+# Loading
+
+def _encode(value):
+    """Convert compiled value into json data, keeping tuples and colors"""
+    if isinstance(value, Color):
+        return {'color': list(value)}
+    if isinstance(value, tuple):
+        return {'tuple': [_encode(item) for item in value]}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {'dict': [
+            [_encode(key), _encode(item)] for key, item in value.items()
+        ]}
+    return value
+
+
+def _decode(data):
+    """Convert json data back into compiled value (@see _encode)"""
+    if isinstance(data, list):
+        return [_decode(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if 'color' in data:
+        return Color(*data['color'])
+    if 'tuple' in data:
+        return tuple(_decode(item) for item in data['tuple'])
+    return {_decode(key): _decode(item) for key, item in data['dict']}
+
+
+def cache_path(path):
+    """Path of compiled cache of a scene file"""
+    return path + CACHE_EXT
+
+
+def load_compiled(path, use_cache=True):
+    """Return compiled scene, using or refreshing cache next to scene file"""
+    with open(path, "rb") as file:
+        content = file.read()
+    digest = hashlib.sha256(content).hexdigest()
+
+    cpath = cache_path(path)
+    if use_cache and os.path.exists(cpath):
+        try:
+            with open(cpath, "r") as file:
+                cache = json.load(file)
+            if (cache['version'], cache['hash']) == (CACHE_VERSION, digest):
+                return _decode(cache['scene'])
+        except Exception as error:
+            logger.warning(f"Ignoring unreadable scene cache {cpath}: {error}")
+
+    compiled = compile_scene(content, root=os.path.dirname(path))
+    if use_cache:
+        try:
+            with open(cpath, "w") as file:
+                json.dump({
+                    'version': CACHE_VERSION,
+                    'hash': digest,
+                    'scene': _encode(compiled),
+                }, file)
+        except OSError as error:
+            logger.warning(f"Could not write scene cache {cpath}: {error}")
+    return compiled
+
+
+def load_scene(path, use_cache=True):
+    """Return components described in a scene file
+
+    Args:
+        path (str)      : path to json scene file
+        use_cache (bool): use and refresh compiled cache next to scene file
+
+    Return:
+        (list): components of scene
+    """
+    compiled = load_compiled(path, use_cache=use_cache)
+    FontManager.font_sizing_cache.update(compiled['fonts'])
+    return [build(spec) for spec in compiled['components']]
+
+
+class Scene:
+    """Components of a scene file, reloaded when the file changes
+
+    Examples:
+        >>> scene = Scene("menu.json")
+        >>> window.components = scene.components
+        >>> scene.watch(window)
+        >>> window.open()
+    """
+
+    def __init__(self, path, use_cache=True):
+        """Load scene
+
+        Args:
+            path (str)      : path to json scene file
+            use_cache (bool): use and refresh compiled cache
+        """
+        self.path = path
+        self.use_cache = use_cache
+        self.components = []
+        self._mtime = None
+        self.reload()
+
+    def changed(self):
+        """Whether scene file changed since last load"""
+        try:
+            return os.stat(self.path).st_mtime_ns != self._mtime
+        except OSError:
+            return False
+
+    def reload(self):
+        """Load scene file, components list is updated in place"""
+        self._mtime = os.stat(self.path).st_mtime_ns
+        self.components[:] = load_scene(self.path, use_cache=self.use_cache)
+        logger.debug(
+            f"Scene {self.path} loaded ({len(self.components)} components)"
+        )
+
+    def watch(self, window, every=10):
+        """Reload scene displayed by window when its file changes
+
+        Args:
+            window (Window) : window displaying scene components
+            every (int)     : number of frames b/w checks of file
+        """
+        def hook(screen, ticks):
+            if ticks % every or not self.changed():
+                return
+            try:
+                self.reload()
+            except Exception as error:
+                logger.error(f"Failed to reload {self.path}: {error}")
+                return
+            for component in self.components:
+                component.init(screen)
+            window.components = self.components
+
+        window.frame_hooks.append(hook)
+        return hook
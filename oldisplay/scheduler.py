@@ -0,0 +1,238 @@
+"""Tools to update components at their own rate
+
+About:
+    By default, every component of a window is updated at every frame. A
+    scheduler is a component of the window updating its own components only
+    when they are due:
+        every N frames  -> scheduler.add(component, frames=N)
+        every T ms      -> scheduler.add(component, ms=T)
+        on demand       -> scheduler.add(component), redrawn when component
+            notifies a change (@see Component.invalidate) or is requested
+    The last display of a component is kept on a surface covering its area and
+    blitted on frames where it is skipped. Surface is reused from one update
+    to the other (cleared, or resized along with component), components are
+    initiated once.
+
+    Components sharing the same interval are given different phases so that
+    their redraws are spread over the interval rather than happening all on
+    the same frame.
+
+Examples:
+    >>> scheduler = Scheduler()
+    >>> scheduler.add(clock_text, ms=1000)
+    >>> scheduler.add(chart, frames=2)
+    >>> scheduler.add(button)
+    >>> window.components.append(scheduler)
+"""
+import pygame as pg
+
+from oldisplay import draw
+from oldisplay.components.component import Component
+
+
+class Task:
+    """Component scheduled for update and its last display"""
+
+    def __init__(self, scheduler, component, frames=None, ms=None):
+        """Initialize a task
+
+        Args:
+            scheduler (Scheduler)   : scheduler running task
+            component (Component)   : component to update
+            frames (int)            : number of frames b/w two updates
+            ms (int)                : number of ms b/w two updates
+        """
+        assert frames is None or ms is None, "Give either frames or ms"
+        assert frames is None or frames > 0
+        assert ms is None or ms > 0
+        self.scheduler = scheduler
+        self.component = component
+        self.frames = frames
+        self.ms = ms
+        self.phase = 0  # offset of updates within interval (frames or ms)
+        self.due_time = None  # time of next update in ms
+
+        self.surface = None
+        self.area = None  # area of target surface covered by surface
+        self.source = None  # area of surface holding display of component
+        self.initiated = False
+        self.requested = True
+        self.forced = False  # whether update is requested for next frame
+        self.renders = 0  # number of updates
+
+    @property
+    def interval(self):
+        """Interval b/w updates (frames or ms), None for on-demand tasks"""
+        return self.frames if self.ms is None else self.ms
+
+    # ----------------------------------------------------------------------- #
+    # Container interface of component
+
+    def invalidate_cache(self):
+        """Called by component when its display changes"""
+        self.requested = True
+
+    def to_inner(self, position):
+        """Components are in coordinates of scheduler"""
+        return self.scheduler.to_local(position)
+
+    # ----------------------------------------------------------------------- #
+    # Scheduling
+
+    def is_due(self, frame, now):
+        """Whether component must be updated at frame / time"""
+        if self.surface is None or self.forced:
+            return True
+        if self.frames is not None:
+            return (frame - self.phase) % self.frames == 0
+        if self.ms is not None:
+            return now >= self.due_time
+        return self.requested
+
+    def reschedule(self, now):
+        """Set time of next update of ms-based task"""
+        if self.ms is None:
+            return
+        if self.due_time is None:
+            self.due_time = now + self.phase
+        while self.due_time <= now:
+            self.due_time += self.ms
+
+    # ----------------------------------------------------------------------- #
+    # Display
+
+    def init(self, surface):
+        """Initiate component, once"""
+        if not self.initiated:
+            self.component.init(surface)
+            self.initiated = True
+        self.forced = True
+
+    def render(self, target, events=None):
+        """Update component on its surface
+
+        About:
+            Component without bbox is drawn on a surface of size of target,
+            only the part it actually covers is kept for display
+        """
+        bbox = self.component.bbox
+        if bbox is None:
+            bbox = target.get_rect()
+        if self.surface is None or self.surface.get_size() != bbox.size:
+            self.surface = pg.Surface(bbox.size, pg.SRCALPHA)
+        else:
+            draw.fill(self.surface, (0, 0, 0, 0))
+        if not self.initiated:
+            self.init(target)
+        with draw.translate(self.surface, (-bbox.left, -bbox.top)):
+            self.component.update(self.surface, events=events)
+        if self.component.bbox is None:
+            self.source = self.surface.get_bounding_rect()
+            self.area = self.source.move(bbox.topleft)
+        else:
+            self.source = None
+            self.area = bbox
+        self.requested = False
+        self.forced = False
+        self.renders += 1
+
+    def display(self, surface):
+        """Blit last display of component"""
+        if self.area.width and self.area.height:
+            draw.blit(
+                surface, self.surface, self.area.topleft, area=self.source
+            )
+
+
+class Scheduler(Component):
+    """Component updating its components at their own interval"""
+
+    clock = staticmethod(pg.time.get_ticks)  # current time in ms
+
+    def __init__(self, **kwargs):
+        """Initialize a scheduler"""
+        super().__init__(**kwargs)
+        self.tasks = []
+        self.frame = 0
+
+    def add(self, component, frames=None, ms=None):
+        """Schedule updates of component
+
+        Args:
+            component (Component)   : component to update
+            frames (int)            : update component every frames frames
+            ms (int)                : update component every ms milliseconds
+                when neither frames nor ms is given, component is updated when
+                it changes (@see Component.invalidate, Scheduler.request)
+
+        Return:
+            (Task): scheduled task
+        """
+        task = Task(self, component, frames=frames, ms=ms)
+        component._parent = task
+        self.tasks.append(task)
+        self.balance(frames=frames, ms=ms)
+        return task
+
+    def remove(self, component):
+        """Stop updating component"""
+        task = self.get_task(component)
+        self.tasks.remove(task)
+        component._parent = None
+        self.balance(frames=task.frames, ms=task.ms)
+
+    def get_task(self, component):
+        """Return task of component"""
+        for task in self.tasks:
+            if task.component is component:
+                return task
+        raise ValueError(f"{component} is not scheduled")
+
+    def request(self, component):
+        """Update component at next frame"""
+        task = self.get_task(component)
+        task.requested = True
+        task.forced = True
+
+    def balance(self, frames=None, ms=None):
+        """Spread phases of tasks sharing the same interval"""
+        if frames is None and ms is None:
+            return
+        tasks = [
+            task for task in self.tasks
+            if (task.frames, task.ms) == (frames, ms)
+        ]
+        interval = frames if ms is None else ms
+        for i, task in enumerate(tasks):
+            task.phase = i * interval // len(tasks)
+            task.due_time = None
+
+    @property
+    def components(self):
+        """Scheduled components (list)"""
+        return [task.component for task in self.tasks]
+
+    # ----------------------------------------------------------------------- #
+    # Display
+
+    def init(self, surface):
+        """Initiate scheduled components, updated at next frame"""
+        for task in self.tasks:
+            task.init(surface)
+
+    def track(self, events=None):
+        """Follow events for all scheduled components"""
+        for task in self.tasks:
+            task.component.track(events)
+
+    def update(self, surface, events=None):
+        """Update due components and display last display of others"""
+        now = self.clock()
+        for task in self.tasks:
+            if task.is_due(self.frame, now):
+                task.render(surface, events)
+                task.reschedule(now)
+            else:
+                task.component.track(events)
+            task.display(surface)
+        self.frame += 1
@@ -0,0 +1,34 @@
+"""Helpers shared by tests"""
+from oldisplay.components.component import Component
+
+
+class Counter(Component):
+    """Component counting its updates"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.count = 0
+
+    def update(self, surface, events=None):
+        self.count += 1
+
+
+def run_frames(window, frames=None, events=None):
+    """Start window, draw its frames as fast as possible and end it
+
+    Args:
+        window (Window) : window to run
+        frames (int)    : max number of frames to draw
+            default is None, until window stops
+        events (list)   : events given to each frame
+            default is None, events are taken from pygame queue
+    """
+    window.start()
+    try:
+        drawn = 0
+        while not window.stop and (frames is None or drawn < frames):
+            window.draw_frame(events=events)
+            window.ticks += 1
+            drawn += 1
+    finally:
+        window.end()
@@ -0,0 +1,96 @@
+import numpy as np
+import pygame as pg
+
+from oldisplay import inputs
+from oldisplay.animation import Animator
+from oldisplay.components import (
+    ActiveRectangle, ActiveText, Group, Text, create_many,
+)
+
+
+def test_animator():
+    animator = Animator(capacity=2)
+    animator.clock = lambda: 0
+    rectangles = create_many(
+        ActiveRectangle, [(0, 0), (10, 0), (20, 0)], (10, 10), color="red"
+    )
+    group = Group((0, 0), (100, 100))
+    assert not animator.active
+
+    for rectangle in rectangles:
+        animator.animate(rectangle, 100, ref_pos=(50, 50), color=(0, 0, 255))
+    animator.animate(group, 100, easing="in_out_quad", delay=100, alpha=0)
+    assert animator.active and len(animator) == 7
+
+    animator.step(50)
+    assert rectangles[0].ref_pos == (25, 25)
+    assert rectangles[1].ref_pos == (30, 25)
+    assert rectangles[0].cache.topleft == (25, 25)
+    assert rectangles[0].is_within((30, 30))
+    assert rectangles[0].params['color'] == (128, 0, 128)
+    assert group.alpha == 255
+
+    animator.step(150)
+    assert rectangles[2].ref_pos == (50, 50)
+    assert rectangles[2].params['color'] == (0, 0, 255)
+    assert group.alpha == 128
+    assert len(animator) == 1
+
+    animator.step(200)
+    assert group.alpha == 0
+    assert not animator.active
+
+
+def test_animate_states():
+    animator = Animator()
+    animator.clock = lambda: 0
+    rectangle = ActiveRectangle(
+        (0, 0), (10, 10), color=((255, 0, 0), (0, 255, 0), (0, 0, 255)),
+    )
+    animator.animate(rectangle, 100, color=(0, 0, 0))
+    assert len(animator) == 3
+
+    animator.step(50)
+    assert rectangle.params_n['color'] == (128, 0, 0)
+    assert rectangle.params_h['color'] == (0, 128, 0)
+    assert rectangle.params_c['color'] == (0, 0, 128)
+    animator.step(100)
+    assert rectangle.params_h['color'] == (0, 0, 0)
+    assert rectangle.params_c['color'] == (0, 0, 0)
+
+
+def test_animate_text_color():
+    pg.font.init()
+    surface = pg.Surface((100, 100))
+    animator = Animator()
+    animator.clock = lambda: 0
+    text = Text("Hello", (0, 0), color=(0, 0, 0))
+    button = ActiveText("Hello", (0, 50), color=((0, 0, 0), (0, 0, 255)))
+    for component in [text, button]:
+        component.init(surface)
+        animator.animate(component, 100, color=(250, 0, 0))
+    inputs.set_mouse_pos((0, 0))
+    try:
+        for now in range(0, 110, 10):
+            animator.step(now)
+            text.update(surface)
+            button.update(surface)
+    finally:
+        inputs.set_mouse_pos(None)
+    assert len(text._surfaces) == 1  # renders of past colors are dropped
+    assert list(text._surfaces)[0][1] == (250, 0, 0)
+    assert len(button._surfaces) <= 2
+
+
+def test_animate_rows():
+    animator = Animator()
+    animator.clock = lambda: 0
+    positions = np.zeros((4, 2))
+    animator.animate_rows(positions, [1, 3], [(10, 20), (-10, 0)], 100)
+    animator.step(50)
+    assert positions.tolist() == [[0, 0], [5, 10], [0, 0], [-5, 0]]
+
+    animator.cancel(positions)
+    animator.step(100)
+    assert positions[1].tolist() == [5, 10]
+    assert not animator.active
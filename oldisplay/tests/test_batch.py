@@ -0,0 +1,29 @@
+import os
+
+import numpy as np
+import pygame as pg
+
+from oldisplay.batch import render_batch
+
+
+def scene(color):
+    return {"components": [
+        {"type": "Rectangle", "ref_pos": [0, 0], "size": [10, 10],
+         "color": color},
+        {"type": "Text", "string": "thumb", "ref_pos": [0, 20]},
+    ]}
+
+
+def test_render_batch(tmp_path):
+    colors = ["red", "blue", "green"]
+    arrays = render_batch([scene(c) for c in colors], (40, 30), processes=2)
+    assert [array.shape for array in arrays] == [(30, 40, 3)] * 3
+    assert arrays[1][5, 5].tolist() == [0, 0, 255]
+    assert arrays[0][15, 15].tolist() == [255, 255, 255]
+    assert not np.array_equal(arrays[0][20:], np.full((10, 40, 3), 255))
+
+    paths = render_batch(
+        [scene("red")], (40, 30), output=str(tmp_path), processes=1,
+    )
+    assert paths == [os.path.join(str(tmp_path), "000000.png")]
+    assert pg.image.load(paths[0]).get_at((5, 5)) == pg.Color("red")
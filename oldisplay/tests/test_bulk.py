@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from oldisplay.components import (
+    ActiveRectangle, Disk, Rectangle, create_many,
+)
+
+
+def test_create_many():
+    positions = np.array([(0, 0), (10, 0), (20, 0), (30, 5)])
+    colors = [('red', 'blue'), ('green', 'blue'), ('red', 'blue'), 'red']
+    rectangles = create_many(
+        ActiveRectangle, positions, (10, 10),
+        color=colors, width=np.array([1, 1, 1, 2]), align="center",
+    )
+    for rectangle, position, color, width in zip(
+            rectangles, positions, colors, [1, 1, 1, 2]):
+        expected = ActiveRectangle(
+            tuple(position), (10, 10), color=color, width=width,
+            align="center",
+        )
+        assert type(rectangle) is ActiveRectangle
+        assert rectangle.position == expected.position
+        assert rectangle.cache == expected.cache
+        assert rectangle.params_n == expected.params_n
+        assert rectangle.params_h == expected.params_h
+        assert rectangle.params_c == expected.params_c
+        assert rectangle.is_within(tuple(position))
+
+    # Same look do not share state
+    assert rectangles[0].params_n is not rectangles[2].params_n
+    params = dict(rectangles[2].params_n)
+    rectangles[0].params_n['color'] = (0, 0, 0, 255)
+    assert rectangles[2].params_n == params
+    rectangles[0].ref_pos = (100, 100)
+    assert rectangles[2].ref_pos == (20, 0)
+
+    rectangles = create_many(Rectangle, [(0, 0), (5, 5)], [(1, 1), (2, 2)])
+    assert [r.cache.size for r in rectangles] == [(1, 1), (2, 2)]
+
+
+def test_create_many_signature():
+    with pytest.raises(TypeError):
+        create_many(Disk, [(0, 0), (5, 5)], 3)
@@ -0,0 +1,81 @@
+import os
+
+import pygame as pg
+import pytest
+
+from oldisplay import caches
+from oldisplay.caches import Cache, CacheRegistry
+from oldisplay.components import Image
+
+RESOURCES = os.path.join(os.path.dirname(__file__), "..", "..", "resources")
+
+
+def test_cache_policies():
+    cache = Cache("test", max_entries=2, register=False)
+    cache['a'], cache['b'] = 1, 2
+    assert cache['a'] == 1
+    assert cache.get('c') is None
+    cache['c'] = 3  # 'b' is least recently used
+    assert list(cache) == ['a', 'c']
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+
+    cache = Cache("test", policy="ttl", ttl=10, register=False)
+    cache['a'], cache['b'] = 1, 2
+    cache._used['a'] -= 20
+    cache.expire()
+    assert list(cache) == ['b']
+
+
+def test_registry_budget():
+    registry = CacheRegistry(budget=5000)
+    big = Cache("big", register=False)
+    small = Cache("small", register=False)
+    fixed = Cache("fixed", policy=None, register=False)
+    for cache in [big, small, fixed]:
+        registry.register(cache)
+    for i in range(4):
+        big[i] = pg.Surface((10, 10), 0, 32)  # 400 bytes
+        big[i + 4] = pg.Surface((20, 20), 0, 32)  # 1600 bytes
+    small[0] = pg.Surface((10, 10), 0, 32)
+    fixed[0] = pg.Surface((100, 100), 0, 32)
+
+    report = registry.report()
+    assert report['big']['bytes'] == 8000 and report['big']['entries'] == 8
+    assert registry.nbytes == 8400
+
+    registry.enforce()
+    assert registry.nbytes <= 5000
+    assert list(big) == [2, 6, 3, 7] and len(small) == 1 and len(fixed) == 1
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Registry of image cache only in place of global one, cache emptied"""
+    registry = CacheRegistry()
+    monkeypatch.setattr(caches, "registry", registry)
+    registry.register(Image.images)
+    Image.images.clear()
+    yield registry
+    Image.images.clear()
+
+
+def test_global_registry():
+    names = {cache.name for cache in caches.registry.caches()}
+    assert {'fonts', 'glyphs', 'font_sizing', 'images'} <= names
+
+
+def test_registered_caches(registry):
+    path = os.path.join(RESOURCES, "basketball.png")
+    image = Image(path, (0, 0), (10, 10))
+    other = Image(path, (10, 10), (10, 10))
+    assert image.image is other.image
+
+    report = registry.report()
+    assert list(report) == ['images']
+    assert report['images']['entries'] == 1
+
+    Image.images.clear()
+    assert image.image.get_size() == (10, 10)  # loaded again
+
+    listed = Image(path, (0, 0), [10, 10])  # size given as a list
+    assert listed.image is image.image
@@ -0,0 +1,72 @@
+import pygame as pg
+
+from oldisplay import Window
+from oldisplay.components import Canvas
+from oldisplay.tests.conftest import run_frames
+
+
+def test_canvas_accumulates():
+    screen = pg.Surface((50, 50))
+    canvas = Canvas((10, 10), (30, 30), background="white", color="red")
+    canvas.point((1, 1))
+    canvas.line((0, 10), (29, 10), color="blue")
+    canvas.update(screen)
+    canvas.points([(5, 20), (6, 20), (100, 100)], colors="green")
+    stamp = pg.Surface((2, 2))
+    stamp.fill((255, 255, 0))
+    canvas.stamp(stamp, (20, 20))
+    canvas.update(screen)
+
+    screen.fill((0, 0, 0))
+    canvas.update(screen)  # history is kept without commands
+    assert screen.get_at((11, 11)) == pg.Color("red")
+    assert screen.get_at((25, 20)) == pg.Color("blue")
+    assert screen.get_at((16, 30)) == (0, 128, 0, 255)
+    assert screen.get_at((31, 31)) == pg.Color("yellow")
+    assert screen.get_at((12, 12)) == pg.Color("white")
+
+    canvas.clear()
+    canvas.update(screen)
+    assert screen.get_at((11, 11)) == pg.Color("white")
+
+
+def test_canvas_fade():
+    screen = pg.Surface((20, 20))
+    canvas = Canvas((0, 0), (20, 20), fade=0.5, color="red")
+    canvas.point((5, 5))
+    canvas.update(screen)
+    assert canvas.surface.get_at((5, 5)).a == 255
+    canvas.update(screen)
+    assert canvas.surface.get_at((5, 5)).a == 127
+    for _ in range(10):
+        canvas.update(screen)
+    assert canvas.surface.get_at((5, 5)).a == 0
+    assert canvas._faded
+
+    opaque = Canvas((0, 0), (20, 20), background="black", fade=0.5)
+    opaque.point((5, 5), color=(200, 100, 0))
+    opaque.update(screen)
+    opaque.update(screen)
+    assert opaque.surface.get_at((5, 5))[:3] == (100, 50, 0)
+    for _ in range(10):
+        opaque.update(screen)
+    assert opaque.surface.get_at((5, 5))[:3] == (0, 0, 0)
+
+
+def test_canvas_skip_identical(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    window = Window(size=(50, 50), fps=100, skip_identical=True)
+    canvas = Canvas((0, 0), (50, 50), color="red")
+    window.components.append(canvas)
+
+    def hook(screen, ticks):
+        if ticks == 2:
+            canvas.point((20, 20))
+        if ticks == 3:
+            assert screen.get_at((20, 20)) == (255, 0, 0, 255)
+        if ticks == 5:
+            window.close()
+
+    window.frame_hooks.append(hook)
+    run_frames(window)
+    assert window.skipped == 4  # frames 1, 2, 4 and 5
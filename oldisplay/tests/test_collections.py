@@ -1,3 +1,4 @@
+import pygame as pg
 import pytest
 
 import oldisplay.collections as lib
@@ -28,3 +29,45 @@ def test_color():
 
     with pytest.raises(KeyError):
         Color.get('unknown')
+
+
+FONT = {
+    'font': None, 'height': 20, 'bold': False, 'italic': False,
+    'underline': False,
+}
+
+
+def test_font_layout():
+    pg.font.init()
+    Color = lib.colors.Color
+    color = Color.get('black')
+    font = lib.FontManager.get(**FONT)
+
+    glyphs, width = lib.FontManager.layout("0123", color=color, **FONT)
+    assert [glyph for glyph, _ in glyphs] == [
+        lib.FontManager.glyph_cache[(lib.FontManager.key(**FONT), color)][c]
+        for c in "0123"
+    ]
+    assert width == font.size("0123")[0]
+
+    # Kerning is applied, up to sub-pixel rounding
+    glyphs, width = lib.FontManager.layout("AVA", color=color, **FONT)
+    assert abs(width - font.size("AVA")[0]) <= 1
+    assert glyphs[1][1] == font.size("AV")[0] - font.size("V")[0]
+
+
+def test_font_measure():
+    pg.font.init()
+    font = lib.FontManager.get(**FONT)
+    strings = ["", "a", "Hello World", "AVA", "1234567890"]
+    assert lib.FontManager.measure("Hello", height=20) == font.size("Hello")
+    sizes = lib.FontManager.measure_many(strings, height=20, color="red")
+    assert sizes == [font.size(string) for string in strings]
+
+    approx = lib.FontManager.measure_many(strings, exact=False, **FONT)
+    for (width, height), string in zip(approx, strings):
+        assert height == font.get_height()
+        assert abs(width - font.size(string)[0]) <= 1 + len(string) // 10
+
+    extents = lib.FontManager.extents(height=20)
+    assert extents['ascent'] - extents['descent'] == font.get_height()
@@ -0,0 +1,94 @@
+import pygame as pg
+
+from oldisplay import draw
+from oldisplay.components import Group, ParticleSystem, Rectangle, Text
+
+
+def record(surface, components):
+    with draw.record(surface) as display_list:
+        draw.fill(surface, (255, 255, 255))
+        for component in components:
+            component.update(surface)
+    return display_list
+
+
+def test_display_list():
+    pg.font.init()
+    screen = pg.Surface((100, 100))
+    rect = Rectangle((10, 10), (20, 20), color="red")
+    group = Group((50, 50), (40, 40), components=[
+        Rectangle((0, 0), (10, 10), color="blue"),
+        Text("text", (0, 20)),
+    ])
+    components = [rect, group]
+
+    display_list = record(screen, components)
+    assert screen.get_at((15, 15)) == pg.Color("black")  # nothing drawn
+    display_list.replay(screen)
+    assert screen.get_at((15, 15)) == pg.Color("red")
+    assert screen.get_at((55, 55)) == pg.Color("blue")
+
+    # Replay on another surface
+    other = pg.Surface((100, 100))
+    display_list.replay(other)
+    assert other.get_at((55, 55)) == pg.Color("blue")
+
+    # Same frame, same digest
+    assert record(screen, components).digest == display_list.digest
+
+    # Group redrawn with other content
+    group.components[0].params['color'] = pg.Color("green")
+    group.components[0].invalidate()
+    assert record(screen, components).digest != display_list.digest
+
+    rect.ref_pos = (0, 0)
+    digest = record(screen, components).digest
+    assert digest != display_list.digest
+    assert record(screen, components).digest == digest
+
+
+def test_display_list_volatile():
+    screen = pg.Surface((100, 100))
+    particles = ParticleSystem((0, 0), (100, 100), 10, color="red")
+    particles.spawn([(5, 5)])
+    display_list = record(screen, [particles])
+    assert display_list.volatile and display_list.digest is None
+    display_list.replay(screen)
+    assert screen.get_at((5, 5)) == pg.Color("red")
+
+
+def test_display_list_source_changed():
+    screen = pg.Surface((20, 20))
+    source = pg.Surface((5, 5))
+    draw.fill(source, (255, 0, 0))
+
+    def frame():
+        with draw.record(screen) as display_list:
+            draw.blit(screen, source, (0, 0))
+        return display_list.digest
+
+    digest = frame()
+    assert frame() == digest
+    draw.fill(source, (0, 0, 255))  # changed while nothing is recorded
+    changed = frame()
+    assert changed != digest
+    source.set_alpha(100)
+    assert frame() != changed
+
+
+def test_segments():
+    surface = pg.Surface((30, 30))
+    starts = [(0, 0), (10, 0), (20, 20)]
+    ends = [(10, 0), (10, 10), (25, 20)]  # first two form a run
+    draw.segments(surface, (255, 0, 0), starts, ends)
+    for point in [(5, 0), (10, 5), (22, 20)]:
+        assert surface.get_at(point) == pg.Color("red")
+    assert surface.get_at((15, 10)) == pg.Color("black")
+
+    target = pg.Surface((30, 30))
+    with draw.record(target) as display_list:
+        with draw.translate(target, (2, 2)):
+            draw.segments(target, (255, 0, 0), starts, ends)
+    display_list.replay(target)
+    assert target.get_at((7, 2)) == pg.Color("red")
+    assert display_list.digest is not None
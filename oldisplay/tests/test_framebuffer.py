@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+
+import pygame as pg
+
+from oldisplay.framebuffer import SharedFrameRing, frame_view
+
+
+def test_frame_view():
+    surface = pg.Surface((4, 3))
+    with frame_view(surface) as pixels:
+        pixels[1, 2] = (10, 20, 30)
+    del pixels
+    assert not surface.get_locked()
+    assert surface.get_at((1, 2))[:3] == (10, 20, 30)
+
+
+def test_shared_frame_ring():
+    surface = pg.Surface((4, 3))
+    with SharedFrameRing.create((4, 3), slots=2) as ring:
+        reader = SharedFrameRing.attach(ring.name)
+        assert reader.size == (4, 3) and reader.slots == 2
+        assert reader.read() == (None, None)
+
+        for value in range(3):
+            surface.fill((value, 0, 0))
+            assert ring.publish(surface) == value
+
+        seq, frame = reader.read()
+        assert seq == 2 and frame.shape == (4, 3, 3)
+        assert tuple(frame[3, 2]) == (2, 0, 0)
+        assert reader.read(1)[0] == 1
+        assert reader.read(0) == (None, None)  # Overwritten
+        reader.close()
+
+
+READER = """
+from oldisplay.framebuffer import SharedFrameRing
+reader = SharedFrameRing.attach({name!r})
+seq, frame = reader.read()
+print(seq, frame[0, 0].tolist())
+reader.close()
+"""
+
+
+def test_shared_frame_ring_other_process():
+    surface = pg.Surface((4, 3))
+    surface.fill((7, 8, 9))
+    root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    with SharedFrameRing.create((4, 3), slots=2) as ring:
+        ring.publish(surface)
+        for _ in range(2):  # block survives exit of first reader
+            result = subprocess.run(
+                [sys.executable, "-c", READER.format(name=ring.name)],
+                capture_output=True, text=True, env=env, timeout=60,
+            )
+            assert result.returncode == 0, result.stderr
+            assert result.stdout.splitlines()[-1] == "0 [7, 8, 9]"
+            assert "leaked" not in result.stderr
@@ -0,0 +1,134 @@
+import time
+
+import numpy as np
+import pygame as pg
+import pytest
+
+from oldisplay import draw, inputs
+from oldisplay.components import Graph, Segment
+from oldisplay.components.graph import force_layout
+
+
+@pytest.fixture
+def no_mouse():
+    inputs.set_mouse_pos((-100, -100))
+    yield
+    inputs.set_mouse_pos(None)
+
+
+def test_segment():
+    surface = pg.Surface((20, 20))
+    Segment((2, 10), (17, 10), color="red").update(surface)
+    assert surface.get_at((10, 10)) == pg.Color("red")
+
+
+def test_graph_display(no_mouse):
+    surface = pg.Surface((100, 100))
+    surface.fill((255, 255, 255))
+    graph = Graph(
+        (10, 10), (80, 80), [(10, 10), (70, 10), (70, 70)], [(0, 1), (1, 2)],
+        radius=3, color="blue", edge_color="red",
+    )
+    graph.update(surface)
+    assert surface.get_at((20, 20)) == pg.Color("blue")  # node
+    assert surface.get_at((50, 20)) == pg.Color("red")  # edge 0-1
+    assert surface.get_at((80, 50)) == pg.Color("red")  # edge 1-2
+    assert surface.get_at((50, 50)) == pg.Color("white")  # no edge 0-2
+
+    # Same drawing when translated, recorded and replayed
+    target = pg.Surface((120, 120))
+    target.fill((255, 255, 255))
+    with draw.record(target) as display_list:
+        with draw.translate(target, (20, 20)):
+            graph.update(target)
+    display_list.replay(target)
+    assert target.get_at((70, 40)) == pg.Color("red")
+    assert target.get_at((40, 40)) == pg.Color("blue")
+
+    # Edges are not volatile: identical frames have equal digests
+    assert display_list.digest is not None
+    with draw.record(target) as again:
+        with draw.translate(target, (20, 20)):
+            graph.update(target)
+    assert again.digest == display_list.digest
+    graph.move((60, 60), [1])
+    with draw.record(target) as moved:
+        graph.update(target)
+    assert moved.digest != display_list.digest
+
+
+def test_graph_hit_testing():
+    clicks = []
+
+    class Clickable(Graph):
+        def act_click_node(self, index):
+            clicks.append(index)
+
+    pos = np.random.default_rng(0).uniform(0, 1000, (5000, 2))
+    graph = Clickable((0, 0), (1000, 1000), pos, [], radius=2)
+    assert graph.node_at(pos[1234] + 1) == 1234
+    assert graph.node_at((-50, -50)) is None
+
+    surface = pg.Surface((1000, 1000))
+    down = [pg.event.Event(pg.MOUSEBUTTONDOWN, button=1, pos=(0, 0))]
+    inputs.set_mouse_pos(tuple(pos[42]))
+    try:
+        graph.update(surface, events=down)
+    finally:
+        inputs.set_mouse_pos(None)
+    assert graph.hovered == 42
+    assert clicks == [42]
+
+
+def test_force_layout():
+    rng = np.random.default_rng(0)
+    pos = rng.uniform(0, 10, (20, 2))
+    edges = [(i, i + 1) for i in range(19)]
+    last = None
+    for last in force_layout(pos, edges, (200, 200), iterations=50):
+        pass
+    assert ((last >= 0) & (last < 200)).all()
+    spread = last.max(axis=0) - last.min(axis=0)
+    assert (spread > 50).all()  # nodes repulse each other
+    linked = np.hypot(*(last[1:] - last[:-1]).T)
+    assert linked.mean() < 100  # linked nodes stay close
+
+
+def test_background_layout(no_mouse):
+    rng = np.random.default_rng(0)
+    pos = rng.uniform(0, 10, (30, 2))
+    graph = Graph((0, 0), (200, 200), pos, [(0, i) for i in range(1, 30)])
+    surface = pg.Surface((200, 200))
+    graph.start_layout(iterations=40, every=10)
+    assert graph.layout_running
+
+    start = time.perf_counter()
+    graph.update(surface)  # layout does not block frames
+    assert time.perf_counter() - start < 0.5
+    deadline = time.monotonic() + 60
+    while graph.layout_running and time.monotonic() < deadline:
+        graph.update(surface)
+        time.sleep(0.01)
+    assert not graph.layout_running
+    assert graph.iteration == 40
+    assert (graph.pos.max(axis=0) - graph.pos.min(axis=0) > 50).all()
+
+    graph.start_layout(iterations=10**6)
+    start = time.perf_counter()
+    graph.stop_layout()
+    assert time.perf_counter() - start < 0.1  # does not wait for worker
+    assert not graph.layout_running
+
+
+def test_background_layout_failure(no_mouse):
+    graph = Graph((0, 0), (200, 200), [(0, 0), (10, 10)], [(0, 1)])
+    edges, graph.edges = graph.edges, np.array([(0, 5)])
+    graph.start_layout(iterations=40)  # worker fails on missing node
+    graph.edges = edges
+    deadline = time.monotonic() + 60
+    while graph.layout_running and time.monotonic() < deadline:
+        graph.update(pg.Surface((200, 200)))
+        time.sleep(0.01)
+    assert not graph.layout_running
+    assert graph.layout_exitcode not in (None, 0)
+    assert graph.iteration == 0
@@ -0,0 +1,72 @@
+import pygame as pg
+
+from oldisplay import inputs
+from oldisplay.components import ActiveRectangle, Group, Panel, Rectangle
+from oldisplay.tests.conftest import Counter
+
+
+def test_group_cache():
+    screen = pg.Surface((100, 100))
+    counter = Counter()
+    rect = Rectangle((10, 10), (20, 20), color="red")
+    group = Group((50, 50), (40, 40), components=[counter, rect])
+    outer = Group((0, 0), (100, 100), components=[group])
+    assert counter.parent is group and group.parent is outer
+
+    outer.update(screen)
+    outer.update(screen)
+    assert counter.count == 1
+    assert screen.get_at((65, 65)) == pg.Color("red")
+
+    # Moving group only redraws its container
+    group.ref_pos = (0, 0)
+    outer.update(screen)
+    assert counter.count == 1
+    assert not outer.dirty and not group.dirty
+
+    # Child changes propagate up
+    rect.ref_pos = (0, 0)
+    assert group.dirty and outer.dirty
+    outer.update(screen)
+    assert counter.count == 2
+
+    # Uncached group redraws each time
+    group.cached = False
+    group.update(screen)
+    group.update(screen)
+    assert counter.count == 4
+
+    group.hide()
+    assert outer.dirty
+
+
+def test_group_to_inner():
+    rect = Rectangle((10, 10), (20, 20))
+    group = Group((50, 50), (40, 40), components=[rect])
+    outer = Group((100, 0), (200, 200), components=[group])
+    assert rect.to_local((160, 70)) == (10, 20)
+    assert outer.to_local((160, 70)) == (160, 70)
+
+
+def test_group_hover_same_frame():
+    screen = pg.Surface((100, 100))
+    rect = ActiveRectangle((10, 10), (20, 20), color=("red", "blue"))
+    group = Group((0, 0), (50, 50), components=[rect])
+    panel = Panel((50, 50), (50, 50), components=[
+        ActiveRectangle((10, 10), (20, 20), color=("red", "blue"))
+    ])
+    try:
+        inputs.set_mouse_pos((0, 0))
+        group.update(screen)
+        panel.update(screen)
+        assert screen.get_at((15, 15)) == pg.Color("red")
+        assert screen.get_at((65, 65)) == pg.Color("red")
+
+        inputs.set_mouse_pos((15, 15))
+        group.update(screen)
+        assert screen.get_at((15, 15)) == pg.Color("blue")
+        inputs.set_mouse_pos((65, 65))
+        panel.update(screen)
+        assert screen.get_at((65, 65)) == pg.Color("blue")
+    finally:
+        inputs.set_mouse_pos(None)
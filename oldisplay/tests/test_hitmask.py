@@ -0,0 +1,41 @@
+import os
+
+import pygame as pg
+
+from oldisplay.components import ActiveImage, ActiveText
+from oldisplay.components.hitmask import get_mask
+
+RESOURCES = os.path.join(os.path.dirname(__file__), "..", "..", "resources")
+
+
+def test_active_image():
+    path = os.path.join(RESOURCES, "basketball.png")
+    image = ActiveImage(path, (10, 10), (40, 40))
+    mask = get_mask(image.image)
+    assert mask is get_mask(image.image)
+    pixels = [(x, y) for x in range(40) for y in range(40)]
+    opaque = next(pixel for pixel in pixels if mask.get_at(pixel))
+    transparent = next(pixel for pixel in pixels if not mask.get_at(pixel))
+
+    assert image.is_within((10 + opaque[0], 10 + opaque[1]))
+    assert not image.is_within((10 + transparent[0], 10 + transparent[1]))
+    assert not image.is_within((100, 100))
+
+    image.pixel_perfect = False
+    assert image.is_within((10 + transparent[0], 10 + transparent[1]))
+
+
+def test_active_text_mask():
+    pg.font.init()
+    text = ActiveText("Hello world", (0, 0), rotate=45, height=20,
+                      pixel_perfect=True)
+    text.init(None)
+    dx, dy = text.size
+    assert not text.is_within((1, 1))
+    assert not text.is_within((dx - 2, dy - 2))
+    surf = text.get_surf()
+    mask = get_mask(surf)
+    x, y = next(
+        (x, y) for x in range(dx) for y in range(dy) if mask.get_at((x, y))
+    )
+    assert text.is_within((x, y))
@@ -0,0 +1,88 @@
+import gzip
+import json
+
+import pygame as pg
+
+from oldisplay import Window, inputs
+from oldisplay.components import ActiveRectangle
+
+
+class Button(ActiveRectangle):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.clicks = 0
+        self.hovers = 0
+
+    def act_release_click(self):
+        self.clicks += 1
+
+    def display_hovered(self, surface):
+        self.hovers += 1
+        super().display_hovered(surface)
+
+
+def session(button):
+    window = Window(size=(100, 100))
+    window.components.append(button)
+    return window
+
+
+def click(position):
+    return [
+        pg.event.Event(pg.MOUSEBUTTONDOWN, button=1, pos=position),
+        pg.event.Event(pg.MOUSEBUTTONUP, button=1, pos=position),
+    ]
+
+
+def test_record_replay(tmp_path, monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    path = str(tmp_path / "session.ole")
+    button = Button((10, 10), (20, 20), color="red")
+    window = session(button)
+
+    # Record a session
+    with inputs.EventRecorder(path) as recorder:
+        recorder.attach(window)
+        window.start()
+        moves = [(0, 0), (15, 15), (15, 15), (50, 50), (20, 20), (20, 20)]
+        for frame, position in enumerate(moves):
+            inputs.set_mouse_pos(position)
+            events = click(position) if frame in (2, 5) else []
+            window.draw_frame(events=events)
+            window.ticks += 1
+        window.end()
+    inputs.set_mouse_pos(None)
+    assert (button.clicks, button.hovers) == (2, 4)
+    assert recorder.records == 6
+
+    header, records = inputs.read_events(path)
+    assert header['size'] == (100, 100)
+    assert [pos for _, pos, _ in records][1:3] == [(15, 15), None]
+
+    # Replay it on a new window
+    replayed = Button((10, 10), (20, 20), color="red")
+    report = inputs.replay(path, session(replayed), frames=len(moves))
+    assert (replayed.clicks, replayed.hovers) == (2, 4)
+    assert report['frames'] == len(moves) and report['max'] > 0
+
+
+def test_recording_plain_data(tmp_path):
+    path = str(tmp_path / "session.ole")
+    with inputs.EventRecorder(path) as recorder:
+        recorder.start((100, 100))
+        recorder.capture(3, [pg.event.Event(
+            pg.MOUSEBUTTONDOWN, button=1, pos=(5, 6), window=object(),
+        )], (5, 6))
+
+    with gzip.open(path, "rt") as file:
+        lines = [json.loads(line) for line in file]  # no code, data only
+    assert lines[1] == [3, [5, 6], [[pg.MOUSEBUTTONDOWN, {
+        'button': 1, 'pos': [5, 6],
+    }]]]
+
+    header, records = inputs.read_events(path)
+    assert header['size'] == (100, 100)
+    (frame, pos, (event,)), = records
+    assert (frame, pos) == (3, (5, 6))
+    assert event.type == pg.MOUSEBUTTONDOWN and event.pos == (5, 6)
@@ -0,0 +1,45 @@
+import pygame as pg
+
+from oldisplay.components import Panel, Rectangle
+
+
+def test_panel_interval():
+    screen = pg.Surface((100, 100))
+    rect = Rectangle((0, 0), (10, 10), color="red")
+    panel = Panel((20, 20), (50, 50), components=[rect], interval=500,
+                  background="blue")
+    now = [0]
+    panel.clock = lambda: now[0]
+
+    panel.update(screen)
+    assert panel.renders == 1
+    assert screen.get_at((25, 25)) == pg.Color("red")
+    assert screen.get_at((40, 40)) == pg.Color("blue")
+
+    # Changes are displayed once interval elapsed
+    rect.place((20, 20), (10, 10))
+    now[0] = 200
+    panel.update(screen)
+    assert panel.renders == 1 and panel.dirty
+    assert screen.get_at((25, 25)) == pg.Color("red")
+    now[0] = 500
+    panel.update(screen)
+    assert panel.renders == 2
+    assert screen.get_at((25, 25)) == pg.Color("blue")
+    assert screen.get_at((45, 45)) == pg.Color("red")
+
+
+def test_static_panel():
+    screen = pg.Surface((100, 100))
+    panel = Panel((0, 0), (50, 50), components=[
+        Rectangle((0, 0), (10, 10), color="red")
+    ])
+    for _ in range(5):
+        panel.update(screen)
+    assert panel.renders == 1
+
+    # Uncached panel is redrawn at each interval
+    panel.cached = False
+    panel.update(screen)
+    panel.update(screen)
+    assert panel.renders == 3
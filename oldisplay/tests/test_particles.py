@@ -0,0 +1,48 @@
+import numpy as np
+import pygame as pg
+
+from oldisplay.components import ParticleSystem
+
+
+def test_particles_step():
+    particles = ParticleSystem((0, 0), (100, 100), 4, gravity=(0, 10))
+    slots = particles.spawn([(10, 10), (50, 50), (95, 50)],
+                            vel=[(0, 0), (10, 0), (10, 0)], life=[2, 0.5, 2])
+    assert slots.tolist() == [0, 1, 2] and len(particles) == 3
+
+    particles.step(1)
+    assert particles.pos[0].tolist() == [10, 20]
+    assert particles.alive.tolist() == [True, False, False, False]
+
+    # Free slots are reused, extra particles are not spawned
+    slots = particles.spawn(np.zeros((5, 2)))
+    assert slots.tolist() == [1, 2, 3] and len(particles) == 4
+
+    particles.kill(particles.pos[:, 1] < 15)
+    assert len(particles) == 1
+
+
+def test_particles_display():
+    surface = pg.Surface((50, 50))
+    particles = ParticleSystem((10, 10), (20, 20), 10, color="red")
+    particles.spawn([(0, 0), (5, 5)], color=[(255, 0, 0), (0, 0, 255)])
+    particles.display(surface, **particles.params)
+    assert surface.get_at((10, 10)) == pg.Color("red")
+    assert surface.get_at((15, 15)) == pg.Color("blue")
+
+    disks = ParticleSystem((0, 0), (50, 50), 10, radius=2)
+    disks.spawn([(10, 10), (20, 20)], color="green")
+    surface.fill((0, 0, 0))
+    disks.display(surface, **disks.params)
+    assert surface.get_at((11, 10))[:3] == (0, 128, 0)
+    assert surface.get_at((20, 22))[:3] == (0, 128, 0)
+    assert surface.get_at((15, 15))[:3] == (0, 0, 0)
+
+
+def test_particles_formats():
+    particles = ParticleSystem((0, 0), (10, 10), 1, color="blue")
+    particles.spawn([(5, 5)])
+    for surface in [pg.Surface((10, 10), pg.SRCALPHA, 32),
+                    pg.Surface((10, 10), 0, 24)]:
+        particles.display(surface, **particles.params)
+        assert surface.get_at((5, 5)) == pg.Color("blue")
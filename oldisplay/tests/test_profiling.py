@@ -0,0 +1,138 @@
+import gc
+
+import pygame as pg
+
+from oldisplay import Window
+from oldisplay.components import ActiveDisk, Rectangle, Text
+from oldisplay.profiling import FrameProfiler, IdleCollector
+from oldisplay.tests.conftest import run_frames
+
+
+class Garbage(Rectangle):
+    """Rectangle building reference cycles at each update"""
+
+    def update(self, surface, events=None):
+        for _ in range(100):
+            cycle = []
+            cycle.append(cycle)
+        return super().update(surface, events=events)
+
+
+def make_window(**kwargs):
+    window = Window(size=(100, 100), **kwargs)
+    window.components += [
+        Rectangle((10, 10), (20, 20), color="red", outline="black", width=2),
+        Garbage((50, 50), (20, 20), color="blue"),
+        Text("Hello", (50, 20)),
+    ]
+    return window
+
+
+def test_active_disk():
+    disk = ActiveDisk((50, 50), 10, color="red")
+    assert disk.is_within((50, 50))
+    assert disk.is_within((56, 58))
+    assert not disk.is_within((58, 58))
+
+
+def test_frame_profiler(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    window = make_window()
+    profiler = FrameProfiler(frames=3)
+    profiler.attach(window)
+    try:
+        run_frames(window, 5, events=[])
+        gc.collect()  # outside of frames, not accounted
+    finally:
+        profiler.detach(window)
+    run_frames(window, 1, events=[])
+
+    report = profiler.report()
+    assert set(report) == {
+        'events', 'clean', 'hooks', 'flip',
+        'update:Rectangle', 'update:Garbage', 'update:Text',
+    }
+    assert all(stats['calls'] == 5 for stats in report.values())
+    assert report['update:Garbage']['allocated'] > 100 * 50
+    assert list(report)[0] == "update:Garbage"
+    assert len(profiler.history) == 3
+    stats = profiler.frame_stats()
+    assert len(stats['time']) == 3
+    assert (stats['allocated'] > 0).all()
+    assert isinstance(profiler.growth(), list)
+    assert window.profiler is None
+
+
+def test_frame_profiler_skip_identical(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    window = make_window(skip_identical=True)
+    profiler = FrameProfiler()
+    profiler.attach(window)
+    try:
+        run_frames(window, 3, events=[])
+    finally:
+        profiler.detach(window)
+
+    report = profiler.report()
+    assert window.skipped == 2  # frames are still skipped when profiled
+    assert report['replay']['calls'] == report['flip']['calls'] == 1
+    assert report['update:Text']['calls'] == 3
+    assert len(profiler.history) == 3
+
+
+def test_frame_profiler_gc(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    window = make_window()
+    profiler = FrameProfiler()
+    thresholds = gc.get_threshold()
+    gc.set_threshold(10)
+    profiler.attach(window)
+    try:
+        run_frames(window, 3, events=[])
+    finally:
+        profiler.detach(window)
+        gc.set_threshold(*thresholds)
+    collections = sum(
+        stats['collections'] for stats in profiler.phases.values()
+    )
+    assert collections > 0
+    assert collections <= sum(  # frames account collections b/w phases
+        frame['collections'] for frame in profiler.history
+    )
+
+
+def test_idle_collector(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    window = make_window()
+    collector = IdleCollector(max_pending=10**9)
+    enabled = gc.isenabled()
+    window.start()
+    try:
+        hook = collector.attach(window)
+        assert hook in window.frame_hooks
+        assert not gc.isenabled()
+        window.draw_frame(events=[])  # freezes objects of window
+        assert gc.get_freeze_count() > 0
+
+        # Slow frames: garbage is kept
+        collector.clock = lambda: window.frame_start + 1
+        window.draw_frame(events=[])
+        assert collector.collections == [0, 0, 0]
+
+        # Fast frames: garbage is collected
+        collector.clock = lambda: window.frame_start
+        window.draw_frame(events=[])
+        assert sum(collector.collections) == 1
+
+        # Too much garbage: collection is forced
+        collector.clock = lambda: window.frame_start + 1
+        collector.max_pending = 1
+        window.draw_frame(events=[])
+        assert collector.forced == 1
+        assert sum(collector.collections) == 2
+    finally:
+        collector.detach(window)
+        window.end()
+    assert gc.get_freeze_count() == 0
+    assert gc.isenabled() == enabled
+    assert hook not in window.frame_hooks
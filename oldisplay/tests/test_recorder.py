@@ -0,0 +1,34 @@
+import os
+
+import pygame as pg
+
+from oldisplay.recorder import FrameRecorder, read_zlib_frames
+
+
+def test_recorder_zlib(tmp_path):
+    path = str(tmp_path / "session.olz")
+    surface = pg.Surface((4, 3))
+    with FrameRecorder(path, fmt="zlib", every=2, policy="block") as recorder:
+        for frame in range(5):
+            surface.fill((frame, 0, 0))
+            recorder.capture(surface, frame)
+    assert recorder.written == 3 and recorder.dropped == 0
+
+    frames = list(read_zlib_frames(path))
+    assert [index for index, _ in frames] == [0, 2, 4]
+    assert frames[1][1].shape == (3, 4, 3)
+    assert tuple(frames[1][1][2, 3]) == (2, 0, 0)
+
+
+def test_recorder_png_and_drop(tmp_path):
+    path = str(tmp_path / "frames")
+    surface = pg.Surface((4, 3))
+    recorder = FrameRecorder(path, fmt="png", buffers=1, policy="drop")
+    recorder.start(surface.get_size())
+    busy = recorder._free.get()  # Buffer still used by writer
+    assert not recorder.capture(surface)
+    assert recorder.dropped == 1
+    recorder._free.put(busy)
+    assert recorder.capture(surface, 1)
+    recorder.close()
+    assert os.listdir(path) == ["frame_000001.png"]
@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from oldisplay import scene as lib
+from oldisplay import components
+from oldisplay.collections import COLORS
+
+SCENE = {
+    "components": [
+        {"type": "FillingGrid", "dx": 50, "dy": 50, "color": "cyan"},
+        {"type": "ActiveRectangle", "ref_pos": [100, 0], "size": [50, 50],
+         "color": ["green", "blue"], "width": ["DFT", 3], "align": "center"},
+        {"type": "Rectangle", "args": [[0, 0], [5, 5]],
+         "color": [255, 0, 0]},
+        {"type": "Group", "ref_pos": [0, 400], "size": [200, 100],
+         "components": [
+             {"type": "ActiveText", "string": "hello", "ref_pos": [0, 0],
+              "height": 20, "italic": [False, True]},
+         ]},
+    ]
+}
+
+
+def test_load_scene(tmp_path):
+    path = tmp_path / "scene.json"
+    path.write_text(json.dumps(SCENE))
+    grid, active, rect, group = lib.load_scene(str(path))
+
+    assert isinstance(grid, components.FillingGrid)
+    assert active.params_n['color'] == COLORS.green
+    assert active.params_h['color'] == COLORS.blue
+    assert active.params_h['width'] == 3 and active.params_n['width'] is None
+    assert (active.h_align, active.v_align) == ("center", "center")
+    assert rect.params['color'] == COLORS.red
+    text, = group.components
+    assert text.parent is group
+    assert text.params_h['italic'] and not text.params_n['italic']
+    assert (tmp_path / "scene.json.cache").exists()
+
+
+def test_scene_cache(tmp_path, monkeypatch):
+    path = tmp_path / "scene.json"
+    path.write_text(json.dumps(SCENE))
+    scene = lib.Scene(str(path))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Scene compiled again")
+
+    monkeypatch.setattr(lib, "compile_scene", fail)
+    scene.reload()
+    assert len(scene.components) == 4
+
+    path.write_text(json.dumps({"components": SCENE["components"][:1]}))
+    with pytest.raises(AssertionError):
+        scene.reload()
+    monkeypatch.undo()
+    scene.reload()
+    assert len(scene.components) == 1
+
+
+def test_scene_cache_plain_data(tmp_path):
+    path = tmp_path / "scene.json"
+    path.write_text(json.dumps(SCENE))
+    compiled = lib.load_compiled(str(path))
+    cached = lib.load_compiled(str(path))
+    assert cached == compiled
+    rect = cached['components'][2]
+    assert type(rect[1][0]) is tuple
+    assert type(rect[2]['color']) is type(COLORS.red)
+    json.loads((tmp_path / "scene.json.cache").read_text())
+
+    # A cache that is not json is ignored, never executed
+    (tmp_path / "scene.json.cache").write_bytes(b"\x80\x04cos\nsystem\n.")
+    assert lib.load_compiled(str(path)) == compiled
+
+
+def test_scene_dft_text(tmp_path):
+    path = tmp_path / "scene.json"
+    path.write_text(json.dumps({"components": [
+        {"type": "Text", "string": "DFT", "ref_pos": [0, 0]},
+    ]}))
+    text, = lib.load_scene(str(path))
+    assert text.string == "DFT"
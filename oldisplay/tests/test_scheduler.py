@@ -0,0 +1,98 @@
+import pygame as pg
+
+from oldisplay.components import Rectangle
+from oldisplay.scheduler import Scheduler
+
+
+def test_scheduler_frames():
+    screen = pg.Surface((100, 100))
+    scheduler = Scheduler()
+    tasks = [
+        scheduler.add(Rectangle((10 * i, 0), (10, 10)), frames=4)
+        for i in range(4)
+    ]
+    assert [task.phase for task in tasks] == [0, 1, 2, 3]
+
+    scheduler.update(screen)
+    assert [task.renders for task in tasks] == [1, 1, 1, 1]
+    for _ in range(4):
+        scheduler.update(screen)
+    assert [task.renders for task in tasks] == [2, 2, 2, 2]
+
+
+def test_scheduler_on_demand():
+    screen = pg.Surface((100, 100))
+    rect = Rectangle((10, 10), (20, 20), color="red")
+    scheduler = Scheduler()
+    task = scheduler.add(rect)
+
+    scheduler.update(screen)
+    screen.fill((0, 0, 0))
+    scheduler.update(screen)
+    assert task.renders == 1
+    assert screen.get_at((15, 15)) == pg.Color("red")  # last display kept
+
+    rect.params['color'] = pg.Color("blue")
+    rect.invalidate()
+    scheduler.update(screen)
+    assert task.renders == 2
+    assert screen.get_at((15, 15)) == pg.Color("blue")
+
+
+def test_scheduler_ms():
+    screen = pg.Surface((100, 100))
+    scheduler = Scheduler()
+    now = [0]
+    scheduler.clock = lambda: now[0]
+    tasks = [
+        scheduler.add(Rectangle((0, 0), (10, 10)), ms=100) for _ in range(2)
+    ]
+    scheduler.update(screen)
+    assert [task.due_time for task in tasks] == [100, 50]
+
+    renders = []
+    for now[0] in range(10, 210, 10):
+        scheduler.update(screen)
+        renders.append(sum(task.renders for task in tasks))
+    assert renders[-1] == 6
+    # Never two redraws on the same frame
+    assert all(b - a <= 1 for a, b in zip(renders, renders[1:]))
+
+
+def test_scheduler_keeps_surfaces():
+    screen = pg.Surface((100, 100))
+    rect = Rectangle((10, 10), (20, 20), color="red")
+    inits = []
+    rect.init = inits.append
+    scheduler = Scheduler()
+    task = scheduler.add(rect, frames=10)
+
+    scheduler.init(screen)
+    scheduler.update(screen)
+    surface = task.surface
+    scheduler.request(rect)
+    scheduler.update(screen)
+    scheduler.init(screen)
+    scheduler.update(screen)
+    assert task.renders == 3
+    assert len(inits) == 1
+    assert task.surface is surface
+
+
+class Unbounded(Rectangle):
+    """Rectangle not telling the area it covers"""
+    bbox = None
+
+
+def test_scheduler_unbounded():
+    screen = pg.Surface((100, 100))
+    rect = Unbounded((10, 10), (20, 20), color="red")
+    scheduler = Scheduler()
+    task = scheduler.add(rect)
+
+    scheduler.update(screen)
+    assert task.area == pg.Rect(10, 10, 20, 20)
+    screen.fill((0, 0, 0))
+    scheduler.update(screen)
+    assert task.renders == 1
+    assert screen.get_at((15, 15)) == pg.Color("red")
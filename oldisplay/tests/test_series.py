@@ -0,0 +1,101 @@
+import numpy as np
+import pygame as pg
+
+from oldisplay.components import StripChart, TimeSeries
+
+
+def brute_buckets(values, start, step):
+    first = start // step
+    buckets = {}
+    for index, value in enumerate(values, start):
+        buckets.setdefault(index // step - first, []).append(value)
+    return (
+        np.array([min(buckets[k]) for k in sorted(buckets)]),
+        np.array([max(buckets[k]) for k in sorted(buckets)]),
+    )
+
+
+def test_time_series_decimation():
+    rng = np.random.default_rng(0)
+    series = TimeSeries((0, 0), (10, 20), capacity=95)
+    assert series.step == 10
+    data = []
+    for chunk in [3, 1, 40, 70, 1, 200, 7]:
+        values = rng.normal(size=chunk)
+        if chunk == 1:
+            series.append(values[0])
+        else:
+            series.extend(values)
+        data.extend(values)
+
+        visible = data[-95:]
+        assert series.count == len(data)
+        assert np.array_equal(series.values(), visible)
+        mins, maxs = series.buckets()
+        exp_mins, exp_maxs = brute_buckets(visible, series.start, 10)
+        assert np.allclose(mins, exp_mins) and np.allclose(maxs, exp_maxs)
+
+    points = series.points
+    assert len(points) <= 2 * 11
+    assert all(0 <= x < 10 and 0 <= y < 20 for x, y in points)
+
+
+def test_time_series_display():
+    surface = pg.Surface((20, 20))
+    series = TimeSeries((5, 5), (10, 10), capacity=10, y_range=(0, 1),
+                        color="red")
+    series.extend([1] * 10)
+    series.update(surface)
+    assert surface.get_at((5, 5)) == pg.Color("red")
+    assert surface.get_at((14, 5)) == pg.Color("red")
+    assert surface.get_at((5, 14)) == pg.Color("black")
+
+
+def test_strip_chart():
+    screen = pg.Surface((10, 10))
+    chart = StripChart((0, 0), (10, 10), y_range=(0, 9), step=2,
+                       color="red", background="black")
+    chart.extend([9, 9])
+    chart.update(screen)
+    assert screen.get_at((9, 0)) == pg.Color("red")
+    assert screen.get_at((7, 0)) == pg.Color("red")
+    assert screen.get_at((5, 0)) == pg.Color("black")
+
+    calls = []
+    chart.surface = Spy(chart.surface, calls)
+    chart.push(0)
+    chart.update(screen)
+    assert calls == [(-2, 0)]
+    assert screen.get_at((5, 0)) == pg.Color("red")  # scrolled
+    assert screen.get_at((9, 9)) == pg.Color("red")  # new value
+
+
+def test_strip_chart_gaps_and_resize():
+    screen = pg.Surface((20, 20))
+    chart = StripChart((0, 0), (10, 10), y_range=(0, 9), step=1,
+                       color="red", background="black")
+    chart.extend([0, 0, float("nan"), 9, 9])
+    chart.update(screen)
+    assert screen.get_at((6, 9)) == pg.Color("red")
+    assert screen.get_at((7, 9)) == pg.Color("black")  # gap
+    assert screen.get_at((8, 0)) == pg.Color("red")
+    assert screen.get_at((7, 4)) == pg.Color("black")  # not joined
+
+    chart.size = (20, 20)
+    chart.push(9)
+    chart.update(screen)
+    assert chart.surface.get_size() == (20, 20)
+    assert screen.get_at((19, 0)) == pg.Color("red")
+
+
+class Spy(pg.Surface):
+    """Surface recording calls to scroll"""
+
+    def __init__(self, surface, calls):
+        super().__init__(surface.get_size())
+        self.blit(surface, (0, 0))
+        self.calls = calls
+
+    def scroll(self, dx=0, dy=0):
+        self.calls.append((dx, dy))
+        return super().scroll(dx, dy)
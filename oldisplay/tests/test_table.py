@@ -0,0 +1,107 @@
+import pygame as pg
+
+from oldisplay import inputs
+from oldisplay.components import Table
+
+
+def provider(calls):
+    def get_row(index):
+        calls.append(index)
+        return (index, f"row {index}", index * 0.5)
+    return get_row
+
+
+def test_table_virtualization():
+    pg.font.init()
+    calls = []
+    table = Table(
+        (0, 0), (200, 100), provider(calls), [50, 100, 50],
+        n_rows=10**6, header=["id", "name", "value"], stripe="grey",
+    )
+    screen = pg.Surface((200, 100))
+    table.init(screen)
+    height = table.row_height
+    table.update(screen)
+
+    first, last = table.visible_range()
+    assert first == 0
+    assert last == -(-table.body_height // height)
+    assert table.materialized == list(range(first, last))
+    assert sorted(calls) == table.materialized
+    assert table.renders == last
+
+    # Scrolling by a few pixels keeps rows, their surfaces are reused
+    table.scroll(height // 2)
+    table.update(screen)
+    assert table.renders <= last + 1
+    surfaces = set(map(id, table._surfaces.values()))
+
+    # Far scroll: only rows entering the area are pulled
+    calls.clear()
+    table.scroll_to(500000)
+    table.update(screen)
+    assert table.materialized[0] == 500000
+    assert sorted(calls) == table.materialized
+    assert set(map(id, table._surfaces.values())) <= surfaces
+
+    # Bottom is reachable but not beyond
+    table.scroll(10**9)
+    table.update(screen)
+    assert table.offset == table.max_offset
+    assert table.materialized[-1] == 10**6 - 1
+
+
+def test_table_recycles_surfaces():
+    pg.font.init()
+    rows = [(i, str(i)) for i in range(100)]
+    table = Table((0, 0), (100, 60), rows, [50, 50])
+    screen = pg.Surface((100, 60))
+    table.init(screen)
+    table.update(screen)
+    surfaces = set(map(id, table._surfaces.values()))
+    for _ in range(20):
+        table.scroll(7)
+        table.update(screen)
+    assert len(table._surfaces) <= len(surfaces) + 1
+    assert table.materialized[0] == round(table.offset) // table.row_height
+
+
+def test_table_smooth_wheel():
+    pg.font.init()
+    rows = [(i,) for i in range(1000)]
+    table = Table((10, 10), (100, 100), rows, [100], smoothing=0.5)
+    screen = pg.Surface((200, 200))
+    table.init(screen)
+    wheel = [pg.event.Event(pg.MOUSEWHEEL, x=0, y=-1)]
+
+    inputs.set_mouse_pos((150, 150))  # out of table
+    try:
+        table.update(screen, events=wheel)
+        assert table.offset == 0
+
+        inputs.set_mouse_pos((50, 50))
+        table.update(screen, events=wheel)
+        assert table.offset == table.wheel_step / 2
+        table.update(screen)
+        assert table.offset == table.wheel_step * 3 / 4
+        for _ in range(10):
+            table.update(screen)
+        assert table.offset == table.wheel_step
+    finally:
+        inputs.set_mouse_pos(None)
+
+
+def test_table_display():
+    pg.font.init()
+    rows = [("#####",)] * 50
+    table = Table((0, 0), (60, 45), rows, [60], stripe="red", height=12)
+    screen = pg.Surface((60, 45))
+    screen.fill((255, 255, 255))
+    table.init(screen)
+    table.update(screen)
+    height = table.row_height
+    assert screen.get_at((58, height + 1)) == pg.Color("red")  # odd row
+    assert screen.get_at((58, 1)) == pg.Color("white")
+    assert screen.get_at((58, 44)) == pg.Color(
+        "red" if (44 // height) % 2 else "white"
+    )
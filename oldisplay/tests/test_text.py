@@ -0,0 +1,105 @@
+import pygame as pg
+
+from oldisplay.collections import FontManager
+from oldisplay.components import Paragraph, Text
+
+TEXT = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod"
+    " tempor incididunt ut labore et dolore magna aliqua."
+)
+
+
+def test_paragraph_wrap():
+    pg.font.init()
+    paragraph = Paragraph(TEXT + "\nUnbreakablewordlongerthanbox", (0, 0),
+                          (120, 200))
+    font = FontManager.get(**paragraph.params)
+    lines = paragraph.lines
+    assert " ".join(lines[:-2]) == TEXT
+    assert "".join(lines[-2:]) == "Unbreakablewordlongerthanbox"
+    assert all(font.size(line)[0] <= 120 for line in lines)
+    for line, following in zip(lines[:-3], lines[1:-2]):
+        first = following.split(" ")[0]
+        assert font.size(f"{line} {first}")[0] > 120
+
+
+def test_paragraph_append():
+    pg.font.init()
+    paragraph = Paragraph("", (0, 0), (120, 200))
+    for word in TEXT.split(" "):
+        paragraph.append(word if not paragraph.string else " " + word)
+    paragraph.append("\nsecond\nthird")
+    expected = Paragraph(paragraph.string, (0, 0), (120, 200))
+    assert paragraph.string == TEXT + "\nsecond\nthird"
+    assert paragraph.lines == expected.lines
+
+    surface = pg.Surface((120, 200))
+    paragraph.update(surface)
+    surfaces = dict(paragraph._surfaces)
+    paragraph.append(" more")
+    paragraph.update(surface)
+    changed = [
+        line for line, surf in paragraph._surfaces.items()
+        if surfaces.get(line) is not surf
+    ]
+    assert changed == ["third more"]
+
+
+def test_paragraph_stream_string():
+    pg.font.init()
+    expected = Paragraph(TEXT, (0, 0), (120, 200)).lines
+    Paragraph.wrap_cache.clear()
+    paragraph = Paragraph("", (0, 0), (120, 200))
+    for i in range(1, len(TEXT) + 1):
+        paragraph.string = TEXT[:i]
+    assert paragraph.lines == expected
+    # Cached texts are last lines and their additions, not whole paragraphs
+    assert max(len(text) for text, _, _ in Paragraph.wrap_cache) < 40
+    assert Paragraph.wrap_cache.max_entries is not None
+
+
+def test_paragraph_resize_and_look():
+    pg.font.init()
+    paragraph = Paragraph(TEXT, (0, 0), (120, 200))
+    narrow = len(paragraph.lines)
+    paragraph.size = (400, 200)  # wrapped again without display
+    assert len(paragraph.lines) < narrow
+    assert paragraph.lines == Paragraph(TEXT, (0, 0), (400, 200)).lines
+
+    surface = pg.Surface((400, 200))
+    paragraph.display(surface, **dict(paragraph.params, color=(255, 0, 0)))
+    colors = {
+        tuple(color)
+        for color in pg.surfarray.array3d(surface).reshape(-1, 3).tolist()
+    }
+    assert (255, 0, 0) in colors
+
+
+def test_text_surfaces_font_evicted():
+    pg.font.init()
+    text = Text("Hello", (0, 0))
+    surf = text.get_surf()
+    FontManager.font_cache.clear()  # fonts evicted by budget of registry
+    assert text.get_surf() is surf
+    assert len(text._surfaces) == 1
+
+
+def test_paragraph_cut_long_word():
+    pg.font.init()
+    word = "x" * 500
+    paragraph = Paragraph(word, (0, 0), (50, 500))
+    font = FontManager.get(**paragraph.params)
+    calls = []
+    size = font.size
+
+    class Spy:
+        def size(self, text):
+            calls.append(text)
+            return size(text)
+
+    cut = Paragraph.cut(Spy(), word, 50)
+    assert size(word[:cut])[0] <= 50 < size(word[:cut + 1])[0]
+    assert len(calls) <= 10  # log2(500)
+    lines = paragraph.lines
+    assert "".join(lines) == word
+    assert all(font.size(line)[0] <= 50 for line in lines)
@@ -0,0 +1,116 @@
+import pygame as pg
+
+from oldisplay import draw, inputs
+from oldisplay.collections import COLORS
+from oldisplay.components import ActiveRectangle, Rectangle, Viewport
+
+
+def test_translate():
+    surface = pg.Surface((20, 20))
+    with draw.translate(surface, (5, 5)):
+        with draw.translate(surface, (5, 0)):
+            assert draw.get_offset(surface) == (10, 5)
+            draw.rect(surface, "red", (0, 0, 2, 2))
+        assert draw.get_offset(surface) == (5, 5)
+    assert draw.get_offset(surface) == (0, 0)
+    assert surface.get_at((10, 5)) == pg.Color("red")
+    assert surface.get_at((0, 0)) == pg.Color("black")
+
+
+def test_viewport_camera():
+    viewport = Viewport((100, 100), (200, 100), origin=(1000, 500))
+    assert viewport.to_world((10, 10)) == (1010, 510)
+    assert viewport.to_inner((110, 110)) == (1010, 510)
+
+    viewport.zoom_at(2, (0, 0))
+    assert viewport.origin == (1000, 500)
+    assert viewport.to_world((10, 10)) == (1005, 505)
+    assert viewport.to_view((1005, 505)) == (10, 10)
+    assert viewport.view == pg.Rect(1000, 500, 100, 50)
+
+    viewport.look_at((0, 0))
+    assert viewport.origin == (-50, -25)
+
+
+def test_viewport_culling_and_tiles():
+    screen = pg.Surface((100, 100))
+    near = Rectangle((10, 10), (10, 10), color="red")
+    far = Rectangle((5000, 5000), (10, 10), color="blue")
+    ground = [
+        Rectangle((x, 0), (10, 10), color="green")
+        for x in range(0, 1000, 50)
+    ]
+    viewport = Viewport(
+        (0, 0), (100, 100), components=[near, far], static=ground,
+        tile_size=64,
+    )
+    calls = []
+    far.display = lambda surface, **params: calls.append(surface)
+
+    viewport.update(screen)
+    assert not calls
+    assert screen.get_at((15, 15)) == pg.Color("red")
+    assert screen.get_at((55, 5))[:3] == COLORS.green
+    assert len(viewport.tiles) == 4
+
+    viewport.pan(64, 0)
+    viewport.update(screen)
+    assert len(viewport.tiles) == 6
+    assert screen.get_at((36, 5))[:3] == COLORS.green  # world x=100
+
+    ground[0].invalidate()
+    assert len(viewport.tiles) == 0
+
+
+def test_viewport_zoom_scaled_tiles():
+    screen = pg.Surface((100, 100))
+    near = Rectangle((10, 10), (10, 10), color="red")
+    ground = [Rectangle((0, 40), (200, 10), color="green")]
+    viewport = Viewport(
+        (0, 0), (100, 100), components=[near], static=ground,
+        tile_size=64, zoom=0.5,
+    )
+    viewport.update(screen)
+    assert screen.get_at((7, 7)) == pg.Color("red")
+    assert screen.get_at((80, 22))[:3] == COLORS.green
+    assert viewport._frame.get_size() == (10, 10)  # not world view (200, 200)
+    scaled = dict(viewport.tiles._scaled)
+    assert scaled and all(
+        surface.get_size() == (32, 32) for surface in scaled.values()
+    )
+
+    viewport.update(screen)
+    assert all(
+        viewport.tiles._scaled[key] is surface
+        for key, surface in scaled.items()
+    )
+
+    viewport.zoom = 2
+    viewport.update(screen)
+    assert screen.get_at((25, 25)) == pg.Color("red")
+    assert screen.get_at((90, 85))[:3] == COLORS.green
+    assert all(
+        surface.get_size() == (128, 128)
+        for surface in viewport.tiles._scaled.values()
+    )
+
+
+def test_viewport_culled_mouse_state():
+    screen = pg.Surface((100, 100))
+    button = ActiveRectangle((10, 10), (20, 20), color=("red", "blue"))
+    viewport = Viewport((0, 0), (100, 100), components=[button])
+    try:
+        inputs.set_mouse_pos((15, 15))
+        viewport.update(screen)
+        assert button.is_hovered
+
+        viewport.pan(200, 0)  # button culled while hovered
+        viewport.update(screen)
+        assert not button.is_hovered
+
+        inputs.set_mouse_pos((90, 90))
+        viewport.pan(-200, 0)
+        viewport.update(screen)
+        assert screen.get_at((15, 15)) == pg.Color("red")
+    finally:
+        inputs.set_mouse_pos(None)
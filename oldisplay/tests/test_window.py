@@ -0,0 +1,113 @@
+import asyncio
+
+import pygame as pg
+import pytest
+
+from oldisplay import Window
+from oldisplay.components import Image, Rectangle
+from oldisplay.components.component import Component
+from oldisplay.tests.conftest import Counter, run_frames
+
+
+def test_window_async(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    counter = Counter()
+    window = Window(size=(50, 50), fps=100)
+    window.components.append(counter)
+
+    async def main():
+        async with window:
+            assert window.initiated
+            ticks = [await window.next_frame() for _ in range(3)]
+            assert ticks == list(range(ticks[0], ticks[0] + 3))
+            assert counter.count == ticks[-1]
+        assert not window.initiated
+        assert await window.next_frame() == window.ticks
+
+    asyncio.run(main())
+
+
+def test_window_thread(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    window = Window(size=(50, 50), fps=100)
+    window.frame_hooks.append(
+        lambda screen, ticks: ticks < 2 or window.close()
+    )
+    window.open()
+    window.wait_close()
+    assert window.ticks == 3 and not window.initiated
+
+
+class Broken(Component):
+
+    def init(self, surface):
+        raise RuntimeError("broken")
+
+    def update(self, surface, events=None):
+        pass
+
+
+def test_window_thread_start_error(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    window = Window(size=(50, 50))
+    window.components.append(Broken())
+    with pytest.raises(RuntimeError, match="broken"):
+        window.open()
+    assert window.thread is None
+    assert not pg.get_init()  # window ended
+
+
+def test_window_async_start_error(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    window = Window(size=(50, 50))
+    window.components.append(Broken())
+    with pytest.raises(RuntimeError, match="broken"):
+        asyncio.run(window.run())
+    assert not pg.get_init()
+
+
+def test_window_skip_identical(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    window = Window(size=(50, 50), fps=100, skip_identical=True)
+    rect = Rectangle((0, 0), (10, 10), color="red")
+    window.components.append(rect)
+
+    def hook(screen, ticks):
+        assert screen.get_at(rect.cache.center) == (255, 0, 0, 255)
+        if ticks == 2:
+            rect.ref_pos = (20, 20)
+        if ticks == 4:
+            window.close()
+
+    window.frame_hooks.append(hook)
+    run_frames(window)
+    assert window.skipped == 3
+
+
+def test_window_skip_identical_alpha(monkeypatch, tmp_path):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    path = str(tmp_path / "red.png")
+    red = pg.Surface((10, 10))
+    red.fill((255, 0, 0))
+    pg.image.save(red, path)
+
+    window = Window(size=(50, 50), fps=100, skip_identical=True)
+    faded = Image(path, (0, 0), (10, 10))
+    other = Image(path, (20, 0), (10, 10))  # shares surface of faded
+    window.components += [faded, other]
+    colors = []
+
+    def hook(screen, ticks):
+        colors.append((
+            tuple(screen.get_at((5, 5))), tuple(screen.get_at((25, 5)))
+        ))
+        if ticks == 1:
+            faded.alpha = 0
+        if ticks == 3:
+            window.close()
+
+    window.frame_hooks.append(hook)
+    run_frames(window)
+    assert window.skipped == 2  # frames 1 and 3
+    assert colors[0] == ((255, 0, 0, 255), (255, 0, 0, 255))
+    assert colors[2] == ((255, 255, 255, 255), (255, 0, 0, 255))
@@ -1,9 +1,14 @@
 """"Tools to build a window"""
+import asyncio
+import time
+from contextlib import nullcontext
 import pygame as pg
-from olutils import read_params, wait_until
-from threading import Thread
+from olutils import read_params
+from threading import Event, Thread
 
+from oldisplay import draw
 from oldisplay.collections.colors import Color
+from oldisplay.collections.fonts import FontManager
 
 
 
@@ -15,6 +20,7 @@ class WindowSettings:
         'size': (700, 700),
         'fps': 20,
         'background': Color.get('white'),
+        'skip_identical': False,
     }
 
     def __init__(self, **kwargs):
@@ -26,6 +32,8 @@ class WindowSettings:
             fps (int):          number of frags per seconds
             background (color description): color of background
                 @see oldisplay.collections.COLORS for available colors
+            skip_identical (bool): record drawings of each frame and only
+                draw and flip frames that differ from previous one
         """
         params = read_params(kwargs, self.__class__.dft_params)
         for param, value in params.items():
@@ -44,6 +52,8 @@ class WindowSettings:
             self.fps = value
         elif param == "background":
             self.background = Color.get(value)
+        elif param == "skip_identical":
+            self.skip_identical = bool(value)
         else:
             raise ValueError(f"Unknown parameter name '{param}'")
 
@@ -65,9 +75,28 @@ class Window:
 
         self.initiated = False
         self.stop = False
+        self._started = Event()
+        self._start_error = None  # exception raised by start in thread
+
+        # Async run management
+        self.task = None
+        self._frame_waiters = []
 
         # Screen content
         self.components = []
+        self.events = []  # events of last frame
+
+        # Functions called with (screen, ticks) once a frame is drawn
+        self.frame_hooks = []
+
+        # Frame skipping (@see WindowSettings skip_identical)
+        self.display_list = None  # display list of last frame
+        self.digest = None  # digest of display list of last frame
+        self.skipped = 0  # number of frames identical to previous one
+
+        # Diagnostics (@see oldisplay.profiling)
+        self.profiler = None  # FrameProfiler measuring phases of frames
+        self.frame_start = None  # time.perf_counter() at start of last frame
 
     # ----------------------------------------------------------------------- #
     # Properties
@@ -81,25 +110,36 @@ class Window:
     # Display
 
     def open(self):
-        """Open a window"""
+        """Open a window, raise exception of window start if any"""
+        self._started.clear()
+        self._start_error = None
         self.thread = Thread(target=self.refresh)
         self.thread.start()
-        wait_until(lambda: self.initiated)
+        self._started.wait()
+        error, self._start_error = self._start_error, None
+        if error is not None:
+            self.thread.join()
+            self.thread = None
+            raise error
 
     def wait_close(self):
         """Wait for screen to be closed"""
         self.thread.join()
         self.thread = None
 
+    def close(self):
+        """Ask window to close at end of current frame"""
+        self.stop = True
+
     # ----------------------------------------------------------------------- #
     # Refresh management
 
     def clean(self):
         """Clean what is on screen"""
-        self.screen.fill(self.settings.background)
+        draw.fill(self.screen, self.settings.background)
 
-    def refresh(self):
-        """Keep the screen updated"""
+    def start(self):
+        """Build screen and initiate components"""
         if not pg.get_init():
             pg.init()
 
@@ -108,21 +148,169 @@ class Window:
             component.init(self.screen)
         pg.display.set_caption(self.settings.name)
         self.clean()
+        self.stop = False
         self.initiated = True
+        self._started.set()
 
-        self.stop = False
-        while not self.stop:
-            events = []
-            for event in pg.event.get():
-                events.append(event)
-                if event.type == pg.QUIT:
-                    self.stop = True
+    def draw_frame(self, events=None):
+        """Process events, update components and display frame
+
+        Args:
+            events (list): events of frame
+                default is None, events are taken from pygame queue
+        """
+        self.frame_start = time.perf_counter()
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.start_frame()
+        with self.measure("events"):
+            events = pg.event.get() if events is None else events
+        for event in events:
+            if event.type == pg.QUIT:
+                self.stop = True
+        self.events = events
+        if self.settings.skip_identical:
+            changed = self.record_frame(events)
+        else:
+            changed = True
+            self.draw_components(events)
+        with self.measure("hooks"):
+            for hook in self.frame_hooks:
+                hook(self.screen, self.ticks)
+        if changed:
+            with self.measure("flip"):
+                pg.display.flip()  # Update the full display Surface
+        if profiler is not None:
+            profiler.end_frame()
+
+    def measure(self, phase):
+        """Context measuring a phase of frame when profiled (@see profiler)"""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.measure(phase)
+
+    def draw_components(self, events):
+        """Clean screen and update components"""
+        with self.measure("clean"):
             self.clean()
+        if self.profiler is None:
             for component in self.components:
                 component.update(self.screen, events=events)
-            pg.display.flip()  # Update the full display Surface to the screen
-            self.clock.tick(self.settings.fps)
-            self.ticks += 1
+            return
+        for component in self.components:
+            with self.profiler.measure(f"update:{type(component).__name__}"):
+                component.update(self.screen, events=events)
+
+    def record_frame(self, events):
+        """Record drawings of frame, only draw them if frame changed
+
+        Return:
+            (bool): whether frame differs from previous one
+        """
+        with draw.record(self.screen) as display_list:
+            self.draw_components(events)
+        digest, prev = display_list.digest, self.digest
+        self.display_list, self.digest = display_list, digest
+        if digest is not None and digest == prev:
+            self.skipped += 1
+            return False
+        with self.measure("replay"):
+            display_list.replay(self.screen)
+        return True
+
+    def end(self):
+        """Close screen"""
         self.screen = None
+        FontManager.font_cache.clear()  # fonts can't be used after pg.quit
         pg.quit()
         self.initiated = False
+        self._started.clear()
+
+    def refresh(self):
+        """Keep the screen updated"""
+        try:
+            self.start()
+        except BaseException as error:
+            self._start_error = error  # raised by open
+            self.end()
+            return
+        finally:
+            self._started.set()
+        while not self.stop:
+            self.draw_frame()
+            self.clock.tick(self.settings.fps)
+            self.ticks += 1
+        self.end()
+
+    # ----------------------------------------------------------------------- #
+    # Async API
+
+    async def run(self):
+        """Keep the screen updated within running asyncio loop
+
+        About:
+            Frames are drawn by the loop thread: coroutines of the loop can
+            update components between frames (@see next_frame) without locks.
+            The loop is given back while waiting for next frame.
+
+        Examples:
+            >>> async def main():
+            ...     async with Window() as window:
+            ...         while not window.stop:
+            ...             text.string = await fetch()
+            ...             await window.next_frame()
+        """
+        loop = asyncio.get_running_loop()
+        period = 1 / self.settings.fps
+        try:
+            self.start()
+            deadline = loop.time()
+            while not self.stop:
+                self.draw_frame()
+                self.ticks += 1
+                self._notify_frame()
+                deadline += period
+                delay = deadline - loop.time()
+                if delay < 0:
+                    deadline = loop.time()  # late, do not try to catch up
+                    delay = 0
+                await asyncio.sleep(delay)
+        finally:
+            self.end()
+            self._notify_frame()
+
+    def _notify_frame(self):
+        """Wake up coroutines waiting for a frame"""
+        waiters, self._frame_waiters = self._frame_waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(self.ticks)
+
+    def next_frame(self):
+        """Awaitable resolving to ticks once next frame is displayed
+
+        About:
+            Resolves immediately once window is closed
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        if self.stop and not self.initiated:
+            waiter.set_result(self.ticks)
+        else:
+            self._frame_waiters.append(waiter)
+        return waiter
+
+    async def __aenter__(self):
+        """Run window in a task of running loop, once screen is built"""
+        self.task = asyncio.ensure_future(self.run())
+        await asyncio.sleep(0)  # run builds screen before its first await
+        if self.task.done():
+            self.task.result()  # raise error of failed start
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        """Close window and wait for it to end"""
+        self.close()
+        try:
+            await self.task
+        finally:
+            self.task = None
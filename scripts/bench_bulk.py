@@ -0,0 +1,35 @@
+"""Compare building many ActiveRectangle one by one and with create_many"""
+from timeit import timeit
+
+import numpy as np
+
+from oldisplay.components import ActiveRectangle, create_many
+
+N = 50_000
+COLORS = [('red', 'orange', 'green'), ('blue', 'purple', 'green')]
+
+
+def per_instance(positions, colors):
+    return [
+        ActiveRectangle(
+            tuple(position), (8, 8), color=color, outline='black', width=1,
+        )
+        for position, color in zip(positions.tolist(), colors)
+    ]
+
+
+def bulk(positions, colors):
+    return create_many(
+        ActiveRectangle, positions, (8, 8),
+        color=colors, outline='black', width=1,
+    )
+
+
+if __name__ == "__main__":
+    side = int(np.ceil(np.sqrt(N)))
+    positions = np.stack(np.divmod(np.arange(N), side), axis=1) * 10
+    colors = [COLORS[i % 2] for i in range(N)]
+
+    for func in [per_instance, bulk]:
+        duration = timeit(lambda: func(positions, colors), number=3) / 3
+        print(f"{func.__name__:<15}{N} components in {duration:.3f}s")
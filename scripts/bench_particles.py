@@ -0,0 +1,33 @@
+"""Measure update and display of many particles"""
+from timeit import timeit
+
+import numpy as np
+import pygame as pg
+
+from oldisplay.components import ParticleSystem
+
+N = 100_000
+SIZE = (800, 600)
+
+
+def frame(particles, surface):
+    particles.step(1 / 60)
+    surface.fill((255, 255, 255))
+    particles.display(surface, **particles.params)
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    surface = pg.Surface(SIZE)
+    for radius in [0, 1]:
+        particles = ParticleSystem((0, 0), SIZE, N, radius=radius)
+        particles.spawn(
+            rng.uniform((0, 0), SIZE, (N, 2)),
+            vel=rng.normal(0, 20, (N, 2)),
+            color=rng.integers(0, 4, (N, 3)) * 60,
+        )
+        duration = timeit(lambda: frame(particles, surface), number=20) / 20
+        print(
+            f"radius={radius}  {len(particles)} particles"
+            f" in {1000 * duration:.1f}ms per frame"
+        )
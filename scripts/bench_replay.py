@@ -0,0 +1,63 @@
+"""Replay a hover sweep and click storm over a dense grid of buttons
+
+Usage:
+    python scripts/bench_replay.py [recording]
+    a synthetic recording is generated when none is given
+"""
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pygame as pg
+
+from oldisplay import Window, inputs
+from oldisplay.components import ActiveRectangle, create_many
+
+SIZE = (800, 600)
+STEP = 8
+FRAMES = 600
+
+
+def build_window():
+    """Window with a dense grid of buttons"""
+    xs, ys = np.meshgrid(
+        np.arange(0, SIZE[0], STEP), np.arange(0, SIZE[1], STEP)
+    )
+    positions = np.column_stack([xs.ravel(), ys.ravel()])
+    window = Window(size=SIZE)
+    window.components = create_many(
+        ActiveRectangle, positions, (STEP - 1, STEP - 1),
+        color=('white', 'orange', 'red'),
+    )
+    return window
+
+
+def synthetic_recording(path):
+    """Record a diagonal hover sweep with a click every 5 frames"""
+    recorder = inputs.EventRecorder(path)
+    recorder.start(SIZE)
+    for frame in range(FRAMES):
+        t = frame / FRAMES
+        pos = (int(t * SIZE[0]), int(abs(np.sin(8 * t)) * (SIZE[1] - 1)))
+        events = [] if frame % 5 else [
+            pg.event.Event(pg.MOUSEBUTTONDOWN, button=1, pos=pos),
+            pg.event.Event(pg.MOUSEBUTTONUP, button=1, pos=pos),
+        ]
+        recorder.capture(frame, events, pos)
+    recorder.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+    else:
+        path = os.path.join(tempfile.mkdtemp(), "sweep.ole")
+        synthetic_recording(path)
+
+    window = build_window()
+    report = inputs.replay(path, window)
+    print(f"{len(window.components)} components, {report['frames']} frames")
+    for key in ['mean', 'p50', 'p95', 'p99', 'max']:
+        print(f"{key:<6}{1000 * report[key]:.2f}ms")
+    print(f"fps   {report['fps']:.1f}")